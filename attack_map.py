@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+
+"""
+File Name:      attack_map.py
+Author:         agent
+Date:           October 19th, 2026
+
+Description:    Python file with attack maps for agents. An AttackMap keeps the attack bitboard of every piece of one
+                (belief) board, read from precomputed attack tables, and updates only the pieces a change can affect,
+                so the king-capture and king-safety questions every choose_move asks are a few bitboard operations.
+                Attacks follow the Recon rules: pieces attack through check, pawns only attack diagonally and castling
+                never captures, so a piece attacking the opponent king square can capture the king and win the game
+                (Game.get_winner).
+"""
+
+import chess
+
+# precomputed attack tables by square
+PAWN_ATTACKS = chess.BB_PAWN_ATTACKS        # [color][square]
+KNIGHT_ATTACKS = chess.BB_KNIGHT_ATTACKS
+KING_ATTACKS = chess.BB_KING_ATTACKS
+
+
+def _diagonal_attacks(square, occupied):
+    return chess.BB_DIAG_ATTACKS[square][chess.BB_DIAG_MASKS[square] & occupied]
+
+
+def _straight_attacks(square, occupied):
+    return (chess.BB_RANK_ATTACKS[square][chess.BB_RANK_MASKS[square] & occupied] |
+            chess.BB_FILE_ATTACKS[square][chess.BB_FILE_MASKS[square] & occupied])
+
+
+def attacks_from(piece, square, occupied):
+    """
+    :param piece: chess.Piece -- the attacking piece
+    :param square: chess.SQUARE -- the square of the piece
+    :param occupied: int -- bitboard of all pieces on the board
+    :return: int -- bitboard of the squares the piece attacks, including squares of its own pieces
+    """
+    if piece.piece_type == chess.PAWN:
+        return PAWN_ATTACKS[piece.color][square]
+    if piece.piece_type == chess.KNIGHT:
+        return KNIGHT_ATTACKS[square]
+    if piece.piece_type == chess.KING:
+        return KING_ATTACKS[square]
+    attacks = 0
+    if piece.piece_type in (chess.BISHOP, chess.QUEEN):
+        attacks |= _diagonal_attacks(square, occupied)
+    if piece.piece_type in (chess.ROOK, chess.QUEEN):
+        attacks |= _straight_attacks(square, occupied)
+    return attacks
+
+
+class AttackMap(object):
+    """
+    Attack bitboards of one board. Change the board only through set_piece_at, remove_piece_at, push and
+    apply_sense_result so the attacks stay up to date.
+    """
+
+    def __init__(self, board):
+        """
+        :param board: chess.BaseBoard -- the board to follow, e.g. a belief board of an agent. It is copied.
+        """
+        self.board = chess.BaseBoard(board.board_fen())
+        self.attacks = [0] * 64                 # attack bitboard of the piece on every square, 0 if empty
+        for square, piece in self.board.piece_map().items():
+            self.attacks[square] = attacks_from(piece, square, self.board.occupied)
+        self._side_attacks = [None, None]       # cached union of the attacks of each color, by color
+
+    ###=== Incremental updates ===###
+    def _sliders_through(self, square):
+        # sliders whose rays reach square, their attacks change when its occupancy does
+        occupied = self.board.occupied
+        queens = self.board.queens
+        return ((_diagonal_attacks(square, occupied) & (self.board.bishops | queens)) |
+                (_straight_attacks(square, occupied) & (self.board.rooks | queens)))
+
+    def _update(self, square, piece):
+        """
+        Sets or clears one square and recomputes the attacks of that square and of the sliders that see it.
+        """
+        sliders = self._sliders_through(square)
+        if piece is None:
+            self.board.remove_piece_at(square)
+        else:
+            self.board.set_piece_at(square, piece)
+        sliders |= self._sliders_through(square)
+
+        occupied = self.board.occupied
+        self.attacks[square] = 0 if piece is None else attacks_from(piece, square, occupied)
+        for slider in chess.SquareSet(sliders & ~chess.BB_SQUARES[square]):
+            self.attacks[slider] = attacks_from(self.board.piece_at(slider), slider, occupied)
+        self._side_attacks = [None, None]
+
+    def set_piece_at(self, square, piece):
+        self._update(square, piece)
+
+    def remove_piece_at(self, square):
+        if self.board.piece_at(square) is not None:
+            self._update(square, None)
+
+    def push(self, move):
+        """
+        Plays a move of either color the way the Recon rules take it, a captured piece is removed. A null move or None
+        is a pass and changes nothing.
+
+        :param move: chess.Move -- a taken move
+        """
+        if not move:
+            return
+        piece = self.board.piece_at(move.from_square)
+        if piece is None:
+            return
+        to_piece = chess.Piece(move.promotion, piece.color) if move.promotion else piece
+
+        # en passant captures the pawn behind the target square
+        if (piece.piece_type == chess.PAWN and self.board.piece_at(move.to_square) is None and
+                chess.square_file(move.from_square) != chess.square_file(move.to_square)):
+            self.remove_piece_at(chess.square(chess.square_file(move.to_square), chess.square_rank(move.from_square)))
+
+        self.remove_piece_at(move.from_square)
+        self.set_piece_at(move.to_square, to_piece)
+
+        # castling also moves the rook
+        if piece.piece_type == chess.KING and chess.square_distance(move.from_square, move.to_square) > 1:
+            rank = chess.square_rank(move.from_square)
+            kingside = chess.square_file(move.to_square) > chess.square_file(move.from_square)
+            rook_from = chess.square(7 if kingside else 0, rank)
+            self.remove_piece_at(rook_from)
+            self.set_piece_at(chess.square(5 if kingside else 3, rank), chess.Piece(chess.ROOK, piece.color))
+
+    def apply_sense_result(self, sense_result):
+        """
+        :param sense_result: List((chess.SQUARE, chess.Piece)) -- a sense result, its squares are set as sensed
+        """
+        for square, piece in sense_result:
+            if piece != self.board.piece_at(square):
+                self._update(square, piece)
+
+    ###=== Queries ===###
+    def side_attacks(self, color):
+        """
+        :return: int -- bitboard of every square a piece of color attacks
+        """
+        if self._side_attacks[color] is None:
+            attacks = 0
+            for square in chess.SquareSet(self.board.occupied_co[color]):
+                attacks |= self.attacks[square]
+            self._side_attacks[color] = attacks
+        return self._side_attacks[color]
+
+    def attackers(self, color, square):
+        """
+        :return: chess.SquareSet -- the squares of the pieces of color that attack square
+        """
+        bit = chess.BB_SQUARES[square]
+        return chess.SquareSet(sum(chess.BB_SQUARES[attacker] for attacker in
+                                   chess.SquareSet(self.board.occupied_co[color]) if self.attacks[attacker] & bit))
+
+    def is_attacked(self, color, square):
+        return bool(self.side_attacks(color) & chess.BB_SQUARES[square])
+
+    def king_attackers(self, color):
+        """
+        :return: chess.SquareSet -- the squares of the opponent pieces attacking the king of color, empty if the king
+                 is not on the board
+        """
+        king = self.board.king(color)
+        return chess.SquareSet() if king is None else self.attackers(not color, king)
+
+    def king_captures(self, color):
+        """
+        :return: List(chess.Move) -- the moves of color that capture the opponent king. They are in the possible_moves
+                 of a player whose board matches this one, pawn captures onto the back rank included.
+        """
+        king = self.board.king(not color)
+        if king is None:
+            return []
+        return [chess.Move(attacker, king) for attacker in self.attackers(color, king)]
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+
+"""
+File Name:      belief_tracker.py
+Author:         agent
+Date:           October 19th, 2026
+
+Description:    Python file with a particle filter over the hidden opponent pieces. The belief is a fixed number of
+                weighted particles, each one six bitboards of opponent pieces in a NumPy uint64 array, so memory and
+                time per turn stay bounded however uncertain the game gets. Sense and move results reweight all
+                particles at once with bitwise operations on the arrays.
+"""
+
+import numpy as np
+import chess
+from game import Game, recon_moves, recon_push
+from attack_map import AttackMap
+
+PIECE_TYPES = [chess.PAWN, chess.KNIGHT, chess.BISHOP, chess.ROOK, chess.QUEEN, chess.KING]
+
+
+def _bb(squares):
+    # bitboard of the given squares as a numpy scalar
+    return np.uint64(sum(chess.BB_SQUARES[square] for square in squares))
+
+
+class BeliefTracker(object):
+    """
+    Tracks the opponent pieces of one player. Call the handle_* methods from the matching Player callbacks; the
+    belief can be read with piece_probabilities, most_likely_boards and sample_boards.
+    """
+
+    def __init__(self, num_particles=500, resample_threshold=0.5, mismatch_weight=1e-3, seed=None):
+        """
+        :param num_particles: int -- the number of particles, fixed for the whole game
+        :param resample_threshold: float -- resample when the effective sample size drops below this share of
+                                   num_particles
+        :param mismatch_weight: float -- likelihood of an observation a particle contradicts, above zero so the filter
+                                can recover from a wrong belief
+        :param seed: int -- seed of the random number generator
+        """
+        self.num_particles = num_particles
+        self.resample_threshold = resample_threshold
+        self.mismatch_weight = mismatch_weight
+        self.rng = np.random.RandomState(seed)
+        self.rules = Game()
+
+        self.color = chess.WHITE
+        self.own_board = chess.Board.empty()
+        self.particles = np.zeros((num_particles, 6), dtype=np.uint64)  # opponent pieces by piece type
+        self.weights = np.full(num_particles, 1.0 / num_particles)
+        self.turns = 0
+
+    ###=== Player callbacks ===###
+    def handle_game_start(self, color, board):
+        """
+        :param color: chess.BLACK or chess.WHITE -- your color assignment for the game
+        :param board: chess.Board -- initial board state
+        """
+        self.color = color
+        self.own_board = chess.Board.empty()
+        for square, piece in board.piece_map().items():
+            if piece.color == color:
+                self.own_board.set_piece_at(square, piece)
+        self.own_board.castling_rights = board.castling_rights & board.occupied_co[color]
+        self.particles[:] = [np.uint64(board.pieces_mask(piece_type, not color)) for piece_type in PIECE_TYPES]
+        self.weights[:] = 1.0 / self.num_particles
+        self.turns = 0
+
+    def handle_opponent_move_result(self, captured_piece, captured_square):
+        """
+        Moves every particle by one opponent move that is consistent with the capture observation, chosen at random
+        among the moves the Recon rules offer on that particle.
+
+        :param captured_piece: bool - true if your opponents captured your piece with their last move
+        :param captured_square: chess.Square - position where your piece was captured
+        """
+        self.turns += 1
+        if self.color == chess.WHITE and self.turns == 1:
+            return  # the opponent has not moved yet
+        observed_square = captured_square if captured_piece else None
+
+        # identical particles share one move generation
+        unique, inverse = np.unique(self.particles, axis=0, return_inverse=True)
+        likelihood = np.empty(len(unique))
+        outcomes = []
+        for i, particle in enumerate(unique):
+            results = self._opponent_move_results(particle)
+            consistent = [bitboards for capture_square, bitboards in results if capture_square == observed_square]
+            likelihood[i] = len(consistent) / len(results) if consistent else self.mismatch_weight
+            outcomes.append(consistent or [particle])
+
+        inverse = inverse.reshape(-1)
+        for particle_index in range(self.num_particles):
+            choices = outcomes[inverse[particle_index]]
+            self.particles[particle_index] = choices[self.rng.randint(len(choices))]
+        self._reweight(likelihood[inverse])
+
+        if captured_piece:
+            self.own_board.remove_piece_at(captured_square)
+
+    def handle_sense_result(self, sense_result):
+        """
+        :param sense_result: List((chess.SQUARE, chess.Piece)) -- the result of the sense
+        """
+        if not sense_result:
+            return
+        window = _bb(square for square, _ in sense_result)
+        observed = np.zeros(6, dtype=np.uint64)
+        for square, piece in sense_result:
+            if piece is not None and piece.color != self.color:
+                observed[piece.piece_type - 1] |= np.uint64(chess.BB_SQUARES[square])
+
+        matches = ((self.particles & window) == observed).all(axis=1)
+        if not matches.any():
+            # no particle explains the sense, so all of them are repaired to agree with it
+            self.particles &= ~window
+            self.particles |= observed
+            if observed[chess.KING - 1]:
+                self.particles[:, chess.KING - 1] = observed[chess.KING - 1]
+            self.weights[:] = 1.0 / self.num_particles
+            return
+        self._reweight(np.where(matches, 1.0, self.mismatch_weight))
+
+    def handle_move_result(self, requested_move, taken_move, reason, captured_piece, captured_square):
+        """
+        :param requested_move: chess.Move -- the move you intended to make
+        :param taken_move: chess.Move -- the move that was actually made
+        :param reason: String -- description of the result from trying to make requested_move
+        :param captured_piece: bool -- true if you captured your opponents piece
+        :param captured_square: chess.Square -- position where you captured the piece
+        """
+        occupied = np.bitwise_or.reduce(self.particles, axis=1)
+        consistent = np.ones(self.num_particles, dtype=bool)
+
+        if taken_move is not None:
+            # the path of the taken move was free of opponent pieces
+            path = _bb(chess.SquareSet(chess.BB_BETWEEN[taken_move.from_square][taken_move.to_square]))
+            consistent &= (occupied & path) == 0
+            if not captured_piece:
+                consistent &= (occupied & _bb([taken_move.to_square])) == 0
+        elif requested_move is not None:
+            piece = self.own_board.piece_at(requested_move.from_square)
+            if piece is not None and piece.piece_type == chess.PAWN:
+                target = _bb([requested_move.to_square])
+                if chess.square_file(requested_move.from_square) != chess.square_file(requested_move.to_square):
+                    consistent &= (occupied & target) == 0   # a diagonal onto an empty square is not taken
+                else:
+                    path = _bb(chess.SquareSet(chess.BB_BETWEEN[requested_move.from_square][requested_move.to_square]))
+                    consistent &= (occupied & (path | target)) != 0    # a forward move is blocked by a piece
+
+        if captured_piece:
+            consistent &= (occupied & _bb([captured_square])) != 0
+            self.particles &= ~_bb([captured_square])
+
+        if taken_move is not None:
+            self.own_board.turn = self.color
+            self.own_board.push(taken_move)
+            # particles that contradicted the move must not hide pieces under the own pieces
+            self.particles &= ~np.uint64(self.own_board.occupied_co[self.color])
+        self._reweight(np.where(consistent, 1.0, self.mismatch_weight))
+
+    ###=== Belief queries ===###
+    def effective_sample_size(self):
+        return 1.0 / np.sum(self.weights ** 2)
+
+    def piece_probabilities(self):
+        """
+        :return: numpy.ndarray -- array of shape (6, 64), the probability of an opponent pawn to king on every
+                 python-chess square
+        """
+        bits = np.unpackbits(self.particles.astype('<u8').view(np.uint8).reshape(self.num_particles, 6, 8),
+                             axis=2, bitorder='little')
+        return np.tensordot(self.weights, bits, axes=1)
+
+    def most_likely_boards(self, k=1):
+        """
+        :return: List((chess.Board, float)) -- the k distinct particles with the highest total weight, with the own
+                 pieces and the opponent to move after the own turn
+        """
+        unique, inverse = np.unique(self.particles, axis=0, return_inverse=True)
+        totals = np.bincount(inverse.reshape(-1), weights=self.weights, minlength=len(unique))
+        best = np.argsort(-totals)[:k]
+        return [(self.board(unique[i]), float(totals[i])) for i in best]
+
+    def attack_maps(self, k=1):
+        """
+        :return: List((AttackMap, float)) -- attack maps of the k most likely boards with their weights
+        """
+        return [(AttackMap(board), weight) for board, weight in self.most_likely_boards(k)]
+
+    def sample_boards(self, k):
+        """
+        :return: List(chess.Board) -- k particles drawn by weight
+        """
+        indices = self.rng.choice(self.num_particles, size=k, p=self.weights)
+        return [self.board(self.particles[i]) for i in indices]
+
+    def board(self, particle, turn=None):
+        """
+        :param particle: numpy.ndarray -- six bitboards of opponent pieces
+        :param turn: chess.WHITE/chess.BLACK -- the side to move, the own color if None
+        :return: chess.Board -- the own pieces together with the opponent pieces of the particle
+        """
+        board = self.own_board.copy(stack=False)
+        opponent = not self.color
+        for piece_type, bitboard in zip(PIECE_TYPES, particle):
+            for square in chess.SquareSet(int(bitboard)):
+                board.set_piece_at(square, chess.Piece(piece_type, opponent))
+        # the opponent keeps the castling rights its rooks and king could still have
+        board.castling_rights |= board.rooks & board.occupied_co[opponent] & chess.BB_CORNERS
+        board.castling_rights = board.clean_castling_rights()
+        board.turn = self.color if turn is None else turn
+        return board
+
+    ###=== Filter steps ===###
+    def _opponent_move_results(self, particle):
+        """
+        :return: List((chess.SQUARE, numpy.ndarray)) -- the capture square and the resulting opponent bitboards of
+                 every move the opponent could request on the particle, including a pass
+        """
+        board = self.board(particle, turn=not self.color)
+        results = [(None, particle)]
+        for move in recon_moves(self.rules, board):
+            taken_move, capture_square = recon_push(self.rules, board, move)
+            if taken_move is None:
+                results.append((None, particle))
+            else:
+                results.append((capture_square, np.array([board.pieces_mask(piece_type, not self.color)
+                                                          for piece_type in PIECE_TYPES], dtype=np.uint64)))
+            board.pop()
+        return results
+
+    def _reweight(self, likelihood):
+        self.weights *= likelihood
+        self.weights /= self.weights.sum()
+        if self.effective_sample_size() < self.resample_threshold * self.num_particles:
+            # systematic resampling
+            positions = (self.rng.random_sample() + np.arange(self.num_particles)) / self.num_particles
+            indices = np.minimum(np.searchsorted(np.cumsum(self.weights), positions), self.num_particles - 1)
+            self.particles = self.particles[indices]
+            self.weights[:] = 1.0 / self.num_particles
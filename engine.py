@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+
+"""
+File Name:      engine.py
+Author:         agent
+Date:           October 19th, 2026
+
+Description:    Python file with the rules-engine interface for recon chess. An engine owns the truth board and
+                implements the Recon rules: move generation without regard to opponent pieces, move revision
+                (sliding, passes), capture squares, senses and king capture. PythonChessEngine drives the rule
+                helpers of game.py on a bare board for search tools, GameEngine adapts the Game classes, so the
+                root and tournament Game classes can be checked against each other.
+"""
+
+import chess
+from game import Game
+
+
+class ReconEngine(object):
+    """
+    The interface every rules-engine backend implements. All moves and squares are python-chess values so that
+    backends with a different internal representation can be compared directly.
+    """
+
+    def reset(self, fen=chess.STARTING_FEN):
+        """
+        Sets up the truth board.
+
+        :param fen: str -- the position to start from
+        """
+        raise NotImplementedError
+
+    @property
+    def turn(self):
+        """
+        :return: chess.WHITE/chess.BLACK -- the color to move
+        """
+        raise NotImplementedError
+
+    def fen(self):
+        """
+        :return: str -- FEN of the truth board. It keeps the en passant square after every pawn double step, because
+                 Recon allows en passant captures that standard chess rejects, e.g. while in check.
+        """
+        raise NotImplementedError
+
+    def moves(self):
+        """
+        :return: List(chess.Move) -- the moves offered to the color to move, like Game.get_moves
+        """
+        raise NotImplementedError
+
+    def sense(self, square):
+        """
+        :param square: chess.SQUARE -- the center of the sense
+        :return: List((chess.SQUARE, chess.Piece)) -- the 3x3 sense result, like Game.handle_sense
+        """
+        raise NotImplementedError
+
+    def play(self, requested_move):
+        """
+        Plays a requested move for the color to move and passes the turn to the opponent.
+
+        :param requested_move: chess.Move -- the requested move, None to pass
+        :return: chess.Move, chess.SQUARE -- the move actually taken (None for a pass) and the capture square (None
+                 if nothing was captured)
+        """
+        raise NotImplementedError
+
+    def winner(self):
+        """
+        :return: chess.WHITE/chess.BLACK -- the color that captured the opposing king
+                 None -- if both kings are still on the board
+        """
+        raise NotImplementedError
+
+
+class PythonChessEngine(ReconEngine):
+    """
+    Backend that plays on a bare python-chess board with the rule helpers of Game (game.py), without its clocks and
+    player boards. The rules live only in Game, this class just drives them; the fuzzer checks it against the Game
+    classes themselves.
+    """
+
+    def __init__(self, fen=chess.STARTING_FEN):
+        self.rules = Game()
+        self.board = None
+        self.reset(fen)
+
+    def reset(self, fen=chess.STARTING_FEN):
+        self.board = chess.Board(fen)
+        self.rules.truth_board = self.board
+
+    @property
+    def turn(self):
+        return self.board.turn
+
+    def fen(self):
+        return self.board.fen(en_passant='fen')
+
+    def moves(self):
+        return (self.rules._moves_without_opponent_pieces(self.board, self.board.turn) +
+                self.rules._pawn_capture_moves_on(self.board, self.board.turn))
+
+    def play(self, requested_move):
+        taken_move = None
+        if requested_move is not None and requested_move in self.moves():
+            taken_move = self.rules._revise_move(self.rules._add_pawn_queen_promotion(requested_move))
+
+        capture_square = self.rules._capture_square_of_move(self.board, taken_move)
+        self.board.push(taken_move if taken_move is not None else chess.Move.null())
+        return taken_move, capture_square
+
+    def sense(self, square):
+        self.rules.turn = self.board.turn
+        return self.rules.handle_sense(square)
+
+    def winner(self):
+        if self.board.king(chess.WHITE) is None:
+            return chess.BLACK
+        if self.board.king(chess.BLACK) is None:
+            return chess.WHITE
+        return None
+
+
+class GameEngine(ReconEngine):
+    """
+    Adapts a Game class (game.py or tournament_classes/game.py) to the engine interface.
+    """
+
+    def __init__(self, game_class, board_attribute='truth_board', fen=chess.STARTING_FEN):
+        """
+        :param game_class: class -- the Game class to adapt
+        :param board_attribute: str -- name of the Game attribute holding the truth board
+        :param fen: str -- the position to start from
+        """
+        self.game_class = game_class
+        self.board_attribute = board_attribute
+        self.game = None
+        self.reset(fen)
+
+    @property
+    def board(self):
+        return getattr(self.game, self.board_attribute)
+
+    def reset(self, fen=chess.STARTING_FEN):
+        self.game = self.game_class()
+        self.board.set_fen(fen)
+        self.game.turn = self.board.turn
+
+    @property
+    def turn(self):
+        return self.game.turn
+
+    def fen(self):
+        return self.board.fen(en_passant='fen')
+
+    def moves(self):
+        return self.game.get_moves()
+
+    def sense(self, square):
+        return self.game.handle_sense(square)
+
+    def play(self, requested_move):
+        _, taken_move, capture_square, _ = self.game.handle_move(requested_move)
+
+        # only the rules are compared, so the clock handling of end_turn is skipped
+        self.game.turn = not self.game.turn
+        return taken_move, capture_square
+
+    def winner(self):
+        if self.board.king(chess.WHITE) is None:
+            return chess.BLACK
+        if self.board.king(chess.BLACK) is None:
+            return chess.WHITE
+        return None
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+
+"""
+File Name:      fuzz_engine.py
+Author:         agent
+Date:           October 19th, 2026
+
+Description:    Python file used to check rules-engine backends against each other. Random recon chess games are
+                played through two backends at once and the move lists, taken moves, capture squares, sense results,
+                truth boards and winners are compared after every ply.
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+import importlib
+import importlib.util
+import chess
+from multiprocessing import Pool
+from engine import PythonChessEngine, GameEngine
+
+
+def _load_module(name, path):
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def make_engine(backend):
+    """
+    :param backend: str -- 'reference', 'game' (game.py), 'tournament' (tournament_classes/game.py) or
+                    'module:Class' for any other ReconEngine subclass
+    :return: ReconEngine -- a new engine of that backend
+    """
+    if backend == 'reference':
+        return PythonChessEngine()
+    if backend == 'game':
+        from game import Game
+        return GameEngine(Game)
+    if backend == 'tournament':
+        # the tournament copy shares its module name with game.py, so it is loaded under its own name
+        path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tournament_classes', 'game.py')
+        return GameEngine(_load_module('tournament_game', path).Game, board_attribute='board_is_real')
+
+    module_name, class_name = backend.split(':')
+    return getattr(importlib.import_module(module_name), class_name)()
+
+
+class Mismatch(Exception):
+    pass
+
+
+def _check(what, fen, first, second):
+    if first != second:
+        raise Mismatch("{} differ on {}\n    first:  {}\n    second: {}".format(what, fen, first, second))
+
+
+def _random_request(rng, moves, board):
+    """
+    Picks the move a random agent would request. Mostly moves from the offered list, sometimes a pass or a move that
+    is not offered, so the illegal move paths are exercised as well.
+    """
+    roll = rng.random()
+    if roll < 0.02:
+        return None
+    if roll < 0.1:
+        own_squares = list(chess.SquareSet(board.occupied_co[board.turn]))
+        return chess.Move(rng.choice(own_squares), rng.choice(chess.SQUARES))
+    return rng.choice(moves)
+
+
+def fuzz(first_backend, second_backend, plies, seed, max_game_plies=300):
+    """
+    Plays random games through two backends until the given number of plies has been compared.
+
+    :param first_backend: str -- the first backend, see make_engine
+    :param second_backend: str -- the second backend, see make_engine
+    :param plies: int -- the number of plies to compare
+    :param seed: int -- seed of the random games
+    :param max_game_plies: int -- games are restarted after this many plies
+
+    :return: int, int -- the number of plies and games compared
+    :raises Mismatch: with a description of the first difference found
+    """
+    rng = random.Random(seed)
+    first, second = make_engine(first_backend), make_engine(second_backend)
+    played, games = 0, 0
+    while played < plies:
+        first.reset()
+        second.reset()
+        games += 1
+        for _ in range(max_game_plies):
+            fen = first.fen()
+            _check('truth boards', fen, fen, second.fen())
+            _check('winners', fen, first.winner(), second.winner())
+            if first.winner() is not None or played >= plies:
+                break
+
+            moves = first.moves()
+            _check('move lists', fen, sorted(m.uci() for m in moves), sorted(m.uci() for m in second.moves()))
+
+            square = rng.choice(chess.SQUARES)
+            _check('sense results at {}'.format(chess.SQUARE_NAMES[square]), fen, first.sense(square),
+                   second.sense(square))
+
+            request = _random_request(rng, moves, chess.Board(fen))
+            _check('results of {}'.format(request), fen, first.play(request), second.play(request))
+            played += 1
+    return played, games
+
+
+def _fuzz_worker(arguments):
+    try:
+        return fuzz(*arguments), None
+    except Mismatch as e:
+        return (0, 0), str(e)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Differential fuzzer for recon chess rules-engine backends.')
+    parser.add_argument('first', nargs='?', default='reference',
+                        help="First backend: reference, game, tournament or module:Class.")
+    parser.add_argument('second', nargs='?', default='tournament',
+                        help="Second backend: reference, game, tournament or module:Class. The reference backend "
+                             "runs the rule helpers of game.py, so the default compares the two Game copies.")
+    parser.add_argument('--plies', type=int, default=100000, help='Number of plies to compare.')
+    parser.add_argument('--seed', type=int, default=0, help='Seed of the random games.')
+    parser.add_argument('--workers', type=int, default=1, help='Number of processes to fuzz with.')
+    args = parser.parse_args()
+
+    start = time.time()
+    chunk = -(-args.plies // args.workers)
+    jobs = [(args.first, args.second, chunk, args.seed + i) for i in range(args.workers)]
+    with Pool(args.workers) as pool:
+        results = pool.map(_fuzz_worker, jobs)
+
+    total_plies = sum(played for (played, _), _ in results)
+    total_games = sum(games for (_, games), _ in results)
+    errors = [error for _, error in results if error is not None]
+    for error in errors:
+        print(error)
+
+    elapsed = time.time() - start
+    print("{} vs {}: {} plies in {} games, {:.0f} plies/s -- {}".format(
+        args.first, args.second, total_plies, total_games, total_plies / max(elapsed, 1e-9),
+        "MISMATCH" if errors else "OK"))
+    sys.exit(1 if errors else 0)
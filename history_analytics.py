@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+
+"""
+File Name:      history_analytics.py
+Author:         agent
+Date:           October 19th, 2026
+
+Description:    Python file used to compute statistics over a database written by history_parser.py. The plies are
+                loaded once into a columnar table of NumPy arrays and every statistic is computed for all groups at
+                once with bincounts, without looping over games in Python.
+"""
+
+import sqlite3
+import argparse
+import numpy as np
+import chess
+
+NONE = -1   # stored for NULL squares, moves and pieces
+
+PIECE_VALUES = np.array([0, 1, 3, 3, 5, 9, 0])     # by piece type, the king is not counted as material
+GROUP_KEYS = ('agent', 'color', 'opponent')
+
+# SENSE_WINDOWS[center, square] is True if a sense at center reveals square, see Game.handle_sense
+SENSE_WINDOWS = np.array([[chess.square_distance(center, square) <= 1 for square in chess.SQUARES]
+                          for center in chess.SQUARES])
+
+
+def _board_colors(board_fens):
+    """
+    :param board_fens: numpy.ndarray -- board_fen strings
+    :return: numpy.ndarray -- int8 array of shape (len(board_fens), 64) indexed by python-chess square, 1 for a
+             WHITE piece, 0 for a BLACK piece and NONE for an empty square
+    """
+    unique, inverse = np.unique(board_fens, return_inverse=True)
+    colors = np.full((len(unique), 64), NONE, dtype=np.int8)
+    for i, fen in enumerate(unique):
+        if fen:
+            board = chess.BaseBoard(fen)
+            for color in chess.COLORS:
+                colors[i, list(chess.SquareSet(board.occupied_co[color]))] = int(color)
+    return colors[inverse]
+
+
+class PlyTable(object):
+    """
+    The plies of a history database as columns. agent and opponent index into names.
+    """
+
+    def __init__(self, database):
+        connection = sqlite3.connect(database)
+        rows = connection.execute(
+            'SELECT p.game_id, p.ply, p.color, p.sense, p.requested, p.taken, p.captured_piece, p.board, '
+            'g.white, g.black FROM plies p JOIN games g ON g.id = p.game_id ORDER BY p.game_id, p.ply').fetchall()
+        connection.close()
+
+        columns = list(zip(*rows)) if rows else [()] * 10
+        self.game_id = np.array(columns[0], dtype=np.int64)
+        self.ply = np.array(columns[1], dtype=np.int32)
+        self.color = np.array(columns[2], dtype=np.int8)
+        self.sense = np.array([NONE if s is None else s for s in columns[3]], dtype=np.int16)
+        self.requested = np.array([NONE if m is None else m for m in columns[4]], dtype=np.int32)
+        self.taken = np.array([NONE if m is None else m for m in columns[5]], dtype=np.int32)
+        self.captured = np.array([NONE if p is None else chess.Piece.from_symbol(p).piece_type
+                                  for p in columns[6]], dtype=np.int8)
+        self.board = np.array([b or '' for b in columns[7]])
+
+        white, black = np.array(columns[8], dtype=object), np.array(columns[9], dtype=object)
+        self.names, codes = np.unique(np.concatenate([white, black]).astype(str), return_inverse=True)
+        white_code, black_code = codes[:len(white)], codes[len(white):]
+        self.agent = np.where(self.color == 1, white_code, black_code)
+        self.opponent = np.where(self.color == 1, black_code, white_code)
+
+    def __len__(self):
+        return len(self.ply)
+
+
+def _groups(table, by):
+    """
+    :return: numpy.ndarray, numpy.ndarray -- the key columns of every group and the group index of every ply
+    """
+    if not by:
+        return np.zeros((1, 0), dtype=np.int64), np.zeros(len(table), dtype=np.int64)
+    keys = np.stack([getattr(table, key).astype(np.int64) for key in by], axis=1)
+    return np.unique(keys, axis=0, return_inverse=True)
+
+
+def _rate(counts, totals):
+    return np.divide(counts, totals, out=np.full(len(totals), np.nan), where=totals > 0)
+
+
+def summarize(table, by=GROUP_KEYS):
+    """
+    Computes the statistics of every group of plies.
+
+    :param table: PlyTable -- the plies
+    :param by: tuple(str) -- the columns to group by, any of 'agent', 'color' and 'opponent'
+
+    :return: List(dict) -- one row of statistics per group
+    """
+    keys, group = _groups(table, by)
+    group = group.reshape(-1)
+    num_groups = len(keys)
+
+    def count(mask):
+        return np.bincount(group[mask], minlength=num_groups)
+
+    plies = count(np.ones(len(table), dtype=bool))
+    requested = table.requested != NONE
+    taken = table.taken != NONE
+    captures = table.captured != NONE
+    king_captures = table.captured == chess.KING
+
+    # material each color of a game won, what an agent lost is what its opponent won in the same game
+    material = PIECE_VALUES[np.maximum(table.captured, 0)] * captures
+    side = table.game_id * 2 + table.color
+    won_by_side = np.bincount(side, weights=material, minlength=int(side.max(initial=0)) + 2)
+    _, first_of_side = np.unique(side, return_index=True)    # the group is the same on every ply of a side
+    material_won = np.bincount(group, weights=material, minlength=num_groups)
+    material_lost = np.bincount(group[first_of_side], weights=won_by_side[side[first_of_side] ^ 1],
+                                minlength=num_groups)
+
+    # a sense is useful if its window held at least one opponent piece
+    sensed = table.sense != NONE
+    useful = np.zeros(len(table), dtype=bool)
+    if sensed.any():
+        board_colors = _board_colors(table.board[sensed])
+        opponent_pieces = board_colors == (1 - table.color[sensed])[:, None]
+        useful[sensed] = (opponent_pieces & SENSE_WINDOWS[table.sense[sensed]]).any(axis=1)
+
+    king_capture_plies = [np.sort(table.ply[king_captures & (group == g)]) for g in range(num_groups)]
+
+    stats = {
+        'plies': plies,
+        'pass_rate': _rate(count(~requested), plies),
+        'slid_rate': _rate(count(requested & taken & (table.taken != table.requested)), count(requested)),
+        'failed_rate': _rate(count(requested & ~taken), count(requested)),
+        'capture_rate': _rate(count(captures), plies),
+        'material_won': material_won,
+        'material_lost': material_lost,
+        'exchange_ratio': np.divide(material_won, material_lost, out=np.full(num_groups, np.inf),
+                                    where=material_lost > 0),
+        'sense_efficiency': _rate(count(useful), count(sensed)),
+        'king_captures': count(king_captures),
+    }
+
+    results = []
+    for g in range(num_groups):
+        row = {}
+        for key, value in zip(by, keys[g]):
+            row[key] = table.names[value] if key in ('agent', 'opponent') else ('WHITE' if value else 'BLACK')
+        row.update({name: values[g].item() for name, values in stats.items()})
+        row['king_capture_ply_median'] = (float(np.median(king_capture_plies[g])) if len(king_capture_plies[g])
+                                          else np.nan)
+        results.append(row)
+    return results
+
+
+def sense_heatmaps(table, by=('agent',)):
+    """
+    :return: numpy.ndarray, numpy.ndarray -- the key columns of every group and an array of shape (groups, 8, 8)
+             counting how often each square was sensed, indexed by [rank, file]
+    """
+    keys, group = _groups(table, by)
+    group = group.reshape(-1)
+    sensed = table.sense != NONE
+    counts = np.bincount(group[sensed] * 64 + table.sense[sensed], minlength=len(keys) * 64)
+    return keys, counts.reshape(len(keys), 8, 8)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Prints statistics of the games in a history database.')
+    parser.add_argument('database', help='SQLite database written by history_parser.py.')
+    parser.add_argument('--by', default='agent,color,opponent',
+                        help='Comma separated columns to group by: agent, color and/or opponent.')
+    parser.add_argument('--heatmaps', default=None, help='Save the sense heatmaps per agent to this .npy file.')
+    args = parser.parse_args()
+
+    by = tuple(key for key in args.by.split(',') if key)
+    if any(key not in GROUP_KEYS for key in by):
+        parser.error('--by takes agent, color and opponent')
+
+    table = PlyTable(args.database)
+    for row in summarize(table, by):
+        print(', '.join('{}: {:.3f}'.format(k, v) if isinstance(v, float) else '{}: {}'.format(k, v)
+                        for k, v in row.items()))
+    if args.heatmaps is not None:
+        _, heatmaps = sense_heatmaps(table)
+        np.save(args.heatmaps, heatmaps)
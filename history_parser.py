@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+
+"""
+File Name:      history_parser.py
+Author:         agent
+Date:           October 19th, 2026
+
+Description:    Python file used to turn the text history files into a SQLite database of games and plies. Files are
+                read line by line, never as a whole, and parsed on a process pool. It reads the GameHistory
+                game_boards and true_boards files and the RRGameHistory files written by play_game.py, as well as
+                the games of a history archive (history_archive.py).
+"""
+
+import os
+import re
+import sqlite3
+import argparse
+import chess
+from multiprocessing import Pool
+from move_encoding import pack_move
+from history_archive import ArchiveReader
+
+BANNER = '##################################--'
+STARTING_BOARD_FEN = chess.Board().board_fen()
+
+GAME_START = re.compile(r'Starting Game between (.*)-WHITE and (.*)-BLACK')
+TURN = re.compile(r"(WHITE|BLACK)'s Turn \[(\d+)\]")
+SENSE = re.compile(r'Sense Around Square (\w+)')
+MOVE = re.compile(r'Move requested: (\S+) -- Move taken: (\S+)')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    source TEXT UNIQUE,         -- the history file, or archive directory and game number
+    white TEXT,
+    black TEXT,
+    winner INTEGER,             -- 1 WHITE, 0 BLACK, NULL for a draw or an unfinished file
+    reason TEXT,
+    plies INTEGER
+);
+CREATE TABLE IF NOT EXISTS plies (
+    game_id INTEGER REFERENCES games(id),
+    ply INTEGER,
+    color INTEGER,              -- 1 WHITE, 0 BLACK
+    sense INTEGER,              -- sensed square, NULL if the file does not record senses
+    requested INTEGER,          -- packed move (move_encoding.py), NULL for a pass
+    taken INTEGER,              -- packed move, NULL for a pass
+    captured_piece TEXT,        -- symbol of the captured piece, NULL if nothing was captured
+    board TEXT,                 -- board_fen of the truth board before the ply
+    PRIMARY KEY (game_id, ply)
+);
+"""
+
+
+def _board_fen(rows):
+    """
+    :param rows: List(str) -- the eight rows of a printed board, from rank 8 to rank 1
+    :return: str -- the board_fen of the board
+    """
+    fen_rows = []
+    for row in rows:
+        fen_row, empty = '', 0
+        for cell in row.split('|')[1:9]:
+            piece = cell.strip()
+            if piece:
+                fen_row += (str(empty) if empty else '') + piece
+                empty = 0
+            else:
+                empty += 1
+        fen_rows.append(fen_row + (str(empty) if empty else ''))
+    return '/'.join(fen_rows)
+
+
+def _move(uci):
+    return None if uci == 'None' else chess.Move.from_uci(uci)
+
+
+def parse_history(lines, own_boards):
+    """
+    Parses one game from the lines of a history file.
+
+    :param lines: iterable of str -- the lines of the file, e.g. an open file
+    :param own_boards: bool -- True for game_boards files, where 'Current Board State' is the board of the player to
+                       move and the truth board follows the move, False for true_boards and RRGameHistory files
+
+    :return: dict, List(dict) -- the game (white, black, winner, reason, plies) and its plies
+    """
+    game = {'white': None, 'black': None, 'winner': None, 'reason': None}
+    plies = []
+    ply = None
+    board_target = None     # 'before', 'after' or None for boards that are not recorded
+    rows = []
+    truth_after = STARTING_BOARD_FEN
+    game_over = False
+
+    for line in lines:
+        if game_over:
+            if line.strip():
+                game['reason'] = line.strip()
+            continue
+        if line.startswith(BANNER):
+            header = line[len(BANNER):].strip()
+            board_target = None
+            turn, sense, move = TURN.match(header), SENSE.match(header), MOVE.match(header)
+            if turn:
+                ply = {'ply': int(turn.group(2)), 'color': turn.group(1) == 'WHITE', 'sense': None,
+                       'requested': None, 'taken': None, 'board': truth_after if own_boards else None}
+                plies.append(ply)
+            elif header == 'Current Board State' and not own_boards:
+                board_target = 'before'
+            elif header == 'Truth Board State':
+                board_target = 'after'
+            elif sense and ply is not None:
+                ply['sense'] = chess.SQUARE_NAMES.index(sense.group(1))
+            elif move and ply is not None:
+                ply['requested'], ply['taken'] = _move(move.group(1)), _move(move.group(2))
+        elif line[:1].isdigit() and line[1:2] == '|':
+            rows.append(line)
+            if len(rows) == 8:
+                if board_target == 'before' and ply is not None:
+                    ply['board'] = _board_fen(rows)
+                elif board_target == 'after':
+                    truth_after = _board_fen(rows)
+                rows = []
+        elif line.startswith('Starting Game between'):
+            match = GAME_START.match(line)
+            if match:
+                game['white'], game['black'] = match.group(1), match.group(2)
+        elif line.startswith('Game Over!'):
+            game_over = True
+
+    if game['reason'] is not None:
+        if game['reason'].startswith('WHITE'):
+            game['winner'] = True
+        elif game['reason'].startswith('BLACK'):
+            game['winner'] = False
+    game['plies'] = len(plies)
+
+    for ply in plies:
+        ply['captured_piece'] = None
+        if ply['taken'] is not None and ply['board'] is not None:
+            piece = chess.BaseBoard(ply['board']).piece_at(ply['taken'].to_square)
+            if piece is not None and piece.color != ply['color']:
+                ply['captured_piece'] = piece.symbol()
+    return game, plies
+
+
+def _parse_source(source):
+    """
+    :param source: (str, int) -- a history file and None, or an archive directory and a game number
+    """
+    path, game_number = source
+    if game_number is None:
+        with open(path) as f:
+            game, plies = parse_history(f, own_boards='game_boards' in os.path.basename(path))
+        return path, game, plies
+
+    reader = ArchiveReader(path)
+    kinds = reader.entries[game_number]['files']
+    kind = 'game_boards' if 'game_boards' in kinds else 'true_boards'
+    game, plies = parse_history(reader.lines(game_number, kind), own_boards=kind == 'game_boards')
+    return '{}#{}'.format(path, game_number), game, plies
+
+
+def find_sources(paths):
+    """
+    Lists the games below the given paths. A game_boards file already holds everything its true_boards file does,
+    so the true_boards file is only parsed when its game_boards file is missing.
+
+    :param paths: List(str) -- history files, directories of history files and history archive directories
+    :return: List((str, int)) -- the sources to parse, see _parse_source
+    """
+    files = []
+    sources = []
+    for path in paths:
+        if os.path.isdir(path) and os.path.exists(os.path.join(path, 'index.jsonl')):
+            sources += [(path, game_number) for game_number in range(len(ArchiveReader(path)))]
+        elif os.path.isdir(path):
+            files += [os.path.join(path, name) for name in sorted(os.listdir(path)) if name.endswith('.txt')]
+        else:
+            files.append(path)
+
+    file_set = set(files)
+    for path in files:
+        if path.endswith('true_boards.txt') and path[:-len('true_boards.txt')] + 'game_boards.txt' in file_set:
+            continue
+        sources.append((path, None))
+    return sources
+
+
+def _code(move):
+    return pack_move(move) if move is not None else None
+
+
+def parse_to_sqlite(paths, database, workers=1):
+    """
+    Parses all games below the given paths into a SQLite database. Games that are already in the database are
+    skipped, so the archive can be parsed again as it grows.
+
+    :param paths: List(str) -- see find_sources
+    :param database: str -- path to the SQLite database, it is created if needed
+    :param workers: int -- the number of parser processes
+
+    :return: int, int -- the number of games and plies added
+    """
+    connection = sqlite3.connect(database)
+    connection.executescript(SCHEMA)
+    known = {row[0] for row in connection.execute('SELECT source FROM games')}
+    sources = [source for source in find_sources(paths)
+               if (source[0] if source[1] is None else '{}#{}'.format(*source)) not in known]
+
+    games, plies_added = 0, 0
+    with Pool(workers) as pool:
+        for source, game, plies in pool.imap_unordered(_parse_source, sources, chunksize=8):
+            cursor = connection.execute(
+                'INSERT INTO games (source, white, black, winner, reason, plies) VALUES (?, ?, ?, ?, ?, ?)',
+                (source, game['white'], game['black'], game['winner'], game['reason'], game['plies']))
+            connection.executemany(
+                'INSERT INTO plies VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                [(cursor.lastrowid, ply['ply'], ply['color'], ply['sense'], _code(ply['requested']),
+                  _code(ply['taken']), ply['captured_piece'], ply['board']) for ply in plies])
+            games += 1
+            plies_added += len(plies)
+            if games % 100 == 0:
+                connection.commit()
+    connection.commit()
+    connection.close()
+    return games, plies_added
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Parses text history files into a SQLite database.')
+    parser.add_argument('paths', nargs='+',
+                        help='History files, directories of history files or history archive directories.')
+    parser.add_argument('--database', default='history.sqlite', help='The SQLite database to write to.')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help='Number of parser processes.')
+    args = parser.parse_args()
+
+    games, plies = parse_to_sqlite(args.paths, args.database, workers=args.workers)
+    print('Added {} games with {} plies to {}'.format(games, plies, args.database))
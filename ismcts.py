@@ -0,0 +1,349 @@
+#!/usr/bin/env python3
+
+"""
+File Name:      ismcts.py
+Author:         agent
+Date:           October 19th, 2026
+
+Description:    Python file of an information-set Monte Carlo tree search bot. Every search iteration samples a
+                determinization of the hidden opponent pieces from the bot's observations and plays it out with the
+                same Recon rules as Game. Searches run in parallel on a process pool, one tree per process.
+"""
+
+import os
+import math
+import random
+import time
+import chess
+from concurrent.futures import ProcessPoolExecutor
+from player import Player
+from game import Game, PIECE_VALUES, recon_moves, recon_push
+
+
+def _is_terminal(board):
+    return board.king(chess.WHITE) is None or board.king(chess.BLACK) is None
+
+
+def _evaluate(board, color):
+    """
+    :return: float -- the value of the board for color, between 0 (lost) and 1 (won)
+    """
+    if board.king(not color) is None:
+        return 1.0
+    if board.king(color) is None:
+        return 0.0
+    material = sum((len(board.pieces(piece_type, color)) - len(board.pieces(piece_type, not color))) * value
+                   for piece_type, value in PIECE_VALUES.items())
+    return 0.5 + 0.5 * math.tanh(material / 10)
+
+
+###=== Determinizations ===###
+def sample_determinization(fen, color, fresh_squares, rng, perturbation=0.5, rules=None):
+    """
+    Samples one board consistent with the bot's observations. The opponent pieces are placed where they were last
+    seen. A missing opponent king is placed on a random empty square, and with probability perturbation one opponent
+    piece that has not just been sensed is moved, so the search does not commit to stale information.
+
+    :param fen: str -- FEN of the bot's knowledge board
+    :param color: chess.WHITE/chess.BLACK -- the bot's color
+    :param fresh_squares: List(chess.SQUARE) -- squares whose content was observed this turn
+    :param rng: random.Random -- the random number generator to sample with
+    :param perturbation: float -- probability of moving an unseen opponent piece
+    :param rules: Game -- game whose rule helpers are used, a new one is made if None
+
+    :return: chess.Board -- the determinization, with the bot to move
+    """
+    board = chess.Board(fen)
+    fresh_squares = set(fresh_squares)
+    empty_squares = [sq for sq in chess.SQUARES if board.piece_at(sq) is None and sq not in fresh_squares]
+
+    if board.king(not color) is None and empty_squares:
+        king_square = rng.choice(empty_squares)
+        board.set_piece_at(king_square, chess.Piece(chess.KING, not color))
+        empty_squares.remove(king_square)
+
+    if rng.random() < perturbation:
+        board.turn = not color
+        rules = rules if rules is not None else Game()
+        moves = [move for move in recon_moves(rules, board)
+                 if move.from_square not in fresh_squares and move.to_square not in fresh_squares
+                 and board.piece_at(move.to_square) is None]
+        if moves:
+            recon_push(rules, board, rng.choice(moves))
+        board.turn = color
+
+    return board
+
+
+###=== Search ===###
+class _Node(object):
+    __slots__ = ['move', 'parent', 'mover', 'children', 'visits', 'total', 'availability']
+
+    def __init__(self, move=None, parent=None, mover=None):
+        self.move = move
+        self.parent = parent
+        self.mover = mover          # the color that played move
+        self.children = {}
+        self.visits = 0
+        self.total = 0.0
+        self.availability = 1
+
+    def ucb(self, exploration):
+        return self.total / self.visits + exploration * math.sqrt(math.log(self.availability) / self.visits)
+
+
+def _iterate(root, board, color, rules, rng, exploration, rollout_depth):
+    """
+    Runs one ISMCTS iteration (selection, expansion, rollout and backpropagation) on a determinized board.
+    """
+    node = root
+
+    # selection and expansion, restricted to the moves available in this determinization
+    while not _is_terminal(board):
+        moves = recon_moves(rules, board)
+        if not moves:
+            break
+        untried = [move for move in moves if move not in node.children]
+        available = [node.children[move] for move in moves if move in node.children]
+        for child in available:
+            child.availability += 1
+
+        if untried:
+            move = rng.choice(untried)
+            child = _Node(move, node, board.turn)
+            node.children[move] = child
+            recon_push(rules, board, move)
+            node = child
+            break
+
+        node = max(available, key=lambda c: c.ucb(exploration))
+        recon_push(rules, board, node.move)
+
+    # rollout
+    for _ in range(rollout_depth):
+        if _is_terminal(board):
+            break
+        moves = recon_moves(rules, board)
+        if not moves:
+            break
+        recon_push(rules, board, rng.choice(moves))
+
+    # backpropagation
+    reward = _evaluate(board, color)
+    while node is not None:
+        node.visits += 1
+        node.total += reward if node.mover == color else 1 - reward
+        node = node.parent
+
+
+def search(fen, color, fresh_squares, seconds, seed, exploration=0.7, rollout_depth=16, perturbation=0.5):
+    """
+    Runs a single-process ISMCTS search for the given amount of time. This is the function the process pool runs.
+
+    :param fen: str -- FEN of the bot's knowledge board
+    :param color: chess.WHITE/chess.BLACK -- the bot's color
+    :param fresh_squares: List(chess.SQUARE) -- squares whose content was observed this turn
+    :param seconds: float -- the time budget of the search
+    :param seed: int -- seed of the search's random number generator
+
+    :return: dict(str: (int, float)) -- visits and total reward of every root move, keyed by its uci string
+    """
+    rng = random.Random(seed)
+    rules = Game()
+    root = _Node()
+    deadline = time.time() + seconds
+    while time.time() < deadline:
+        board = sample_determinization(fen, color, fresh_squares, rng, perturbation, rules)
+        _iterate(root, board, color, rules, rng, exploration, rollout_depth)
+
+    return {move.uci(): (child.visits, child.total) for move, child in root.children.items()}
+
+
+def _timed_search(*args):
+    """
+    :return: dict, float -- the result of search and the CPU seconds the worker spent on it
+    """
+    start = time.process_time()
+    results = search(*args)
+    return results, time.process_time() - start
+
+
+class ISMCTS(Player):
+    """
+    Information-set MCTS bot. Subclasses can override sense_square, time_budget or the class parameters below.
+    """
+
+    exploration = 0.7       # UCB exploration constant
+    rollout_depth = 16      # plies played randomly after a tree leaf
+    perturbation = 0.5      # chance that a determinization moves an unseen opponent piece
+    max_move_seconds = 5.0  # upper bound on the time spent on one move
+    workers = None          # size of the process pool, defaults to the number of cores
+
+    def __init__(self):
+        self.color = None
+        self.board = None
+        self.fresh_squares = []
+        self.last_seen = {}
+        self.turn_number = 0
+        self.num_workers = self.workers or os.cpu_count()
+        self.pool = None
+        self.worker_cpu_seconds = 0.0   # CPU time of the searches in the pool, charged by CPU clocks
+
+    def handle_game_start(self, color, board):
+        """
+        This function is called at the start of the game.
+
+        :param color: chess.BLACK or chess.WHITE -- your color assignment for the game
+        :param board: chess.Board -- initial board state
+        """
+        self.color = color
+        self.board = board.copy()
+        self.last_seen = {square: 0 for square in chess.SQUARES}
+        self.turn_number = 0
+        if self.pool is None:
+            self.pool = ProcessPoolExecutor(max_workers=self.num_workers)
+
+    def handle_opponent_move_result(self, captured_piece, captured_square):
+        """
+        This function is called at the start of your turn and gives you the chance to update your board.
+
+        :param captured_piece: bool - true if your opponents captured your piece with their last move
+        :param captured_square: chess.Square - position where your piece was captured
+        """
+        self.turn_number += 1
+        self.fresh_squares = []
+        self.board.turn = self.color
+        if not captured_piece:
+            return
+
+        # prefer a capture by a piece we believe could make it, otherwise just mark the piece as lost
+        self.board.turn = not self.color
+        capturing_moves = [move for move in recon_moves(Game(), self.board) if move.to_square == captured_square]
+        if capturing_moves:
+            self.board.push(random.choice(capturing_moves))
+        else:
+            self.board.remove_piece_at(captured_square)
+        self.board.turn = self.color
+        self.fresh_squares = [captured_square]
+
+    def sense_square(self, possible_sense):
+        """
+        Picks the sense square whose 3x3 area was seen the longest time ago. Edge squares waste part of the sense
+        and are only picked when nothing else is possible.
+        """
+        inner = [sq for sq in possible_sense if 0 < chess.square_file(sq) < 7 and 0 < chess.square_rank(sq) < 7]
+        candidates = inner if inner else possible_sense
+
+        own_squares = self.board.occupied_co[self.color]
+
+        def staleness(center):
+            return sum(self.turn_number - self.last_seen[sq] for sq in chess.SQUARES
+                       if chess.square_distance(sq, center) <= 1 and not own_squares & chess.BB_SQUARES[sq])
+
+        return max(candidates, key=staleness)
+
+    def choose_sense(self, possible_sense, possible_moves, seconds_left):
+        """
+        This function is called to choose a square to perform a sense on.
+
+        :param possible_sense: List(chess.SQUARES) -- list of squares to sense around
+        :param possible_moves: List(chess.Moves) -- list of acceptable moves based on current board
+        :param seconds_left: float -- seconds left in the game
+
+        :return: chess.SQUARE -- the center of 3x3 section of the board you want to sense
+        """
+        return self.sense_square(possible_sense)
+
+    def handle_sense_result(self, sense_result):
+        """
+        This is a function called after your picked your 3x3 square to sense and gives you the chance to update your
+        board.
+
+        :param sense_result: A list of tuples, where each tuple contains a :class:`Square` in the sense, and if there
+                             was a piece on the square, then the corresponding :class:`chess.Piece`, otherwise `None`.
+        """
+        sensed_squares = [square for square, _ in sense_result]
+        for square, piece in sense_result:
+            believed = self.board.piece_at(square)
+            if piece is not None and piece.color != self.color and believed != piece:
+                # the piece moved here, so forget where we last saw the closest piece of the same kind
+                elsewhere = [sq for sq in self.board.pieces(piece.piece_type, piece.color) if sq not in sensed_squares]
+                if elsewhere:
+                    self.board.remove_piece_at(min(elsewhere, key=lambda sq: chess.square_distance(sq, square)))
+            if piece is not None:
+                self.board.set_piece_at(square, piece)
+            else:
+                self.board.remove_piece_at(square)
+            self.last_seen[square] = self.turn_number
+        self.fresh_squares += sensed_squares
+
+    def time_budget(self, seconds_left):
+        """
+        :param seconds_left: float -- seconds left in the game
+        :return: float -- the seconds to spend on the next move
+        """
+        return max(0.05, min(self.max_move_seconds, seconds_left / 40))
+
+    def choose_move(self, possible_moves, seconds_left):
+        """
+        Choose a move to enact from a list of possible moves.
+
+        :param possible_moves: List(chess.Moves) -- list of acceptable moves based only on pieces
+        :param seconds_left: float -- seconds left to make a move
+
+        :return: chess.Move -- object that includes the square you're moving from to the square you're moving to
+        """
+        # take the king whenever we know where it is
+        king_square = self.board.king(not self.color)
+        if king_square is not None:
+            for move in possible_moves:
+                if move.to_square == king_square:
+                    return move
+
+        seconds = self.time_budget(seconds_left)
+        fen = self.board.fen()
+        futures = [self.pool.submit(_timed_search, fen, self.color, self.fresh_squares, seconds, random.getrandbits(32),
+                                    self.exploration, self.rollout_depth, self.perturbation)
+                   for _ in range(self.num_workers)]
+
+        # root parallelization: merge the root statistics of every tree
+        visits = {}
+        for future in futures:
+            results, cpu_seconds = future.result()
+            self.worker_cpu_seconds += cpu_seconds
+            for uci, (move_visits, _) in results.items():
+                visits[uci] = visits.get(uci, 0) + move_visits
+
+        candidates = [move for move in possible_moves if move.uci() in visits]
+        if not candidates:
+            return random.choice(possible_moves)
+        return max(candidates, key=lambda move: visits[move.uci()])
+
+    def external_cpu_seconds(self):
+        return self.worker_cpu_seconds
+
+    def handle_move_result(self, requested_move, taken_move, reason, captured_piece, captured_square):
+        """
+        This is a function called at the end of your turn/after your move was made and gives you the chance to update
+        your board.
+
+        :param requested_move: chess.Move -- the move you intended to make
+        :param taken_move: chess.Move -- the move that was actually made
+        :param reason: String -- description of the result from trying to make requested_move
+        :param captured_piece: bool -- true if you captured your opponents piece
+        :param captured_square: chess.Square -- position where you captured the piece
+        """
+        self.board.turn = self.color
+        self.board.push(taken_move if taken_move is not None else chess.Move.null())
+        self.board.turn = self.color
+
+    def handle_game_end(self, winner_color, win_reason):
+        """
+        This function is called at the end of the game to declare a winner.
+
+        :param winner_color: Chess.BLACK/chess.WHITE -- the winning color
+        :param win_reason: String -- the reason for the game ending
+        """
+        if self.pool is not None:
+            self.pool.shutdown()
+            self.pool = None
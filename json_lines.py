@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+
+"""
+File Name:      json_lines.py
+Author:         agent
+Date:           October 19th, 2026
+
+Description:    Python file with the append-only json lines file behind the result cache, the tournament journal and
+                the history archive index. A crash can leave a partially written last line behind, which is skipped
+                when the file is read and terminated before the next entry is appended.
+"""
+
+import os
+import json
+
+
+class JsonLinesFile(object):
+    """
+    A json lines file that entries are only ever appended to.
+    """
+
+    def __init__(self, path, sync=False):
+        """
+        :param path: str -- the file, it is created by the first append
+        :param sync: bool -- whether every append is synced to disk before it returns
+        """
+        self.path = path
+        self.sync = sync
+        self._terminate_last_line = False
+
+    def read(self):
+        """
+        :return: List(dict) -- the entries of the file in order, without a torn last line
+        """
+        entries = []
+        if os.path.exists(self.path):
+            with open(self.path) as f:
+                for line in f:
+                    self._terminate_last_line = not line.endswith('\n')
+                    try:
+                        entries.append(json.loads(line))
+                    except ValueError:
+                        continue
+        return entries
+
+    def append(self, entry):
+        """
+        :param entry: dict -- json serializable entry written as one line
+        """
+        with open(self.path, 'a') as f:
+            if self._terminate_last_line:
+                f.write('\n')
+                self._terminate_last_line = False
+            f.write(json.dumps(entry) + '\n')
+            if self.sync:
+                f.flush()
+                os.fsync(f.fileno())
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+
+"""
+File Name:      observation_encoder.py
+Author:         agent
+Date:           October 19th, 2026
+
+Description:    Python file with an incremental observation encoder for learning agents. The encoder keeps one set of
+                NumPy feature planes per player and updates only the squares touched by each Player callback, so the
+                planes never have to be rebuilt from a chess.Board.
+"""
+
+import numpy as np
+import chess
+
+# plane layout, every plane is 8x8 indexed by [rank, file]
+OWN_PIECES = 0              # 6 planes, own pawns to kings
+SEEN_OPPONENT_PIECES = 6    # 6 planes, opponent pawns to kings where they were last sensed
+SENSE_AGE = 12              # turns since the square was last sensed, divided by max_sense_age and capped at 1
+OWN_CAPTURES = 13           # square where we captured a piece with our last move
+OPPONENT_CAPTURES = 14      # square where the opponent captured one of our pieces with its last move
+LAST_MOVE_FROM = 15         # from square of our last taken move
+LAST_MOVE_TO = 16           # to square of our last taken move
+CLOCK = 17                  # seconds left divided by the starting seconds, on every square
+NUM_PLANES = 18
+
+
+class ObservationEncoder(object):
+    """
+    Keeps the feature planes of one player. Call the handle_* methods from the matching Player callbacks and
+    update_clock from choose_sense/choose_move, then read observation().
+    """
+
+    def __init__(self, seconds_left=600, max_sense_age=20, relative=True):
+        """
+        :param seconds_left: float -- the starting clock, used to normalize the clock plane
+        :param max_sense_age: int -- sense ages are capped at this many turns
+        :param relative: bool -- if True, BLACK sees the board flipped so its own pieces start on the bottom ranks
+        """
+        self.seconds_left = seconds_left
+        self.max_sense_age = max_sense_age
+        self.relative = relative
+
+        self.planes = np.zeros((NUM_PLANES, 8, 8), dtype=np.float32)
+        self._flat = self.planes.reshape(NUM_PLANES, 64)    # view sharing memory with planes
+        self._own_types = np.full(64, -1, dtype=np.int8)     # own piece type index per square, -1 if empty
+        self._last_sensed = np.zeros(64, dtype=np.int32)     # turn each square was last sensed
+        self._last_sensed_age = np.zeros(64, dtype=np.int32)
+        self.color = chess.WHITE
+        self.turn_number = 0
+
+    def _square(self, square):
+        # plane index of a python-chess square
+        return square ^ 56 if self.relative and self.color == chess.BLACK else square
+
+    def _set_own(self, square, piece_type):
+        index = self._square(square)
+        old = self._own_types[index]
+        if old >= 0:
+            self._flat[OWN_PIECES + old, index] = 0
+        self._own_types[index] = -1 if piece_type is None else piece_type - 1
+        if piece_type is not None:
+            self._flat[OWN_PIECES + piece_type - 1, index] = 1
+            self._flat[SEEN_OPPONENT_PIECES:SEEN_OPPONENT_PIECES + 6, index] = 0
+
+    def handle_game_start(self, color, board):
+        """
+        :param color: chess.BLACK or chess.WHITE -- your color assignment for the game
+        :param board: chess.Board -- initial board state
+        """
+        self.color = color
+        self.turn_number = 0
+        self.planes[:] = 0
+        self._own_types[:] = -1
+        self._last_sensed[:] = 0
+
+        for square, piece in board.piece_map().items():
+            if piece.color == color:
+                self._set_own(square, piece.piece_type)
+            else:
+                self._flat[SEEN_OPPONENT_PIECES + piece.piece_type - 1, self._square(square)] = 1
+        self.update_clock(self.seconds_left)
+
+    def handle_opponent_move_result(self, captured_piece, captured_square):
+        """
+        :param captured_piece: bool - true if your opponents captured your piece with their last move
+        :param captured_square: chess.Square - position where your piece was captured
+        """
+        self.turn_number += 1
+        self._flat[OPPONENT_CAPTURES] = 0
+        if captured_piece:
+            self._set_own(captured_square, None)
+            self._flat[OPPONENT_CAPTURES, self._square(captured_square)] = 1
+
+    def handle_sense_result(self, sense_result):
+        """
+        :param sense_result: List((chess.SQUARE, chess.Piece)) -- the result of the sense
+        """
+        for square, piece in sense_result:
+            index = self._square(square)
+            self._last_sensed[index] = self.turn_number
+            self._flat[SEEN_OPPONENT_PIECES:SEEN_OPPONENT_PIECES + 6, index] = 0
+            if piece is not None and piece.color != self.color:
+                self._flat[SEEN_OPPONENT_PIECES + piece.piece_type - 1, index] = 1
+
+    def handle_move_result(self, requested_move, taken_move, reason, captured_piece, captured_square):
+        """
+        :param requested_move: chess.Move -- the move you intended to make
+        :param taken_move: chess.Move -- the move that was actually made
+        :param reason: String -- description of the result from trying to make requested_move
+        :param captured_piece: bool -- true if you captured your opponents piece
+        :param captured_square: chess.Square -- position where you captured the piece
+        """
+        self._flat[OWN_CAPTURES] = 0
+        self._flat[LAST_MOVE_FROM] = 0
+        self._flat[LAST_MOVE_TO] = 0
+        if captured_piece:
+            self._flat[SEEN_OPPONENT_PIECES:SEEN_OPPONENT_PIECES + 6, self._square(captured_square)] = 0
+            self._flat[OWN_CAPTURES, self._square(captured_square)] = 1
+        if taken_move is None:
+            return
+
+        from_square, to_square = taken_move.from_square, taken_move.to_square
+        piece_type = self._own_types[self._square(from_square)] + 1
+        self._set_own(from_square, None)
+        self._set_own(to_square, taken_move.promotion or piece_type)
+        self._flat[LAST_MOVE_FROM, self._square(from_square)] = 1
+        self._flat[LAST_MOVE_TO, self._square(to_square)] = 1
+
+        # castling also moves the rook
+        if piece_type == chess.KING and chess.square_distance(from_square, to_square) > 1:
+            rank = chess.square_rank(from_square)
+            kingside = chess.square_file(to_square) > chess.square_file(from_square)
+            rook_from = chess.square(7 if kingside else 0, rank)
+            rook_to = chess.square(5 if kingside else 3, rank)
+            self._set_own(rook_from, None)
+            self._set_own(rook_to, chess.ROOK)
+
+    def update_clock(self, seconds_left):
+        """
+        :param seconds_left: float -- seconds left in the game
+        """
+        self.planes[CLOCK] = seconds_left / self.seconds_left
+
+    def observation(self):
+        """
+        Refreshes the sense age plane and returns the planes.
+
+        :return: numpy.ndarray -- float32 array of shape (NUM_PLANES, 8, 8), owned by the encoder. Copy it to keep it
+                 past the next update.
+        """
+        np.minimum(self.turn_number - self._last_sensed, self.max_sense_age, out=self._last_sensed_age)
+        np.divide(self._last_sensed_age, self.max_sense_age, out=self._flat[SENSE_AGE])
+        return self.planes
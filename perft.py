@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+
+"""
+File Name:      perft.py
+Author:         agent
+Date:           October 19th, 2026
+
+Description:    Python file used to count the recon chess game tree (perft). Every move offered by the engine is
+                requested, including pawn diagonals onto empty squares and moves through hidden opponent pieces, and
+                the leaves are counted by what the Recon rules made of the request. The counts serve as a correctness
+                oracle for engine backends and as a throughput benchmark.
+"""
+
+import time
+import argparse
+import chess
+from fuzz_engine import make_engine
+
+
+class PerftCounts(object):
+    """
+    Leaf counts of a perft run. Only the requests of the last ply, and requests that capture a king earlier, are
+    classified.
+    """
+
+    FIELDS = ['nodes', 'revised', 'passes', 'captures', 'king_captures']
+
+    def __init__(self, nodes=0, revised=0, passes=0, captures=0, king_captures=0):
+        self.nodes = nodes                  # leaf request sequences
+        self.revised = revised              # requests that were taken as a different move (slid or promoted)
+        self.passes = passes                # requests that ended up as a pass
+        self.captures = captures            # requests that captured a piece
+        self.king_captures = king_captures  # requests that captured the king and ended the game
+
+    def __iadd__(self, other):
+        for field in self.FIELDS:
+            setattr(self, field, getattr(self, field) + getattr(other, field))
+        return self
+
+    def __eq__(self, other):
+        return all(getattr(self, field) == getattr(other, field) for field in self.FIELDS)
+
+    def __str__(self):
+        return ', '.join('{}: {}'.format(field, getattr(self, field)) for field in self.FIELDS)
+
+
+def _position_key(fen):
+    # the move clocks do not change the Recon rules, so positions that only differ in them share a table entry
+    return ' '.join(fen.split()[:4])
+
+
+def _counts_below(engine, fen, move, depth, table):
+    """
+    Plays one request on the position and counts the tree below it. A request that ends the game by capturing a king
+    is a leaf at any depth, and it is classified like a request of the last ply.
+
+    :return: PerftCounts -- the leaf counts below the request
+    """
+    engine.reset(fen)
+    taken_move, capture_square = engine.play(move)
+    king_captured = engine.winner() is not None
+    if depth > 1 and not king_captured:
+        return perft(engine, engine.fen(), depth - 1, table)
+
+    counts = PerftCounts(nodes=1, captures=int(capture_square is not None), king_captures=int(king_captured))
+    if taken_move is None:
+        counts.passes = 1
+    elif taken_move != move:
+        counts.revised = 1
+    return counts
+
+
+def perft(engine, fen, depth, table=None):
+    """
+    Counts the Recon game tree below a position. Positions where a king has been captured are leaves of the game and
+    are not expanded further.
+
+    :param engine: ReconEngine -- the backend to count with
+    :param fen: str -- the position to start from
+    :param depth: int -- the number of plies to enumerate
+    :param table: dict -- transposition table shared between calls, None to disable it
+
+    :return: PerftCounts -- the leaf counts
+    """
+    if table is not None:
+        key = (_position_key(fen), depth)
+        if key in table:
+            return table[key]
+
+    counts = PerftCounts()
+    engine.reset(fen)
+    for move in engine.moves():
+        counts += _counts_below(engine, fen, move, depth, table)
+
+    if table is not None:
+        table[key] = counts
+    return counts
+
+
+def divide(engine, fen, depth, table=None):
+    """
+    :return: List((str, PerftCounts)) -- the perft counts below every root move, keyed by its uci string. They add up
+             to the counts of perft.
+    """
+    engine.reset(fen)
+    return [(move.uci(), _counts_below(engine, fen, move, depth, table)) for move in engine.moves()]
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Counts the recon chess game tree from a position.')
+    parser.add_argument('depth', type=int, help='Number of plies to enumerate.')
+    parser.add_argument('--fen', default=chess.STARTING_FEN, help='Position to start from.')
+    parser.add_argument('--backend', default='reference',
+                        help='Engine backend: reference, game, tournament or module:Class.')
+    parser.add_argument('--no-table', action='store_true', help='Disable the transposition table.')
+    parser.add_argument('--divide', action='store_true', help='Print the counts below every root move.')
+    args = parser.parse_args()
+
+    engine = make_engine(args.backend)
+    table = None if args.no_table else {}
+
+    start = time.time()
+    if args.divide:
+        total = PerftCounts()
+        for uci, counts in divide(engine, args.fen, args.depth, table):
+            print('{}: {}'.format(uci, counts.nodes))
+            total += counts
+        print('Total nodes: {}'.format(total.nodes))
+    else:
+        counts = perft(engine, args.fen, args.depth, table)
+        elapsed = time.time() - start
+        print('perft({}) -- {}'.format(args.depth, counts))
+        print('{:.2f}s, {:.0f} nodes/s'.format(elapsed, counts.nodes / max(elapsed, 1e-9)))
@@ -9,28 +9,94 @@ Description:    Python file used to play a game of recon chess with two agents.
 Source:         Adapted from recon-chess (https://pypi.org/project/reconchess/)
 """
 
+import io
+import sys
+import json
 import argparse
 import random
 import chess
+from functools import lru_cache
 from player import load_player
 from game import Game
+from history_archive import ArchiveWriter
 from datetime import datetime
 import time
 
 
-def play_local_game(white_player, black_player, player_names):
+# verbosity levels of the game output, every level includes the ones before it
+OFF, RESULTS, MOVES, BOARDS = range(4)
+VERBOSITY_LEVELS = {'off': OFF, 'results': RESULTS, 'moves': MOVES, 'boards': BOARDS}
+
+
+class Verbosity(object):
+    """
+    How much play_local_game reports on each of its outputs, one of the levels above per output. Boards are only
+    rendered for outputs at the BOARDS level.
+    """
+
+    def __init__(self, console=BOARDS, history=BOARDS, events=OFF, events_file=None, colorize=False, compact=False):
+        """
+        :param console: int -- level of the console output
+        :param history: int -- level of the GameHistory files, no files are written when it is OFF
+        :param events: int -- level of the json lines events written to events_file
+        :param events_file: file -- where to write the events, e.g. sys.stdout, None to write no events
+        :param colorize: bool -- color the pieces of the console boards
+        :param compact: bool -- print the console boards in the compact layout
+        """
+        self.console = console
+        self.history = history
+        self.events = events if events_file is not None else OFF
+        self.events_file = events_file
+        self.colorize = colorize
+        self.compact = compact
+
+    def print(self, level, text):
+        if self.console >= level:
+            print(text)
+
+    def print_board(self, board):
+        if self.console >= BOARDS:
+            format_print_board(board, self.colorize, self.compact)
+
+    def event(self, level, event, **fields):
+        if self.events >= level:
+            entry = {'event': event}
+            entry.update(fields)
+            self.events_file.write(json.dumps(entry) + '\n')
+
+
+def _uci(move):
+    return move.uci() if move is not None else None
+
+
+def _square_name(square):
+    # Game.handle_sense accepts any sense, so an agent may return None or a square off the board
+    return chess.SQUARE_NAMES[square] if square in chess.SQUARES else None
+
+
+def play_local_game(white_player, black_player, player_names, game=None, verbosity=None, archive=None):
     players = [black_player, white_player]
 
-    game = Game()
+    if game is None:
+        game = Game()
+    if verbosity is None:
+        verbosity = Verbosity()
 
     # writing to files
-    time = "{}".format(datetime.today()).replace(" ", "_").replace(":", "-").replace(".", "-")
-    filename_game = "GameHistory/" + time + "game_boards.txt"
-    filename_true = "GameHistory/" + time + "true_boards.txt"
-    output = open(filename_game, "w")
-    output_true = open(filename_true, "w")
-    output.write("Starting Game between {}-WHITE and {}-BLACK\n".format(player_names[0], player_names[1]))
-    output_true.write("Starting Game between {}-WHITE and {}-BLACK\n".format(player_names[0], player_names[1]))
+    output, output_true = None, None
+    if verbosity.history > OFF and archive is not None:
+        # the archive compresses the whole game once it is over
+        output, output_true = io.StringIO(), io.StringIO()
+    elif verbosity.history > OFF:
+        time = "{}".format(datetime.today()).replace(" ", "_").replace(":", "-").replace(".", "-")
+        filename_game = "GameHistory/" + time + "game_boards.txt"
+        filename_true = "GameHistory/" + time + "true_boards.txt"
+        output = open(filename_game, "w")
+        output_true = open(filename_true, "w")
+    if output is not None:
+        output.write("Starting Game between {}-WHITE and {}-BLACK\n".format(player_names[0], player_names[1]))
+        output_true.write("Starting Game between {}-WHITE and {}-BLACK\n".format(player_names[0], player_names[1]))
+    verbosity.event(RESULTS, 'game_start', white=player_names[0], black=player_names[1])
 
     white_player.handle_game_start(chess.WHITE, chess.Board())
     black_player.handle_game_start(chess.BLACK, chess.Board())
@@ -39,48 +105,62 @@ def play_local_game(white_player, black_player, player_names):
     move_number = 1
     while not game.is_over():
         if game.turn:
-            output.write("##################################--WHITE's Turn [{}]\n".format(move_number))
-            output.write("##################################--Current Board State\n")
-            format_write_board(output, game.white_board)
-            output_true.write("##################################--WHITE's Turn [{}]\n".format(move_number))
+            if verbosity.history >= MOVES:
+                output.write("##################################--WHITE's Turn [{}]\n".format(move_number))
+            if verbosity.history >= BOARDS:
+                output.write("##################################--Current Board State\n")
+                format_write_board(output, game.white_board)
+            if verbosity.history >= MOVES:
+                output_true.write("##################################--WHITE's Turn [{}]\n".format(move_number))
 
-            print("WHITE's Turn [{}]".format(move_number))
-            format_print_board(game.white_board)
+            verbosity.print(MOVES, "WHITE's Turn [{}]".format(move_number))
+            verbosity.print_board(game.white_board)
 
         else:
-            output.write("##################################--BLACK's Turn [{}]\n".format(move_number))
-            output.write("##################################--Current Board State \n")
-            format_write_board(output, game.black_board)
-            output_true.write("##################################--BLACK's Turn [{}]\n".format(move_number))
-
-            print("BLACK's Turn [{}]".format(move_number))
-            format_print_board(game.black_board)
-
-        output_true.write("##################################--Current Board State\n")
-        format_write_board(output_true, game.truth_board)
-
-        requested_move, taken_move = play_turn(game, players[game.turn], game.turn, move_number, output, output_true)
-        print_game(game, move_number, game.turn, requested_move, taken_move)
+            if verbosity.history >= MOVES:
+                output.write("##################################--BLACK's Turn [{}]\n".format(move_number))
+            if verbosity.history >= BOARDS:
+                output.write("##################################--Current Board State \n")
+                format_write_board(output, game.black_board)
+            if verbosity.history >= MOVES:
+                output_true.write("##################################--BLACK's Turn [{}]\n".format(move_number))
+
+            verbosity.print(MOVES, "BLACK's Turn [{}]".format(move_number))
+            verbosity.print_board(game.black_board)
+
+        if verbosity.history >= BOARDS:
+            output_true.write("##################################--Current Board State\n")
+            format_write_board(output_true, game.truth_board)
+
+        requested_move, taken_move = play_turn(game, players[game.turn], game.turn, move_number, output, output_true,
+                                               verbosity)
+        print_game(game, move_number, game.turn, requested_move, taken_move, verbosity)
         move_number += 1
 
-        print("==================================\n")
+        verbosity.print(MOVES, "==================================\n")
 
     winner_color, winner_reason = game.get_winner()
 
     white_player.handle_game_end(winner_color, winner_reason)
     black_player.handle_game_end(winner_color, winner_reason)
 
-    output.write("Game Over!\n")
-    if winner_color is not None:
+    if verbosity.history > OFF:
+        output.write("Game Over!\n")
         output.write(winner_reason)
-    else:
-        output.write('Draw!')
+        if archive is not None:
+            archive.add_game(player_names, {'game_boards': output.getvalue(), 'true_boards': output_true.getvalue()})
+        output.close()
+        output_true.close()
+    winner = {chess.WHITE: 'WHITE', chess.BLACK: 'BLACK', None: None}[winner_color]
+    verbosity.event(RESULTS, 'game_end', winner=winner, reason=winner_reason, plies=move_number - 1)
     return winner_color, winner_reason
 
 
-def play_turn(game, player, turn, move_number, output, output_true):
-    possible_moves = game.get_moves()
+def play_turn(game, player, turn, move_number, output, output_true, verbosity):
+    possible_moves = game.get_packed_moves() if player.packed_moves else game.get_moves()
     possible_sense = list(chess.SQUARES)
+    color = "WHITE" if turn else "BLACK"
+    external_cpu_seconds = player.external_cpu_seconds()
 
     # notify the player of the previous opponent's move
     captured_square = game.opponent_move_result()
@@ -90,13 +170,17 @@ def play_turn(game, player, turn, move_number, output, output_true):
     sense = player.choose_sense(possible_sense, possible_moves, game.get_seconds_left())
     sense_result = game.handle_sense(sense)
     player.handle_sense_result(sense_result)
-    print_sense(game, turn, sense)
-
-    output.write("##################################--Sense Around Square {}\n".format(chess.SQUARE_NAMES[sense]))
-    if turn:
-        format_write_board(output, game.white_board)
-    else:
-        format_write_board(output, game.black_board)
+    print_sense(game, turn, sense, verbosity)
+    if verbosity.events >= MOVES:
+        verbosity.event(MOVES, 'sense', color=color, ply=move_number, square=_square_name(sense))
+
+    if verbosity.history >= MOVES:
+        output.write("##################################--Sense Around Square {}\n".format(_square_name(sense)))
+    if verbosity.history >= BOARDS:
+        if turn:
+            format_write_board(output, game.white_board)
+        else:
+            format_write_board(output, game.black_board)
 
     # play move action
     move = player.choose_move(possible_moves, game.get_seconds_left())
@@ -104,90 +188,90 @@ def play_turn(game, player, turn, move_number, output, output_true):
     player.handle_move_result(requested_move, taken_move, reason, captured_square is not None,
                               captured_square)
 
-    output.write("##################################--Move requested: {} -- Move taken: {}\n".format(requested_move, taken_move))
-    output_true.write("##################################--Move requested: {} -- Move taken: {}\n\n".format(requested_move, taken_move))
-    if turn:
-        format_write_board(output, game.white_board)
-    else:
-        format_write_board(output, game.black_board)
+    if verbosity.history >= MOVES:
+        output.write("##################################--Move requested: {} -- Move taken: {}\n".format(requested_move, taken_move))
+        output_true.write("##################################--Move requested: {} -- Move taken: {}\n\n".format(requested_move, taken_move))
+    if verbosity.history >= BOARDS:
+        if turn:
+            format_write_board(output, game.white_board)
+        else:
+            format_write_board(output, game.black_board)
 
-    output.write("##################################--Truth Board State\n")
-    format_write_board(output, game.truth_board)
+        output.write("##################################--Truth Board State\n")
+        format_write_board(output, game.truth_board)
 
+    if verbosity.events >= MOVES:
+        fields = {'color': color, 'ply': move_number, 'requested': _uci(requested_move), 'taken': _uci(taken_move),
+                  'captured_square': captured_square, 'reason': reason}
+        if verbosity.events >= BOARDS:
+            fields['board'] = game.truth_board.fen()
+        verbosity.event(MOVES, 'move', **fields)
+
+    game.charge(player.external_cpu_seconds() - external_cpu_seconds)
     game.end_turn()
     return requested_move, taken_move
 
 
-def print_game(game, move_number, turn, move_requested, move_taken):
+def print_game(game, move_number, turn, move_requested, move_taken, verbosity):
     if not turn:
-        print("[WHITE]-- Move requested: {} -- Move taken: {}".format(move_requested, move_taken))
-        format_print_board(game.white_board)
+        verbosity.print(MOVES, "[WHITE]-- Move requested: {} -- Move taken: {}".format(move_requested, move_taken))
+        verbosity.print_board(game.white_board)
     else:
-        print("[BLACK]-- Move requested: {} -- Move taken: {}".format(move_requested, move_taken))
-        format_print_board(game.black_board)
+        verbosity.print(MOVES, "[BLACK]-- Move requested: {} -- Move taken: {}".format(move_requested, move_taken))
+        verbosity.print_board(game.black_board)
 
 
-def print_sense(game, turn, sense):
+def print_sense(game, turn, sense, verbosity):
     if turn:
-        print("[WHITE]-- Sense Around Square {} --".format(chess.SQUARE_NAMES[sense]))
-        format_print_board(game.white_board)
+        verbosity.print(MOVES, "[WHITE]-- Sense Around Square {} --".format(_square_name(sense)))
+        verbosity.print_board(game.white_board)
     else:
-        print("[BLACK]-- Sense Around Square {} --".format(chess.SQUARE_NAMES[sense]))
-        format_print_board(game.black_board)
-
-
-def format_print_board(board):
-    rows = ['8', '7', '6', '5', '4', '3', '2', '1']
-    fen = board.board_fen()
-
-    fb = "   A   B   C   D   E   F   G   H  "
-    fb += rows[0]
-    ind = 1
-    for f in fen:
-        if f == '/':
-            fb += '|' + rows[ind]
-            ind += 1
-        elif f.isnumeric():
-            for i in range(int(f)):
-                fb += '|   '
+        verbosity.print(MOVES, "[BLACK]-- Sense Around Square {} --".format(_square_name(sense)))
+        verbosity.print_board(game.black_board)
+
+
+# ANSI escape codes of the colorized boards
+WHITE_PIECE_COLOR = '\033[1;97m'
+BLACK_PIECE_COLOR = '\033[1;91m'
+RESET_COLOR = '\033[0m'
+
+
+@lru_cache(maxsize=4096)
+def render_board(board_fen, colorize=False, compact=False):
+    """
+    Renders a board as text. Boards repeat a lot within and between games, so the results are cached.
+
+    :param board_fen: str -- the board_fen() of the board
+    :param colorize: bool -- color the pieces with ANSI escape codes, for the console only
+    :param compact: bool -- one character per square instead of the boxed layout of the history files
+
+    :return: str -- the board, ending with an empty line
+    """
+    lines = ["  abcdefgh" if compact else "   A   B   C   D   E   F   G   H  "]
+    for rank, row in zip('87654321', board_fen.split('/')):
+        cells = []
+        for f in row:
+            if f.isnumeric():
+                cells += ['.' if compact else ' '] * int(f)
+            elif colorize:
+                cells.append((WHITE_PIECE_COLOR if f.isupper() else BLACK_PIECE_COLOR) + f + RESET_COLOR)
+            else:
+                cells.append(f)
+        if compact:
+            lines.append(rank + ' ' + ''.join(cells))
         else:
-            fb += '| ' + f + ' '
-    fb += '|'
+            lines.append(rank + '| ' + ' | '.join(cells) + ' |')
+    if compact:
+        lines.append(lines.pop(0))
+    return '\n'.join(lines) + '\n\n'
 
-    ind = 0
-    for i in range(9):
-        for j in range(34):
-            print(fb[ind], end='')
-            ind += 1
-        print('\n', end='')
-    print("")
 
+def format_print_board(board, colorize=False, compact=False):
+    print(render_board(board.board_fen(), colorize, compact), end='')
 
-def format_write_board(out, board):
-    rows = ['8', '7', '6', '5', '4', '3', '2', '1']
-    fen = board.board_fen()
-
-    fb = "   A   B   C   D   E   F   G   H  "
-    fb += rows[0]
-    ind = 1
-    for f in fen:
-        if f == '/':
-            fb += '|' + rows[ind]
-            ind += 1
-        elif f.isnumeric():
-            for i in range(int(f)):
-                fb += '|   '
-        else:
-            fb += '| ' + f + ' '
-    fb += '|'
 
-    ind = 0
-    for i in range(9):
-        for j in range(34):
-            out.write(fb[ind])
-            ind += 1
-        out.write('\n')
-    out.write('\n')
+def format_write_board(out, board):
+    out.write(render_board(board.board_fen()))
 
 
 if __name__ == '__main__':
@@ -196,6 +280,28 @@ if __name__ == '__main__':
     parser.add_argument('second_path', help='Path to second bot source file.')
     # parser.add_argument('--color', default='random', choices=['white', 'black', 'random'],
     #                    help='The color you want to play as.')
+    parser.add_argument('--max-plies', type=int, default=None,
+                        help='Adjudicate the game after this many plies.')
+    parser.add_argument('--no-progress-plies', type=int, default=None,
+                        help='Adjudicate the game after this many plies without a capture or pawn move.')
+    parser.add_argument('--material-margin', type=int, default=None,
+                        help='Material lead that wins a game adjudicated by one of the limits, otherwise it is a draw.')
+    parser.add_argument('--clock', default='wall', choices=['wall', 'thread', 'process'],
+                        help='Charge players wall time, or the CPU time of the game thread or process.')
+    parser.add_argument('--verbosity', default='boards', choices=list(VERBOSITY_LEVELS),
+                        help='How much to print to the console.')
+    parser.add_argument('--history', default='boards', choices=list(VERBOSITY_LEVELS),
+                        help='How much to write to the GameHistory files, off writes no files.')
+    parser.add_argument('--events', default=None,
+                        help='Write json lines events to this file, - for the console.')
+    parser.add_argument('--events-verbosity', default='moves', choices=list(VERBOSITY_LEVELS),
+                        help='How much to write to the events file.')
+    parser.add_argument('--archive', default=None,
+                        help='Write the history to compressed segments in this directory instead of GameHistory.')
+    parser.add_argument('--compression', default='gzip', choices=['gzip', 'zstd'],
+                        help='Compression of the archive segments.')
+    parser.add_argument('--color-boards', action='store_true', help='Color the pieces of the console boards.')
+    parser.add_argument('--compact-boards', action='store_true', help='Print compact console boards.')
     args = parser.parse_args()
 
     name_one, constructor_one = load_player(args.first_path)
@@ -212,10 +318,19 @@ if __name__ == '__main__':
             players.reverse()
             player_names.reverse()
 
-    win_color, win_reason = play_local_game(players[0], players[1], player_names)
-
-    print('Game Over!')
-    if win_color is not None:
-        print(win_reason)
-    else:
-        print('Draw!')
\ No newline at end of file
+    game = Game(max_plies=args.max_plies, no_progress_plies=args.no_progress_plies,
+                material_margin=args.material_margin, clock=args.clock)
+    events_file = None
+    if args.events is not None:
+        events_file = sys.stdout if args.events == '-' else open(args.events, 'a')
+    verbosity = Verbosity(console=VERBOSITY_LEVELS[args.verbosity], history=VERBOSITY_LEVELS[args.history],
+                          events=VERBOSITY_LEVELS[args.events_verbosity], events_file=events_file,
+                          colorize=args.color_boards, compact=args.compact_boards)
+    archive = ArchiveWriter(args.archive, compression=args.compression) if args.archive is not None else None
+    win_color, win_reason = play_local_game(players[0], players[1], player_names, game=game, verbosity=verbosity,
+                                            archive=archive)
+    if archive is not None:
+        archive.close()
+
+    verbosity.print(RESULTS, 'Game Over!')
+    verbosity.print(RESULTS, win_reason)
\ No newline at end of file
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+
+"""
+File Name:      play_match.py
+Author:         agent
+Date:           October 19th, 2026
+
+Description:    Python file used to compare two agents with a sequential probability ratio test (SPRT). Games are
+                played with play_local_game until the match result is statistically decided.
+"""
+
+import argparse
+import math
+import chess
+from player import load_player
+from game import Game
+from play_game import play_local_game, Verbosity, VERBOSITY_LEVELS, OFF, RESULTS
+
+
+class SprtResult(object):
+    """
+    The outcome of an SPRT match, seen from the first (new) agent.
+    """
+
+    def __init__(self, lower_bound, upper_bound):
+        self.wins = 0
+        self.draws = 0
+        self.losses = 0
+        self.llr = 0.0
+        self.llr_history = []   # the LLR after every game
+        self.lower_bound = lower_bound
+        self.upper_bound = upper_bound
+        self.decision = None    # 'H0' (no better than elo0), 'H1' (at least elo1) or None if undecided
+
+    @property
+    def games_played(self):
+        return self.wins + self.draws + self.losses
+
+    def __str__(self):
+        return "Games: {} (W {} / D {} / L {}) -- LLR: {:.3f} [{:.3f}, {:.3f}] -- Decision: {}".format(
+            self.games_played, self.wins, self.draws, self.losses, self.llr, self.lower_bound, self.upper_bound,
+            self.decision if self.decision is not None else "undecided")
+
+
+def elo_to_score(elo):
+    """
+    :param elo: float -- an Elo difference
+    :return: float -- the expected score for that Elo difference
+    """
+    return 1 / (1 + 10 ** (-elo / 400))
+
+
+def sprt_bounds(alpha, beta):
+    """
+    :param alpha: float -- the probability of accepting H1 when H0 is true (false positive)
+    :param beta: float -- the probability of accepting H0 when H1 is true (false negative)
+    :return: float, float -- the lower and upper LLR bounds of the test
+    """
+    return math.log(beta / (1 - alpha)), math.log((1 - beta) / alpha)
+
+
+def sprt_llr(wins, draws, losses, elo0, elo1):
+    """
+    Computes the generalized log-likelihood ratio of H1 (elo1) against H0 (elo0) for a win/draw/loss count using the
+    normal approximation of the trinomial score distribution. Half a win, draw and loss are added before the score
+    and its variance are estimated, so a run of only wins or only draws still moves the LLR.
+
+    :param wins: int -- number of games won by the first agent
+    :param draws: int -- number of drawn games
+    :param losses: int -- number of games lost by the first agent
+    :param elo0: float -- Elo difference of the null hypothesis
+    :param elo1: float -- Elo difference of the alternative hypothesis
+
+    :return: float -- the log-likelihood ratio, 0 before the first game
+    """
+    games = wins + draws + losses
+    if games == 0:
+        return 0.0
+
+    # pseudo-counts keep the variance above zero
+    wins, draws, losses = wins + 0.5, draws + 0.5, losses + 0.5
+    total = wins + draws + losses
+    score = (wins + 0.5 * draws) / total
+    variance = (wins * (1 - score) ** 2 + draws * (0.5 - score) ** 2 + losses * score ** 2) / total
+
+    score0, score1 = elo_to_score(elo0), elo_to_score(elo1)
+    return games * (score1 - score0) * (2 * score - score0 - score1) / (2 * variance)
+
+
+def play_sprt_match(new_constructor, old_constructor, player_names, elo0=0.0, elo1=10.0, alpha=0.05, beta=0.05,
+                    max_games=1000, game_factory=Game, verbosity=None):
+    """
+    Plays games between two agents, alternating colors, until the SPRT accepts one of its hypotheses or max_games
+    have been played.
+
+    :param new_constructor: class -- the Player subclass of the agent under test
+    :param old_constructor: class -- the Player subclass of the baseline agent
+    :param player_names: List(str) -- names of the new and the old agent
+    :param elo0: float -- Elo difference of the null hypothesis
+    :param elo1: float -- Elo difference of the alternative hypothesis
+    :param alpha: float -- the accepted false positive rate
+    :param beta: float -- the accepted false negative rate
+    :param max_games: int -- the number of games after which the match is stopped undecided
+    :param game_factory: callable -- returns a new Game for every game of the match
+    :param verbosity: Verbosity -- how much every game reports, see play_game.py, the results on the console and no
+                      history files if None
+
+    :return: SprtResult -- the match statistics and the LLR after every game
+    """
+    if verbosity is None:
+        verbosity = Verbosity(console=RESULTS, history=OFF)
+    lower_bound, upper_bound = sprt_bounds(alpha, beta)
+    result = SprtResult(lower_bound, upper_bound)
+
+    while result.games_played < max_games:
+        new_player, old_player = new_constructor(), old_constructor()
+        new_color = chess.WHITE if result.games_played % 2 == 0 else chess.BLACK
+        if new_color == chess.WHITE:
+            winner_color, _ = play_local_game(new_player, old_player, player_names, game=game_factory(),
+                                              verbosity=verbosity)
+        else:
+            winner_color, _ = play_local_game(old_player, new_player, player_names[::-1], game=game_factory(),
+                                              verbosity=verbosity)
+
+        if winner_color is None:
+            result.draws += 1
+        elif winner_color == new_color:
+            result.wins += 1
+        else:
+            result.losses += 1
+
+        result.llr = sprt_llr(result.wins, result.draws, result.losses, elo0, elo1)
+        result.llr_history.append(result.llr)
+        if result.llr >= upper_bound:
+            result.decision = 'H1'
+            break
+        elif result.llr <= lower_bound:
+            result.decision = 'H0'
+            break
+
+    return result
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Compares two bots with a sequential probability ratio test.')
+    parser.add_argument('new_path', help='Path to the source file of the bot under test.')
+    parser.add_argument('old_path', help='Path to the source file of the baseline bot.')
+    parser.add_argument('--elo0', type=float, default=0.0, help='Elo difference of the null hypothesis.')
+    parser.add_argument('--elo1', type=float, default=10.0, help='Elo difference of the alternative hypothesis.')
+    parser.add_argument('--alpha', type=float, default=0.05, help='False positive rate.')
+    parser.add_argument('--beta', type=float, default=0.05, help='False negative rate.')
+    parser.add_argument('--max-games', type=int, default=1000, help='Stop the match undecided after this many games.')
+    parser.add_argument('--max-plies', type=int, default=None,
+                        help='Adjudicate each game after this many plies.')
+    parser.add_argument('--no-progress-plies', type=int, default=None,
+                        help='Adjudicate each game after this many plies without a capture or pawn move.')
+    parser.add_argument('--material-margin', type=int, default=None,
+                        help='Material lead that wins a game adjudicated by one of the limits, otherwise it is a draw.')
+    parser.add_argument('--clock', default='wall', choices=['wall', 'thread', 'process'],
+                        help='Charge players wall time, or the CPU time of the game thread or process.')
+    parser.add_argument('--verbosity', default='results', choices=list(VERBOSITY_LEVELS),
+                        help='How much every game prints to the console.')
+    parser.add_argument('--history', default='off', choices=list(VERBOSITY_LEVELS),
+                        help='How much every game writes to its GameHistory files, off writes no files.')
+    args = parser.parse_args()
+
+    new_name, new_constructor = load_player(args.new_path)
+    old_name, old_constructor = load_player(args.old_path)
+
+    def game_factory():
+        return Game(max_plies=args.max_plies, no_progress_plies=args.no_progress_plies,
+                    material_margin=args.material_margin, clock=args.clock)
+
+    result = play_sprt_match(new_constructor, old_constructor, [new_name, old_name], elo0=args.elo0,
+                             elo1=args.elo1, alpha=args.alpha, beta=args.beta, max_games=args.max_games,
+                             game_factory=game_factory,
+                             verbosity=Verbosity(console=VERBOSITY_LEVELS[args.verbosity],
+                                                 history=VERBOSITY_LEVELS[args.history]))
+
+    print('Match Over!')
+    print(result)
+    print('LLR trajectory: ' + ' '.join('{:.3f}'.format(llr) for llr in result.llr_history))
@@ -12,14 +12,180 @@ Source:         Adapted from recon-chess (https://pypi.org/project/reconchess/)
 import os
 import sys
 import importlib
+import importlib.util
 import inspect
 import chess
 
 
 class Player(object):
+    # files, relative to the agent's source file, that the agent's behavior depends on besides its source code
+    # :example: data_files = ['weights.npy']
+    data_files = ()
+
+    # set to True to receive possible_moves as a NumPy uint16 array of packed moves, see move_encoding.py
+    packed_moves = False
+
+    def __init__(self):
+        pass
+
+    def external_cpu_seconds(self):
+        """
+        Agents that compute in other processes report that CPU time here, so the CPU clocks of Game charge it.
+
+        :return: float -- the CPU seconds the agent used outside the game's process so far
+        """
+        return 0.0
+
+
+class TurnObservation(object):
+    """
+    Everything a player learns between two decisions, delivered in one immutable object. The observation of the sense
+    decision has sense_result None, the observation of the move decision is the same observation with the sense
+    result filled in.
+    """
+    __slots__ = ('opponent_capture', 'last_move', 'possible_moves', 'seconds_left', 'sense_result')
+
+    def __init__(self, opponent_capture, last_move, possible_moves, seconds_left, sense_result=None):
+        """
+        :param opponent_capture: chess.SQUARE -- square where the opponent captured your piece with its last move,
+                                 None if nothing was captured
+        :param last_move: (chess.Move, chess.Move, str, chess.SQUARE) -- requested move, taken move, reason and capture
+                          square of your previous move, None before your first move
+        :param possible_moves: List(chess.Move) -- the possible moves of this turn, or a packed array (packed_moves)
+        :param seconds_left: float -- seconds left in the game
+        :param sense_result: tuple((chess.SQUARE, chess.Piece)) -- the result of this turn's sense, None before the sense
+        """
+        object.__setattr__(self, 'opponent_capture', opponent_capture)
+        object.__setattr__(self, 'last_move', last_move)
+        object.__setattr__(self, 'possible_moves', possible_moves)
+        object.__setattr__(self, 'seconds_left', seconds_left)
+        object.__setattr__(self, 'sense_result', sense_result)
+
+    def __setattr__(self, name, value):
+        raise AttributeError('TurnObservation is immutable')
+
+    def with_sense_result(self, sense_result, seconds_left):
+        """
+        :return: TurnObservation -- this observation with the sense result and the clock of the move decision
+        """
+        return TurnObservation(self.opponent_capture, self.last_move, self.possible_moves, seconds_left,
+                               tuple(sense_result))
+
+
+class BatchedPlayer(Player):
+    """
+    Player that receives each turn as two decisions instead of five callbacks: decide_sense gets the results of the
+    previous turns, decide_move gets the sense result. The Player callbacks are implemented on top of them, so a
+    BatchedPlayer runs in every game driver.
+    """
+
     def __init__(self):
+        super().__init__()
+        self._opponent_capture = None
+        self._last_move = None
+        self._sense_result = ()
+        self._observation = None
+
+    def decide_sense(self, observation):
+        """
+        :param observation: TurnObservation -- the observation of this turn, without sense result
+        :return: chess.SQUARE -- the center of 3x3 section of the board you want to sense
+        """
+        raise NotImplementedError
+
+    def decide_move(self, observation):
+        """
+        :param observation: TurnObservation -- the observation of this turn, with sense result
+        :return: chess.Move -- the move to request, None to pass
+        """
+        raise NotImplementedError
+
+    def finish_game(self, last_move, winner_color, win_reason):
+        """
+        :param last_move: tuple -- the result of your last move, see TurnObservation.last_move
+        :param winner_color: Chess.BLACK/chess.WHITE -- the winning color
+        :param win_reason: String -- the reason for the game ending
+        """
         pass
 
+    ###=== Player callbacks ===###
+    def handle_opponent_move_result(self, captured_piece, captured_square):
+        self._opponent_capture = captured_square if captured_piece else None
+
+    def choose_sense(self, possible_sense, possible_moves, seconds_left):
+        self._observation = TurnObservation(self._opponent_capture, self._last_move, possible_moves, seconds_left)
+        self._last_move = None
+        return self.decide_sense(self._observation)
+
+    def handle_sense_result(self, sense_result):
+        self._sense_result = sense_result
+
+    def choose_move(self, possible_moves, seconds_left):
+        return self.decide_move(self._observation.with_sense_result(self._sense_result, seconds_left))
+
+    def handle_move_result(self, requested_move, taken_move, reason, captured_piece, captured_square):
+        self._last_move = (requested_move, taken_move, reason, captured_square if captured_piece else None)
+
+    def handle_game_end(self, winner_color, win_reason):
+        self.finish_game(self._last_move, winner_color, win_reason)
+
+
+class BatchedAdapter(BatchedPlayer):
+    """
+    Runs a Player with the five callbacks behind the batched decisions, e.g. in a process that receives whole
+    TurnObservations. The result of a move is handed to the player right before its next turn or the game end.
+    """
+
+    def __init__(self, player):
+        super().__init__()
+        self.player = player
+        self.packed_moves = player.packed_moves
+
+    def external_cpu_seconds(self):
+        return self.player.external_cpu_seconds()
+
+    def _handle_last_move(self, last_move):
+        if last_move is not None:
+            requested_move, taken_move, reason, captured_square = last_move
+            self.player.handle_move_result(requested_move, taken_move, reason, captured_square is not None,
+                                           captured_square)
+
+    def handle_game_start(self, color, board):
+        self.player.handle_game_start(color, board)
+
+    def decide_sense(self, observation):
+        self._handle_last_move(observation.last_move)
+        self.player.handle_opponent_move_result(observation.opponent_capture is not None, observation.opponent_capture)
+        return self.player.choose_sense(list(chess.SQUARES), observation.possible_moves, observation.seconds_left)
+
+    def decide_move(self, observation):
+        self.player.handle_sense_result(list(observation.sense_result))
+        return self.player.choose_move(observation.possible_moves, observation.seconds_left)
+
+    def finish_game(self, last_move, winner_color, win_reason):
+        self._handle_last_move(last_move)
+        self.player.handle_game_end(winner_color, win_reason)
+
+
+# base classes agents may import next to their own subclass, load_player skips them
+LIBRARY_PLAYERS = (Player, BatchedPlayer, BatchedAdapter)
+
+
+def resolve_player_source(source_path):
+    """
+    Resolves the source file that load_player imports for a python source file or python module.
+
+    :param source_path: the path to the source file or the name of the module
+    :return: str -- the absolute path to the source file
+    """
+    if os.path.exists(source_path):
+        return os.path.abspath(source_path)
+
+    spec = importlib.util.find_spec(source_path)
+    if spec is None or spec.origin is None:
+        raise RuntimeError('{} is neither a source file nor an importable module'.format(source_path))
+    return spec.origin
+
 
 def load_player(source_path):
     """
@@ -44,7 +210,8 @@ def load_player(source_path):
         module_name = source_path
 
     module = importlib.import_module(module_name)
-    players = inspect.getmembers(module, lambda o: inspect.isclass(o) and issubclass(o, Player) and o != Player)
+    players = inspect.getmembers(module, lambda o: inspect.isclass(o) and issubclass(o, Player) and
+                                 o not in LIBRARY_PLAYERS)
     if len(players) == 0:
         raise RuntimeError('{} did not contain any subclasses of {}'.format(source_path, Player))
     elif len(players) > 1:
@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+
+"""
+File Name:      selfplay.py
+Author:         agent
+Date:           October 19th, 2026
+
+Description:    Python file used to generate training data by self-play. Game workers run in parallel and append
+                fixed-size (observation, sense, move, outcome) records to memory-mapped .npy shards. A manifest indexes
+                the shards, and ShardReader samples records at random straight from the memory maps.
+"""
+
+import os
+import json
+import random
+import argparse
+import numpy as np
+import chess
+from multiprocessing import Pool
+from player import load_player
+from game import Game
+from move_encoding import pack_move
+from observation_encoder import ObservationEncoder, NUM_PLANES
+
+NO_SENSE = 255      # stored when the agent sensed no valid square
+NO_MOVE = 0xFFFF    # stored when the agent passed
+
+RECORD_DTYPE = np.dtype([
+    ('observation', np.float16, (NUM_PLANES, 8, 8)),        # planes before the sense
+    ('sensed_observation', np.float16, (NUM_PLANES, 8, 8)), # planes after the sense, when the move is chosen
+    ('sense', np.uint8),                                    # the sensed square
+    ('move', np.uint16),                                    # the requested move, packed
+    ('outcome', np.int8),                                   # 1 won, 0 draw, -1 lost, for the color to move
+    ('color', np.uint8),                                    # 1 for WHITE, 0 for BLACK
+    ('ply', np.uint16),
+])
+
+MANIFEST_NAME = 'manifest.json'
+
+
+class ShardWriter(object):
+    """
+    Appends records to memory-mapped .npy shards of a fixed capacity, starting a new shard when one is full.
+    """
+
+    def __init__(self, directory, prefix, shard_size=100000):
+        self.directory = directory
+        self.prefix = prefix
+        self.shard_size = shard_size
+        self.shards = []    # manifest entries of the finished shards
+        self._shard = None
+        self._path = None
+        self._count = 0
+
+    def _rotate(self):
+        self._finish_shard()
+        self._path = '{}-{:05d}.npy'.format(self.prefix, len(self.shards))
+        self._shard = np.lib.format.open_memmap(os.path.join(self.directory, self._path), mode='w+',
+                                                dtype=RECORD_DTYPE, shape=(self.shard_size,))
+        self._count = 0
+
+    def _finish_shard(self):
+        if self._shard is not None:
+            self._shard.flush()
+            self.shards.append({'path': self._path, 'count': self._count})
+            self._shard = None
+
+    def append(self, records):
+        """
+        :param records: numpy.ndarray -- records of RECORD_DTYPE
+        """
+        start = 0
+        while start < len(records):
+            if self._shard is None or self._count == self.shard_size:
+                self._rotate()
+            n = min(len(records) - start, self.shard_size - self._count)
+            self._shard[self._count:self._count + n] = records[start:start + n]
+            self._count += n
+            start += n
+
+    def close(self):
+        """
+        :return: List(dict) -- manifest entries of all shards written
+        """
+        self._finish_shard()
+        return self.shards
+
+
+def play_selfplay_game(white_player, black_player, game):
+    """
+    Plays one quiet game like play_local_game and records every turn.
+
+    :param white_player: Player -- the WHITE agent
+    :param black_player: Player -- the BLACK agent
+    :param game: Game -- the game to play
+
+    :return: numpy.ndarray, chess.WHITE/chess.BLACK/None -- the records of RECORD_DTYPE and the winner color
+    """
+    players = {chess.WHITE: white_player, chess.BLACK: black_player}
+    encoders = {color: ObservationEncoder(seconds_left=game.get_seconds_left()) for color in players}
+    for color, player in players.items():
+        player.handle_game_start(color, chess.Board())
+        encoders[color].handle_game_start(color, chess.Board())
+    game.start()
+
+    turns = []
+    while not game.is_over():
+        color, player, encoder = game.turn, players[game.turn], encoders[game.turn]
+        possible_moves = game.get_moves()
+
+        captured_square = game.opponent_move_result()
+        player.handle_opponent_move_result(captured_square is not None, captured_square)
+        encoder.handle_opponent_move_result(captured_square is not None, captured_square)
+        encoder.update_clock(game.get_seconds_left())
+        observation = encoder.observation().astype(np.float16)
+
+        sense = player.choose_sense(list(chess.SQUARES), possible_moves, game.get_seconds_left())
+        sense_result = game.handle_sense(sense)
+        player.handle_sense_result(sense_result)
+        encoder.handle_sense_result(sense_result)
+        sensed_observation = encoder.observation().astype(np.float16)
+
+        move = player.choose_move(possible_moves, game.get_seconds_left())
+        requested_move, taken_move, captured_square, reason = game.handle_move(move)
+        player.handle_move_result(requested_move, taken_move, reason, captured_square is not None, captured_square)
+        encoder.handle_move_result(requested_move, taken_move, reason, captured_square is not None, captured_square)
+
+        turns.append((color, observation, sensed_observation, sense, requested_move))
+        game.end_turn()
+
+    winner_color, winner_reason = game.get_winner()
+    white_player.handle_game_end(winner_color, winner_reason)
+    black_player.handle_game_end(winner_color, winner_reason)
+
+    records = np.zeros(len(turns), dtype=RECORD_DTYPE)
+    if turns:
+        colors, observations, sensed_observations, senses, requested_moves = zip(*turns)
+        records['observation'] = observations
+        records['sensed_observation'] = sensed_observations
+        records['sense'] = [sense if sense in chess.SQUARES else NO_SENSE for sense in senses]
+        records['move'] = [pack_move(move) if move is not None else NO_MOVE for move in requested_moves]
+        records['color'] = colors
+        records['ply'] = np.arange(len(turns))
+        if winner_color is not None:
+            records['outcome'] = np.where(records['color'] == winner_color, 1, -1)
+    return records, winner_color
+
+
+def _selfplay_worker(worker_id, directory, first_path, second_path, games, shard_size, seed, max_plies):
+    random.seed(seed)
+    np.random.seed(seed % (2 ** 32))
+    _, first_constructor = load_player(first_path)
+    _, second_constructor = load_player(second_path)
+
+    writer = ShardWriter(directory, 'worker{:03d}'.format(worker_id), shard_size)
+    for game_number in range(games):
+        first, second = first_constructor(), second_constructor()
+        white, black = (first, second) if game_number % 2 == 0 else (second, first)
+        records, _ = play_selfplay_game(white, black, Game(max_plies=max_plies))
+        writer.append(records)
+    return writer.close()
+
+
+def run_selfplay(directory, first_path, second_path, games, workers=1, shard_size=100000, seed=0, max_plies=None):
+    """
+    Runs self-play games on a process pool and writes the shards and the manifest.
+
+    :param directory: str -- the output directory
+    :param first_path: str -- path to the source file of the first bot
+    :param second_path: str -- path to the source file of the second bot
+    :param games: int -- the total number of games
+    :param workers: int -- the number of game worker processes
+    :param shard_size: int -- the number of records per shard
+    :param seed: int -- the seed every worker seed is derived from
+    :param max_plies: int -- optional ply limit of every game, see Game
+
+    :return: dict -- the manifest
+    """
+    os.makedirs(directory, exist_ok=True)
+    jobs = [(worker_id, directory, first_path, second_path, games // workers + (worker_id < games % workers),
+             shard_size, seed + worker_id, max_plies) for worker_id in range(workers)]
+    with Pool(workers) as pool:
+        shard_lists = pool.starmap(_selfplay_worker, jobs)
+
+    manifest = {'record_fields': RECORD_DTYPE.names, 'shard_size': shard_size,
+                'shards': [shard for shards in shard_lists for shard in shards]}
+    with open(os.path.join(directory, MANIFEST_NAME), 'w') as f:
+        json.dump(manifest, f, indent=1)
+    return manifest
+
+
+class ShardReader(object):
+    """
+    Read-only view of a self-play directory. Shards are memory-mapped, so records are only read from disk when
+    they are accessed.
+    """
+
+    def __init__(self, directory):
+        with open(os.path.join(directory, MANIFEST_NAME)) as f:
+            self.manifest = json.load(f)
+        self.shards = [np.load(os.path.join(directory, shard['path']), mmap_mode='r')[:shard['count']]
+                       for shard in self.manifest['shards'] if shard['count'] > 0]
+        self.offsets = np.cumsum([0] + [len(shard) for shard in self.shards])
+
+    def __len__(self):
+        return int(self.offsets[-1])
+
+    def __getitem__(self, index):
+        """
+        :return: numpy.void -- the record at a global index, a view into its shard
+        """
+        shard = int(np.searchsorted(self.offsets, index, side='right')) - 1
+        return self.shards[shard][index - self.offsets[shard]]
+
+    def sample(self, batch_size, rng=np.random):
+        """
+        :param batch_size: int -- the number of records to draw
+        :param rng: numpy.random.RandomState -- random source
+        :return: numpy.ndarray -- batch_size records drawn uniformly with replacement
+        """
+        indices = np.sort(rng.randint(0, len(self), batch_size))
+        shard_ids = np.searchsorted(self.offsets, indices, side='right') - 1
+
+        batch = np.empty(batch_size, dtype=RECORD_DTYPE)
+        for shard_id in np.unique(shard_ids):
+            mask = shard_ids == shard_id
+            batch[mask] = self.shards[shard_id][indices[mask] - self.offsets[shard_id]]
+        return batch
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Generates self-play training data in memory-mapped shards.')
+    parser.add_argument('first_path', help='Path to first bot source file.')
+    parser.add_argument('second_path', help='Path to second bot source file.')
+    parser.add_argument('--out', default='SelfPlay', help='Output directory for the shards and the manifest.')
+    parser.add_argument('--games', type=int, default=100, help='Number of games to play.')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help='Number of game worker processes.')
+    parser.add_argument('--shard-size', type=int, default=100000, help='Number of records per shard.')
+    parser.add_argument('--seed', type=int, default=0, help='Seed the worker seeds are derived from.')
+    parser.add_argument('--max-plies', type=int, default=None, help='Adjudicate each game after this many plies.')
+    args = parser.parse_args()
+
+    manifest = run_selfplay(args.out, args.first_path, args.second_path, args.games, workers=args.workers,
+                            shard_size=args.shard_size, seed=args.seed, max_plies=args.max_plies)
+    print('Wrote {} records in {} shards to {}'.format(
+        sum(shard['count'] for shard in manifest['shards']), len(manifest['shards']), args.out))
@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+
+"""
+File Name:      shm_transport.py
+Author:         agent
+Date:           October 19th, 2026
+
+Description:    Python file for running an agent in its own process without pickling observations. The agent is
+                driven with the batched turn protocol (player.BatchedPlayer), so a turn is two messages instead of
+                five. Every message is written into a slot of a multiprocessing.shared_memory ring buffer with a fixed
+                binary layout, and only a two byte control message (call id, slot) and a two byte reply cross the
+                pipe.
+"""
+
+import time
+import struct
+import numpy as np
+import chess
+from multiprocessing import Process, Pipe
+from multiprocessing import shared_memory
+from player import BatchedPlayer, BatchedAdapter, TurnObservation, load_player
+from move_encoding import pack_move, unpack_move, is_packed
+
+# call ids of the control messages
+GAME_START, DECIDE_SENSE, DECIDE_MOVE, GAME_END, CLOSE = range(5)
+
+NONE_SQUARE = -1        # no square, e.g. nothing was captured
+NONE_PIECE = -1         # empty square in a board or sense result
+NONE_MOVE = 0xFFFF      # a pass, or no sense square chosen
+MAX_MOVES = 512
+REASON_BYTES = 256
+
+SLOT_DTYPE = np.dtype([
+    ('seconds_left', np.float64),
+    ('agent_cpu', np.float64),                  # CPU seconds the agent process has used, written with every reply
+    ('color', np.int8),                         # own color at game start, winner color at game end (-1 for none)
+    ('opponent_capture', np.int8),
+    ('has_last_move', np.int8),                 # 1 if requested_move to reason hold the result of the last move
+    ('captured_square', np.int8),               # capture square of the last move
+    ('num_moves', np.uint16),
+    ('moves', np.uint16, MAX_MOVES),            # packed moves, see move_encoding.py
+    ('sense_squares', np.int8, 9),
+    ('sense_pieces', np.int8, 9),
+    ('requested_move', np.uint16),
+    ('taken_move', np.uint16),
+    ('board', np.int8, 64),                     # piece code per square
+    ('move_reason_length', np.uint16),          # reason of the last move
+    ('move_reason', np.uint8, REASON_BYTES),
+    ('reason_length', np.uint16),               # reason of the game end
+    ('reason', np.uint8, REASON_BYTES),
+])
+
+# every message but the game start waits for its reply, so a ring of this many slots is never overwritten before the
+# agent process has read it
+RING_SLOTS = 4
+
+CONTROL = struct.Struct('<BB')
+REPLY = struct.Struct('<H')
+
+
+def _piece_code(piece):
+    return NONE_PIECE if piece is None else int(piece.color) * 6 + piece.piece_type - 1
+
+
+def _code_piece(code):
+    return None if code == NONE_PIECE else chess.Piece(code % 6 + 1, bool(code // 6))
+
+
+def _square_or_none(square):
+    return None if square == NONE_SQUARE else int(square)
+
+
+def _pack_or_none(move):
+    if move is None:
+        return NONE_MOVE
+    return int(move) if is_packed(move) else pack_move(move)
+
+
+def _unpack_or_none(code):
+    return None if code == NONE_MOVE else unpack_move(code)
+
+
+class SharedRing(object):
+    """
+    A ring of SLOT_DTYPE slots in shared memory, viewed as a NumPy record array from both processes.
+    """
+
+    def __init__(self, name=None, slots=RING_SLOTS):
+        size = SLOT_DTYPE.itemsize * slots
+        if name is None:
+            self.memory = shared_memory.SharedMemory(create=True, size=size)
+        else:
+            self.memory = shared_memory.SharedMemory(name=name)
+        self.slots = np.ndarray((slots,), dtype=SLOT_DTYPE, buffer=self.memory.buf)
+        self.next_slot = 0
+
+    def claim(self):
+        """
+        :return: int, numpy.void -- the index and the view of the next slot to write
+        """
+        index = self.next_slot
+        self.next_slot = (self.next_slot + 1) % len(self.slots)
+        return index, self.slots[index]
+
+    def close(self, unlink=False):
+        self.slots = None
+        self.memory.close()
+        if unlink:
+            self.memory.unlink()
+
+
+def _write_moves(slot, moves):
+    codes = moves if isinstance(moves, np.ndarray) else [pack_move(move) for move in moves]
+    if len(codes) > MAX_MOVES:
+        raise ValueError('{} moves do not fit the {} move slot'.format(len(codes), MAX_MOVES))
+    slot['num_moves'] = len(codes)
+    slot['moves'][:len(codes)] = codes
+
+
+def _write_reason(slot, reason, field='reason'):
+    data = (reason or '').encode()[:REASON_BYTES]
+    slot[field + '_length'] = len(data)
+    slot[field][:len(data)] = np.frombuffer(data, dtype=np.uint8)
+
+
+def _read_reason(slot, field='reason'):
+    return slot[field][:slot[field + '_length']].tobytes().decode(errors='replace')
+
+
+class RemotePlayer(BatchedPlayer):
+    """
+    Player proxy that runs the agent from source_path in a separate process. Use it in place of the agent's own
+    constructor, e.g. RemotePlayer('random_agent.py'), and call close() when it is no longer needed.
+    """
+
+    def __init__(self, source_path):
+        super().__init__()
+        self.ring = SharedRing()
+        self.connection, child_connection = Pipe()
+        self.process = Process(target=_agent_process, args=(source_path, self.ring.memory.name, child_connection),
+                               daemon=True)
+        self.process.start()
+        self.cpu_seconds = 0.0
+
+    def _send(self, call, slot_index):
+        self.connection.send_bytes(CONTROL.pack(call, slot_index))
+
+    def _call(self, call, slot_index):
+        self._send(call, slot_index)
+        reply = REPLY.unpack(self.connection.recv_bytes())[0]
+        self.cpu_seconds = float(self.ring.slots[slot_index]['agent_cpu'])
+        return reply
+
+    def external_cpu_seconds(self):
+        return self.cpu_seconds
+
+    def _write_last_move(self, slot, last_move):
+        slot['has_last_move'] = last_move is not None
+        if last_move is not None:
+            requested_move, taken_move, reason, captured_square = last_move
+            slot['requested_move'] = _pack_or_none(requested_move)
+            slot['taken_move'] = _pack_or_none(taken_move)
+            slot['captured_square'] = NONE_SQUARE if captured_square is None else captured_square
+            _write_reason(slot, reason, 'move_reason')
+
+    def handle_game_start(self, color, board):
+        index, slot = self.ring.claim()
+        slot['color'] = int(color)
+        slot['board'] = [_piece_code(board.piece_at(square)) for square in chess.SQUARES]
+        self._send(GAME_START, index)
+
+    def decide_sense(self, observation):
+        index, slot = self.ring.claim()
+        slot['opponent_capture'] = NONE_SQUARE if observation.opponent_capture is None else observation.opponent_capture
+        self._write_last_move(slot, observation.last_move)
+        slot['seconds_left'] = observation.seconds_left
+        _write_moves(slot, observation.possible_moves)
+        square = self._call(DECIDE_SENSE, index)
+        return None if square == NONE_MOVE else square
+
+    def decide_move(self, observation):
+        # the agent process kept the possible moves of the sense decision
+        index, slot = self.ring.claim()
+        slot['seconds_left'] = observation.seconds_left
+        slot['sense_squares'] = NONE_SQUARE
+        for i, (square, piece) in enumerate(observation.sense_result):
+            slot['sense_squares'][i] = square
+            slot['sense_pieces'][i] = _piece_code(piece)
+        return _unpack_or_none(self._call(DECIDE_MOVE, index))
+
+    def finish_game(self, last_move, winner_color, win_reason):
+        index, slot = self.ring.claim()
+        self._write_last_move(slot, last_move)
+        slot['color'] = -1 if winner_color is None else int(winner_color)
+        _write_reason(slot, win_reason)
+        self._call(GAME_END, index)
+
+    def close(self):
+        """
+        Stops the agent process and frees the shared memory.
+        """
+        if self.process is not None:
+            self._send(CLOSE, 0)
+            self.process.join()
+            self.process = None
+            self.ring.close(unlink=True)
+
+
+def _read_last_move(slot):
+    if not slot['has_last_move']:
+        return None
+    return (_unpack_or_none(slot['requested_move']), _unpack_or_none(slot['taken_move']),
+            _read_reason(slot, 'move_reason'), _square_or_none(slot['captured_square']))
+
+
+def _agent_process(source_path, memory_name, connection):
+    """
+    The loop of the agent process: reads each message from its ring slot, calls the agent and replies to every message
+    but the game start. Agents with the five Player callbacks are run through a BatchedAdapter.
+    """
+    _, constructor = load_player(source_path)
+    player = constructor()
+    if not isinstance(player, BatchedPlayer):
+        player = BatchedAdapter(player)
+    ring = SharedRing(memory_name)
+    observation = None
+
+    def reply(value):
+        slot['agent_cpu'] = time.process_time() + player.external_cpu_seconds()
+        connection.send_bytes(REPLY.pack(value))
+
+    while True:
+        call, slot_index = CONTROL.unpack(connection.recv_bytes())
+        slot = ring.slots[slot_index]
+
+        if call == GAME_START:
+            board = chess.Board.empty()
+            for square, code in enumerate(slot['board']):
+                if code != NONE_PIECE:
+                    board.set_piece_at(square, _code_piece(code))
+            board.set_castling_fen('KQkq')
+            player.handle_game_start(bool(slot['color']), board)
+        elif call == DECIDE_SENSE:
+            codes = slot['moves'][:slot['num_moves']].copy()
+            observation = TurnObservation(_square_or_none(slot['opponent_capture']), _read_last_move(slot),
+                                          codes if player.packed_moves else [unpack_move(code) for code in codes],
+                                          float(slot['seconds_left']))
+            square = player.decide_sense(observation)
+            reply(NONE_MOVE if square not in chess.SQUARES else int(square))
+        elif call == DECIDE_MOVE:
+            sense_result = [(int(square), _code_piece(code))
+                            for square, code in zip(slot['sense_squares'], slot['sense_pieces'])
+                            if square != NONE_SQUARE]
+            move = player.decide_move(observation.with_sense_result(sense_result, float(slot['seconds_left'])))
+            reply(_pack_or_none(move))
+        elif call == GAME_END:
+            winner_color = None if slot['color'] == -1 else bool(slot['color'])
+            player.finish_game(_read_last_move(slot), winner_color, _read_reason(slot))
+            reply(0)
+        elif call == CLOSE:
+            break
+
+    # the slot view has to be released before the shared memory can be closed
+    slot = None
+    ring.close()
@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+
+"""
+File Name:      agent_registry.py
+Author:         agent
+Date:           October 19th, 2026
+Description:    Python file with a registry of the agents in a bots directory. The directory is scanned once into a
+                cached manifest of every agent's file hash, class name, data files and fingerprint, read from the
+                source without importing it, so a tournament over hundreds of bot snapshots starts without importing
+                any of them. An agent is imported on first use, as its own module, without leaving its directory on
+                sys.path.
+"""
+
+import os
+import re
+import time
+import ast
+import sys
+import json
+import hashlib
+import inspect
+import importlib.util
+import argparse
+from player import Player, LIBRARY_PLAYERS, load_player
+from result_cache import agent_fingerprint
+
+MANIFEST_NAME = '.agent_manifest.json'
+MANIFEST_VERSION = 1
+BASE_NAMES = {cls.__name__ for cls in LIBRARY_PLAYERS}
+
+
+def _file_stat(path):
+    # modification time and size, None for a missing file
+    if not os.path.exists(path):
+        return None
+    stat = os.stat(path)
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def _sha256(path):
+    sha = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+
+def _base_name(node):
+    # name of a class base, e.g. Player for both Player and player.Player
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    return None
+
+
+def read_agent_class(path):
+    """
+    Finds the Player subclass of a source file without importing it. This only succeeds for files that define
+    exactly one direct subclass of a player.py base class and import no other classes it could pick up, which is
+    the layout of the agents in this repository.
+
+    :param path: str -- the source file of the agent
+    :return: str, List(str) -- the class name and its data_files
+             None -- if the file has to be imported to tell, see load_player
+    """
+    with open(path, 'rb') as f:
+        tree = ast.parse(f.read(), filename=path)
+
+    candidates = []
+    for node in tree.body:
+        if isinstance(node, ast.ImportFrom) and node.module not in ('player', 'chess'):
+            # an imported class could be another Player subclass, which load_player would also count
+            if any(alias.name == '*' or alias.name[:1].isupper() for alias in node.names):
+                return None
+        elif isinstance(node, ast.ClassDef):
+            bases = [_base_name(base) for base in node.bases]
+            if any(base in BASE_NAMES for base in bases):
+                candidates.append(node)
+            elif any(base in {candidate.name for candidate in candidates} for base in bases):
+                return None
+
+    if len(candidates) != 1:
+        return None
+    data_files = []
+    for node in candidates[0].body:
+        if isinstance(node, ast.Assign) and any(getattr(target, 'id', None) == 'data_files'
+                                                for target in node.targets):
+            try:
+                data_files = list(ast.literal_eval(node.value))
+            except ValueError:
+                return None
+    return candidates[0].name, data_files
+
+
+def _import_isolated(module_name, path):
+    """
+    Imports a source file as its own module. Its directory is on sys.path only while the file runs, and the modules
+    it imports from its directory are private to it, so snapshots with helper modules of the same name do not mix.
+    """
+    path = os.path.abspath(path)
+    directory = os.path.dirname(path)
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    before = set(sys.modules)
+    sys.modules[module_name] = module
+    sys.path.insert(0, directory)
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[module_name]
+        raise
+    finally:
+        sys.path.remove(directory)
+        for name in set(sys.modules) - before - {module_name}:
+            origin = getattr(sys.modules[name], '__file__', None)
+            if origin is not None and os.path.dirname(os.path.abspath(origin)) == directory:
+                del sys.modules[name]
+    return module
+
+
+def _module_name(path, sha):
+    # one module per file content, so agent files with the same name in different directories do not mix
+    return '_agent_{}_{}'.format(re.sub(r'\W', '_', os.path.splitext(os.path.basename(path))[0]), sha[:16])
+
+
+def _player_class(module, source_path):
+    # the same rule as load_player
+    players = inspect.getmembers(module, lambda o: inspect.isclass(o) and issubclass(o, Player) and
+                                 o not in LIBRARY_PLAYERS)
+    if len(players) != 1:
+        raise RuntimeError('{} must contain exactly 1 subclass of {}, found {}'.format(source_path, Player, players))
+    return players[0]
+
+
+class AgentRegistry(object):
+    """
+    The agents of a bots directory by their path, e.g. 'bots/random_agent.py'. The manifest is rewritten by scan and
+    only files whose size or modification time changed are hashed and parsed again.
+    """
+
+    def __init__(self, bots_dir, manifest_path=None):
+        """
+        :param bots_dir: str -- the directory of the agent source files, one agent per .py file
+        :param manifest_path: str -- where the manifest is cached, MANIFEST_NAME inside bots_dir if None
+        """
+        self.bots_dir = bots_dir
+        self.manifest_path = manifest_path or os.path.join(bots_dir, MANIFEST_NAME)
+        self.entries = {}
+        self._loaded = {}
+        self.scan()
+
+    def scan(self):
+        """
+        Brings the manifest up to date with the bots directory.
+
+        :return: int -- the number of agents that had to be hashed again
+        """
+        cached = {}
+        if os.path.exists(self.manifest_path):
+            try:
+                with open(self.manifest_path) as f:
+                    manifest = json.load(f)
+                if manifest.get('version') == MANIFEST_VERSION:
+                    cached = manifest['agents']
+            except ValueError:
+                pass    # a broken manifest is rebuilt
+
+        entries = {}
+        rehashed = 0
+        for name in sorted(os.listdir(self.bots_dir)):
+            path = os.path.join(self.bots_dir, name)
+            if not name.endswith('.py') or name.startswith('_') or not os.path.isfile(path):
+                continue
+            entry = cached.get(name)
+            if entry is None or not self._is_current(entry, path):
+                entry = self._scan_agent(name, path, entry)
+                rehashed += 1
+            entries[name] = entry
+
+        self.entries = {os.path.join(self.bots_dir, name): entry for name, entry in entries.items()
+                        if entry['class_name'] is not None}
+        if entries != cached:
+            temporary_path = self.manifest_path + '.tmp'
+            with open(temporary_path, 'w') as f:
+                json.dump({'version': MANIFEST_VERSION, 'agents': entries}, f, indent=1, sort_keys=True)
+            os.replace(temporary_path, self.manifest_path)
+        return rehashed
+
+    def _is_current(self, entry, path):
+        files = {os.path.basename(path): path}
+        files.update({data_file: os.path.join(self.bots_dir, data_file) for data_file in entry['data_files']})
+        return all(entry['stats'].get(name) == _file_stat(file_path) for name, file_path in files.items())
+
+    def _scan_agent(self, name, path, entry):
+        """
+        :return: dict -- the manifest entry of one source file, class_name is None if the file is not an agent, so
+                 helper modules are not imported again on the next scan
+        """
+        sha = _sha256(path)
+        if entry is not None and entry['sha256'] == sha:
+            agent = entry['class_name'], entry['data_files']    # only a data file or the modification time changed
+        else:
+            try:
+                agent = read_agent_class(path)
+            except SyntaxError:
+                agent = None, []
+            if agent is None:
+                try:
+                    module = _import_isolated('_agent_scan_{}'.format(sha[:16]), path)
+                    class_name, constructor = _player_class(module, path)
+                    agent = class_name, list(constructor.data_files)
+                except Exception:
+                    agent = None, []    # helper modules and broken agents are left out of the registry
+                finally:
+                    sys.modules.pop('_agent_scan_{}'.format(sha[:16]), None)
+
+        class_name, data_files = agent
+        stats = {name: _file_stat(path)}
+        stats.update({data_file: _file_stat(os.path.join(self.bots_dir, data_file)) for data_file in data_files})
+        return {'sha256': sha, 'class_name': class_name, 'data_files': data_files, 'stats': stats,
+                'module': _module_name(name, sha),
+                'fingerprint': agent_fingerprint(path, data_files=data_files)}
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    def __contains__(self, path):
+        return path in self.entries
+
+    def fingerprint(self, path):
+        """
+        :return: str -- the agent fingerprint of result_cache.py, without importing the agent
+        """
+        return self.entries[path]['fingerprint']
+
+    def load(self, path):
+        """
+        Imports the agent on its first use.
+
+        :param path: str -- the path of the agent in the registry
+        :return: Tuple where the first element is the name of the loaded class, and the second element is the class
+                 type, like load_player
+        """
+        if path not in self._loaded:
+            entry = self.entries[path]
+            module = sys.modules.get(entry['module']) or _import_isolated(entry['module'], os.path.abspath(path))
+            constructor = getattr(module, entry['class_name'], None)
+            if not (inspect.isclass(constructor) and issubclass(constructor, Player)):
+                raise RuntimeError('{} does not define the Player subclass {}, rescan the registry'.format(
+                    path, entry['class_name']))
+            self._loaded[path] = entry['class_name'], constructor
+        return self._loaded[path]
+
+
+class AgentLoader(object):
+    """
+    Lazily loads the agents of a tournament: agents of the registry through it, any other source file as its own
+    module named after its hash like the registry does, and module names with load_player.
+    """
+
+    def __init__(self, registry=None):
+        self.registry = registry
+        self._loaded = {}
+        self._fingerprints = {}
+
+    def _in_registry(self, path):
+        return self.registry is not None and path in self.registry
+
+    def load(self, path):
+        if self._in_registry(path):
+            return self.registry.load(path)
+        if path not in self._loaded:
+            if os.path.isfile(path):
+                module_name = _module_name(path, _sha256(path))
+                module = sys.modules.get(module_name) or _import_isolated(module_name, path)
+                self._loaded[path] = _player_class(module, path)
+            else:
+                self._loaded[path] = load_player(path)
+        return self._loaded[path]
+
+    def fingerprint(self, path):
+        if self._in_registry(path):
+            return self.registry.fingerprint(path)
+        if path not in self._fingerprints:
+            self._fingerprints[path] = agent_fingerprint(path, self.load(path)[1])
+        return self._fingerprints[path]
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Scans a bots directory and lists its agents.')
+    parser.add_argument('bots_dir', help='Directory of the bot source files.')
+    parser.add_argument('--manifest', default=None, help='The manifest file, .agent_manifest.json in bots_dir if unset.')
+    args = parser.parse_args()
+
+    start = time.time()
+    registry = AgentRegistry(args.bots_dir, args.manifest)
+    for path, entry in registry.entries.items():
+        print("{:<40} {:<20} {}".format(path, entry['class_name'], entry['fingerprint'][:16]))
+    print("{} agents in {:.3f} seconds".format(len(registry), time.time() - start))
@@ -15,6 +15,8 @@ import chess
 import tkinter as tk
 import tkinter.font as tkFont
 import time
+import queue
+from multiprocessing import Process, Queue
 
 class ChessboardGUI():
 
@@ -192,6 +194,69 @@ class ChessboardGUI():
 
         button.wait_window(top)
 
+
+class AsyncChessboardGUI(object):
+    """
+    ChessboardGUI running in its own process. update_board only puts the board on a queue and returns at once, so the
+    game never waits for a redraw. When the window falls behind it skips to the newest board, and it redraws at most
+    max_fps times per second.
+    """
+
+    def __init__(self, names=None, max_fps=20):
+        self.queue = Queue()
+        self.process = Process(target=_render_loop, args=(self.queue, names, max_fps), daemon=True)
+        self.process.start()
+
+    def update_board(self, fen):
+        self.queue.put(('board', fen))
+
+    def game_over(self, message):
+        """
+        Shows the message once every board before it has been drawn and waits until the window is closed.
+        """
+        self.queue.put(('game_over', message))
+        self.process.join()
+
+    def close(self):
+        self.queue.put(('close', None))
+        self.process.join()
+
+
+def _render_loop(frames, names, max_fps):
+    gui = ChessboardGUI(names=names)
+    interval = max(1, int(1000 / max_fps))
+    drawn_fen = None
+
+    def poll():
+        nonlocal drawn_fen
+        fen, message, close = None, None, False
+        # coalesce everything queued since the last frame into the newest board
+        while True:
+            try:
+                kind, value = frames.get_nowait()
+            except queue.Empty:
+                break
+            if kind == 'board':
+                fen = value
+            elif kind == 'game_over':
+                message = value
+            else:
+                close = True
+
+        if fen is not None and fen != drawn_fen:
+            gui.update_board(fen)
+            drawn_fen = fen
+        if message is not None:
+            gui.game_over(message)
+        if message is not None or close:
+            gui.win.destroy()
+        else:
+            gui.win.after(interval, poll)
+
+    gui.win.after(0, poll)
+    gui.win.mainloop()
+
+
 if __name__ == '__main__':
     recon_game = ChessboardGUI()
     recon_game.update_board('rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR')
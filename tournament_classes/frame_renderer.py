@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+
+"""
+File Name:      frame_renderer.py
+Author:         agent
+Date:           October 19th, 2026
+Description:    Python file used to render recorded games to PNG or SVG frames without a display. The boards are read
+                from the game history files, every ply becomes one frame, and only the squares that changed since the
+                previous ply are drawn again. PNG output needs Pillow, SVG output has no extra dependencies.
+"""
+
+import os
+import base64
+import argparse
+from multiprocessing import Pool
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+SPRITE_SIZE = 80    # size in pixels of the images in res/
+RES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'res')
+DARK_SQUARE_COLOR = '#8B4513'
+LIGHT_SQUARE_COLOR = '#DEB887'
+EMPTY_BOARD = '0' * 64
+
+
+def fen_to_squares(fen):
+    """
+    :param fen: str -- a board fen, the piece placement part is enough
+    :return: str -- 64 characters from a8 to h1, the piece symbol of every square or '0' when it is empty
+    """
+    squares = []
+    for f in fen.split()[0]:
+        if f.isalpha():
+            squares.append(f)
+        elif f.isnumeric():
+            squares.append('0' * int(f))
+    return ''.join(squares)
+
+
+def _square_index(name):
+    # index of a square name like 'e4' in the format of fen_to_squares
+    return (8 - int(name[1])) * 8 + ord(name[0]) - ord('a')
+
+
+def apply_move(squares, uci):
+    """
+    Plays a move that the game has already revised on a board in the format of fen_to_squares, including castling,
+    en passant and promotions.
+
+    :param squares: str -- the board before the move
+    :param uci: str -- the taken move, e.g. 'e2e4' or 'e7e8q'
+    :return: str -- the board after the move
+    """
+    board = list(squares)
+    start, end = _square_index(uci[0:2]), _square_index(uci[2:4])
+    piece = board[start]
+    if piece in 'Pp' and start % 8 != end % 8 and board[end] == '0':
+        board[start - start % 8 + end % 8] = '0'    # en passant
+    if piece in 'Kk' and abs(start - end) == 2:
+        rook_start, rook_end = (start + 3, start + 1) if end > start else (start - 4, start - 1)
+        board[rook_end], board[rook_start] = board[rook_start], '0'
+    if len(uci) == 5:
+        piece = uci[4].upper() if piece.isupper() else uci[4].lower()
+    board[start], board[end] = '0', piece
+    return ''.join(board)
+
+
+def read_history_boards(path):
+    """
+    Reads the board printed after every 'Current Board State' line of a game history file, which is the truth board
+    in the true_boards and RRGameHistory files, and the board after the last move, which the file does not print.
+
+    :param path: str -- the history file
+    :return: List(str) -- the boards in the format of fen_to_squares
+    """
+    boards = []
+    rows = None
+    last_move = None
+    with open(path) as f:
+        for line in f:
+            if line.startswith('#') and line.rstrip().endswith('Current Board State'):
+                rows = []
+                last_move = None
+            elif rows is not None and line[:1].isdigit() and line[1:2] == '|':
+                rows.append(''.join(cell.strip() or '0' for cell in line.split('|')[1:9]))
+                if len(rows) == 8:
+                    boards.append(''.join(rows))
+                    rows = None
+            elif boards and 'Move taken: ' in line:
+                last_move = line.rsplit('Move taken: ', 1)[1].strip()
+    if last_move is not None:
+        boards.append(boards[-1] if last_move == 'None' else apply_move(boards[-1], last_move))
+    return boards
+
+
+def _sprite_path(piece):
+    return os.path.join(RES_DIR, ('black_%s.png' if piece.islower() else 'white_%s.png') % piece)
+
+
+def _is_dark(square):
+    return (square % 8 + square // 8) % 2 == 1
+
+
+# caches of the current process, filled on first use
+_tiles = {}
+_sprite_uris = {}
+_svg_squares = {}
+
+
+def _tile(piece, dark, square_size):
+    """
+    :return: PIL.Image.Image -- a square of the given color with the piece sprite drawn on it
+    """
+    key = (piece, dark, square_size)
+    if key not in _tiles:
+        tile = Image.new('RGBA', (square_size, square_size), DARK_SQUARE_COLOR if dark else LIGHT_SQUARE_COLOR)
+        if piece != '0':
+            sprite = Image.open(_sprite_path(piece)).convert('RGBA')
+            if square_size != SPRITE_SIZE:
+                sprite = sprite.resize((square_size, square_size), Image.LANCZOS)
+            tile.alpha_composite(sprite)
+        _tiles[key] = tile.convert('RGB')
+    return _tiles[key]
+
+
+def _sprite_uri(piece):
+    if piece not in _sprite_uris:
+        with open(_sprite_path(piece), 'rb') as f:
+            _sprite_uris[piece] = 'data:image/png;base64,' + base64.b64encode(f.read()).decode()
+    return _sprite_uris[piece]
+
+
+def _svg_square(square, piece, square_size):
+    key = (square, piece, square_size)
+    if key not in _svg_squares:
+        x, y = (square % 8) * square_size, (square // 8) * square_size
+        color = DARK_SQUARE_COLOR if _is_dark(square) else LIGHT_SQUARE_COLOR
+        element = '<rect x="{}" y="{}" width="{s}" height="{s}" fill="{}"/>'.format(x, y, color, s=square_size)
+        if piece != '0':
+            element += '<use href="#{}" x="{}" y="{}"/>'.format(piece, x, y)
+        _svg_squares[key] = element
+    return _svg_squares[key]
+
+
+def _svg_document(board, square_size):
+    size = square_size * 8
+    sprites = ''.join('<image id="{}" width="{s}" height="{s}" href="{}"/>'.format(piece, _sprite_uri(piece),
+                                                                                 s=square_size)
+                      for piece in sorted(set(board) - {'0'}))
+    return ''.join(['<svg xmlns="http://www.w3.org/2000/svg" width="{s}" height="{s}">'.format(s=size),
+                    '<defs>', sprites, '</defs>'] +
+                   [_svg_square(square, piece, square_size) for square, piece in enumerate(board)] +
+                   ['</svg>\n'])
+
+
+def render_game(boards, out_dir, fmt='png', square_size=SPRITE_SIZE):
+    """
+    Writes one frame per board, named frame_0001.png and so on.
+
+    :param boards: List(str) -- the boards of the game in the format of fen_to_squares
+    :param out_dir: str -- directory for the frames, it is created if needed
+    :param fmt: str -- 'png' or 'svg'
+    :param square_size: int -- size of a square in pixels
+
+    :return: List(str) -- paths of the written frames
+    """
+    if fmt == 'png' and Image is None:
+        raise ImportError("PNG frames need Pillow (pip install pillow), use the svg format otherwise")
+    os.makedirs(out_dir, exist_ok=True)
+
+    paths = []
+    canvas = None
+    shown = None
+    for number, board in enumerate(boards, 1):
+        path = os.path.join(out_dir, 'frame_{:04d}.{}'.format(number, fmt))
+        if fmt == 'png':
+            if canvas is None:
+                canvas = Image.new('RGB', (square_size * 8, square_size * 8))
+                shown = None
+            # only the squares that changed since the last frame are pasted onto the canvas again
+            for square, piece in enumerate(board):
+                if shown is None or shown[square] != piece:
+                    canvas.paste(_tile(piece, _is_dark(square), square_size),
+                                 ((square % 8) * square_size, (square // 8) * square_size))
+            shown = board
+            canvas.save(path)
+        else:
+            with open(path, 'w') as f:
+                f.write(_svg_document(board, square_size))
+        paths.append(path)
+    return paths
+
+
+def _render_history(arguments):
+    history_path, out_dir, fmt, square_size = arguments
+    name = os.path.splitext(os.path.basename(history_path))[0]
+    return len(render_game(read_history_boards(history_path), os.path.join(out_dir, name), fmt, square_size))
+
+
+def render_histories(history_paths, out_dir, fmt='png', square_size=SPRITE_SIZE, workers=1):
+    """
+    Renders many history files on a process pool, each one into its own directory below out_dir.
+
+    :return: int -- the total number of frames written
+    """
+    jobs = [(path, out_dir, fmt, square_size) for path in history_paths]
+    with Pool(workers) as pool:
+        return sum(pool.imap_unordered(_render_history, jobs))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Renders game history files to PNG or SVG frames.')
+    parser.add_argument('history_paths', nargs='+', help='Paths to true_boards or RRGameHistory files.')
+    parser.add_argument('--out', default='Frames', help='Output directory, every game gets its own directory.')
+    parser.add_argument('--format', default='png', choices=['png', 'svg'], help='Format of the frames.')
+    parser.add_argument('--square-size', type=int, default=SPRITE_SIZE, help='Size of a square in pixels.')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help='Number of render processes.')
+    args = parser.parse_args()
+
+    frames = render_histories(args.history_paths, args.out, fmt=args.format, square_size=args.square_size,
+                              workers=args.workers)
+    print('Wrote {} frames of {} games to {}'.format(frames, len(args.history_paths), args.out))
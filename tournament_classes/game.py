@@ -9,12 +9,22 @@ Source:         Adapted from recon-chess (https://pypi.org/project/reconchess/)
 """
 
 import chess
-from datetime import datetime
+import time
+from move_encoding import is_packed, unpack_move, packed_recon_moves
+
+# material values used when adjudicating a game that reached one of its limits
+PIECE_VALUES = {chess.PAWN: 1, chess.KNIGHT: 3, chess.BISHOP: 3, chess.ROOK: 5, chess.QUEEN: 9}
+
+# clocks a game can charge its players with. 'wall' is the time that passed, 'thread' and 'process' only count the CPU
+# time used by the game's thread or process, so games sharing busy cores do not lose time to each other. CPU time an
+# agent spends in other processes is charged on top through Player.external_cpu_seconds (see charge). 'thread' does
+# not see the agent's other threads, so it is only valid for single-threaded agents; use 'process' for the others.
+CLOCKS = {'wall': time.time, 'thread': time.thread_time, 'process': time.process_time}
 
 
 class Game:
 
-    def __init__(self, seconds_left=300):
+    def __init__(self, seconds_left=300, max_plies=None, no_progress_plies=None, material_margin=None, clock='wall'):
         self.turn = chess.WHITE  # True for white, False for black
 
         self.board_is_real = chess.Board()
@@ -34,11 +44,20 @@ class Game:
 
         self.move_result = None
 
+        # adjudication rules, each one is disabled when set to None
+        self.max_plies = max_plies                  # game ends after this many plies
+        self.no_progress_plies = no_progress_plies  # game ends after this many plies without a capture or pawn move
+        self.material_margin = material_margin      # material lead needed to win a game ended by one of the limits
+
+        if clock not in CLOCKS:
+            raise ValueError("Unknown clock '{}', use one of {}".format(clock, ', '.join(CLOCKS)))
+        self.clock = CLOCKS[clock]  # returns the current time in seconds on the basis the players are charged on
+
     def starting_timer(self):
         """
         Starts off the clock for the first player.
         """
-        self.curr_time = datetime.now()
+        self.curr_time = self.clock()
 
     def end(self):
         """
@@ -52,7 +71,7 @@ class Game:
         :return: float -- The amount of seconds left for the current player.
         """
         if not self.is_finished and self.curr_time:
-            elapsed_since_turn_start = (datetime.now() - self.curr_time).total_seconds()
+            elapsed_since_turn_start = self.clock() - self.curr_time
             return self.time_left_color[self.turn] - elapsed_since_turn_start
         else:
             return self.time_left_color[self.turn]
@@ -120,6 +139,17 @@ class Game:
         return self._moves_no_opp_pieces(self.board_is_real, self.turn) + \
                self._pawn_on(self.board_is_real, self.turn)
 
+    def get_packed_moves(self):
+        """
+        Returns the moves of get_moves packed into a NumPy uint16 array, see move_encoding.py for the layout. They are
+        generated from the bitboards of the truth board without creating any chess.Move objects.
+        :return: numpy.ndarray
+        """
+        if self.is_finished:
+            return None
+
+        return packed_recon_moves(self.board_is_real, self.turn)
+
     ###=== Make move and update board ===###
     def _where_are_captured_pieces(self, board, move):
         """
@@ -201,7 +231,7 @@ class Game:
     def handle_move(self, requested_move):
         """
         Takes in the agent requested move and updatest he board accordingly with any possible rule revision
-        :param requested_move: chess.Move -- the move the agent requested
+        :param requested_move: chess.Move or int -- the move the agent requested, a packed move is decoded first
 
         :return requested_move: chess.Move -- the move the agent requested
         :return taken_move: chess.Move -- the move that was actually taken
@@ -212,6 +242,9 @@ class Game:
         if self.is_finished:
             return requested_move, None, None, ""
 
+        if is_packed(requested_move):
+            requested_move = unpack_move(requested_move)
+
         if requested_move is None:
             taken_move = None  # pass move
             captured_square = None  # doesn't capture anything
@@ -283,6 +316,16 @@ class Game:
         return self.move_result
 
     ###=== Switch player to move ===###
+    def charge(self, seconds):
+        """
+        Charges the player to move for CPU time its agent used outside the clock of this game, e.g. in a process
+        pool or an agent process. The wall clock already saw that time pass, so only CPU clocks charge it.
+
+        :param seconds: float -- the CPU seconds to charge
+        """
+        if self.clock is not time.time:
+            self.time_left_color[self.turn] -= seconds
+
     def end_turn(self):
         """
         Ends the turn for the game and updates the following
@@ -291,14 +334,15 @@ class Game:
             . Starts the timer for the next player
         """
 
-        elapsed = datetime.now() - self.curr_time
-        self.time_left_color[self.turn] -= elapsed.total_seconds()
+        elapsed = self.clock() - self.curr_time
+        self.time_left_color[self.turn] -= elapsed
 
         self.turn = not self.turn
 
     def is_over(self):
         """
-        The function determines whether the game is over based on missing King or time_left is less than 0
+        The function determines whether the game is over based on missing King, time_left is less than 0 or
+        one of the adjudication limits being reached
 
         :return: bool -- True if the game is over, False otherwise
         """
@@ -307,13 +351,14 @@ class Game:
 
         no_time_left = self.time_left_color[chess.WHITE] <= 0 or self.time_left_color[chess.BLACK] <= 0
         king_captured = self.board_is_real.king(chess.WHITE) is None or self.board_is_real.king(chess.BLACK) is None
-        return no_time_left or king_captured
+        return no_time_left or king_captured or self._adjudication_limit() is not None
 
     def get_winner(self):
         """
         This function determines the winner color and the reason for the win
 
         :return: chess.WHITE/chess.BLACK, str -- the winning color, a string detailing the winning reason
+                 None, str -- if the game was adjudicated as a draw, a string detailing the adjudication reason
         """
         if not self.is_over():
             return None
@@ -327,3 +372,36 @@ class Game:
             return chess.BLACK, "BLACK won by king capture."
         elif self.board_is_real.king(chess.BLACK) is None:
             return chess.WHITE, "WHITE won by king capture."
+
+        limit = self._adjudication_limit()
+        if limit is None:
+            return None
+        if self.material_margin is not None:
+            material_lead = self._material(chess.WHITE) - self._material(chess.BLACK)
+            if material_lead >= self.material_margin:
+                return chess.WHITE, "WHITE won by material adjudication at the {}.".format(limit)
+            elif -material_lead >= self.material_margin:
+                return chess.BLACK, "BLACK won by material adjudication at the {}.".format(limit)
+        return None, "Draw by {}.".format(limit)
+
+    ###=== Adjudication ===###
+    def _material(self, color):
+        """
+        :param color: chess.WHITE/chess.BLACK -- the color to count the material of
+        :return: int -- the material value of the given color's pieces on the truth board
+        """
+        return sum(len(self.board_is_real.pieces(piece_type, color)) * value for piece_type, value in PIECE_VALUES.items())
+
+    def _adjudication_limit(self):
+        """
+        Checks the configured adjudication limits against the truth board.
+
+        :return: str -- the name of the limit that has been reached
+                 None -- if no limit has been reached
+        """
+        if self.max_plies is not None and len(self.board_is_real.move_stack) >= self.max_plies:
+            return "ply limit"
+        if self.no_progress_plies is not None and self.board_is_real.halfmove_clock >= self.no_progress_plies:
+            return "no capture or pawn move limit"
+        return None
+
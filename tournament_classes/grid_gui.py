@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+
+"""
+File Name:      grid_gui.py
+Author:         agent
+Date:           October 19th, 2026
+Description:    Python file used to watch many games of recon chess at once. Small boards are laid out in a grid and
+                share one set of piece sprites. Only the squares that changed are redrawn, and every frame redraws at
+                most a fixed number of squares over all boards, so the viewer keeps up with many parallel games.
+"""
+
+import os
+import argparse
+import queue
+import tkinter as tk
+from multiprocessing import Process, Queue
+from player import load_player
+from play_game import play_local_game, Verbosity, VERBOSITY_LEVELS
+from frame_renderer import SPRITE_SIZE, RES_DIR, fen_to_squares
+
+
+class GridGUI(object):
+    """
+    Window with a grid of small boards. set_board only stores the newest position of a board, draw applies the stored
+    positions within a budget of redrawn squares.
+    """
+
+    def __init__(self, num_boards, columns=8, shrink=4, names=None):
+        """
+        :param num_boards: int -- the number of boards in the grid
+        :param columns: int -- the number of boards per row
+        :param shrink: int -- the sprites are shrunk by this factor, a board is 8 * SPRITE_SIZE / shrink pixels wide
+        :param names: List(str) -- optional initial label of every board
+        """
+        self.DARK_SQUARE_COLOR = '#8B4513'
+        self.LIGHT_SQUARE_COLOR = '#DEB887'
+
+        self.win = tk.Tk()
+        self.win.title("Recon Chess Games")
+        self.square_size = SPRITE_SIZE // shrink
+
+        # one shrunk copy of every sprite, shared by all boards
+        self.sprites = {}
+        for piece in 'pnbrqk':
+            self.sprites[piece] = tk.PhotoImage(file=os.path.join(RES_DIR, 'black_%s.png' % piece)).subsample(shrink)
+        for piece in 'PNBRQK':
+            self.sprites[piece] = tk.PhotoImage(file=os.path.join(RES_DIR, 'white_%s.png' % piece)).subsample(shrink)
+
+        self.labels = []
+        self.canvases = []
+        self.piece_items = []   # canvas image item of every square of every board
+        for board_id in range(num_boards):
+            frame = tk.Frame(self.win)
+            frame.grid(row=board_id // columns, column=board_id % columns, padx=2, pady=2)
+            label = tk.Label(frame, text=names[board_id] if names else "Game {}".format(board_id + 1), width=1)
+            label.pack(fill='x')
+            canvas = tk.Canvas(frame, width=self.square_size * 8, height=self.square_size * 8, highlightthickness=0)
+            canvas.pack()
+
+            items = []
+            for square in range(64):
+                x, y = (square % 8) * self.square_size, (square // 8) * self.square_size
+                color = [self.LIGHT_SQUARE_COLOR, self.DARK_SQUARE_COLOR][(square % 8 + square // 8) % 2]
+                canvas.create_rectangle(x, y, x + self.square_size, y + self.square_size, outline=color, fill=color)
+                items.append(canvas.create_image(x, y, anchor=tk.NW, state=tk.HIDDEN))
+            self.labels.append(label)
+            self.canvases.append(canvas)
+            self.piece_items.append(items)
+
+        self.shown = ['0' * 64] * num_boards    # squares currently on screen, see fen_to_squares
+        self.pending = {}                       # board id -> newest squares not drawn yet, oldest waiting first
+
+    def set_board(self, board_id, fen):
+        # a board that is still waiting keeps its place in the line, only its position is replaced
+        self.pending[board_id] = fen_to_squares(fen)
+
+    def set_label(self, board_id, text):
+        self.labels[board_id].config(text=text)
+
+    def draw(self, budget):
+        """
+        Redraws the changed squares of the waiting boards, the boards that waited longest first, until budget squares
+        have been redrawn. The first board is always drawn, so a board never waits forever. Boards that did not fit
+        stay pending for the next frame.
+
+        :param budget: int -- the number of squares that may be redrawn
+        :return: int -- the number of squares redrawn
+        """
+        drawn = 0
+        for board_id in list(self.pending):
+            squares, shown = self.pending[board_id], self.shown[board_id]
+            changed = [square for square in range(64) if squares[square] != shown[square]]
+            if drawn > 0 and drawn + len(changed) > budget:
+                break
+
+            canvas, items = self.canvases[board_id], self.piece_items[board_id]
+            for square in changed:
+                if squares[square] == '0':
+                    canvas.itemconfig(items[square], state=tk.HIDDEN)
+                else:
+                    canvas.itemconfig(items[square], image=self.sprites[squares[square]], state=tk.NORMAL)
+            self.shown[board_id] = squares
+            del self.pending[board_id]
+            drawn += len(changed)
+        return drawn
+
+
+class GridBoardFeed(object):
+    """
+    Stands in for a ChessboardGUI in play_local_game and sends the boards of one game to a GridDashboard.
+    """
+
+    def __init__(self, frames, board_id):
+        self.frames = frames
+        self.board_id = board_id
+
+    def update_board(self, fen):
+        self.frames.put((self.board_id, 'board', fen))
+
+    def game_over(self, message):
+        self.frames.put((self.board_id, 'label', message))
+
+
+class GridDashboard(object):
+    """
+    GridGUI running in its own process. Feeds can be handed to game processes, sending to them never waits for the
+    window.
+    """
+
+    def __init__(self, num_boards, columns=8, shrink=4, names=None, max_fps=10, square_budget=512):
+        """
+        :param max_fps: int -- the maximum number of frames per second
+        :param square_budget: int -- the maximum number of squares redrawn per frame over all boards
+        """
+        self.frames = Queue()
+        self.process = Process(target=_grid_loop, daemon=True,
+                               args=(self.frames, num_boards, columns, shrink, names, max_fps, square_budget))
+        self.process.start()
+
+    def feed(self, board_id):
+        """
+        :return: GridBoardFeed -- the feed of one board, pass it as the gui of play_local_game
+        """
+        return GridBoardFeed(self.frames, board_id)
+
+    def wait(self):
+        """
+        Waits until the window is closed.
+        """
+        self.process.join()
+
+
+def _grid_loop(frames, num_boards, columns, shrink, names, max_fps, square_budget):
+    gui = GridGUI(num_boards, columns=columns, shrink=shrink, names=names)
+    interval = max(1, int(1000 / max_fps))
+
+    def poll():
+        while True:
+            try:
+                board_id, kind, value = frames.get_nowait()
+            except queue.Empty:
+                break
+            if kind == 'board':
+                gui.set_board(board_id, value)
+            else:
+                gui.set_label(board_id, value)
+        gui.draw(square_budget)
+        gui.win.after(interval, poll)
+
+    gui.win.after(0, poll)
+    gui.win.mainloop()
+
+
+def _play_games(first_path, second_path, game_ids, frames, verbosity):
+    name_one, constructor_one = load_player(first_path)
+    name_two, constructor_two = load_player(second_path)
+    for game_id in game_ids:
+        feed = GridBoardFeed(frames, game_id)
+        # numbered names keep the games from writing to the same history file
+        white, black = (constructor_one, constructor_two) if game_id % 2 == 0 else (constructor_two, constructor_one)
+        names = ["{}{}".format(name, game_id + 1) for name in
+                 ((name_one, name_two) if game_id % 2 == 0 else (name_two, name_one))]
+        winner_color, winner_reason = play_local_game(white(), black(), names, gui=feed, verbosity=verbosity)
+        feed.game_over(winner_reason)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Plays many games between two bots in parallel and shows them all.')
+    parser.add_argument('first_path', help='Path to first bot source file.')
+    parser.add_argument('second_path', help='Path to second bot source file.')
+    parser.add_argument('--games', type=int, default=32, help='Number of games to play.')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help='Number of game processes.')
+    parser.add_argument('--columns', type=int, default=8, help='Number of boards per row.')
+    parser.add_argument('--shrink', type=int, default=4, help='Factor the piece sprites are shrunk by.')
+    parser.add_argument('--max-fps', type=int, default=10, help='Maximum number of frames per second.')
+    parser.add_argument('--square-budget', type=int, default=512,
+                        help='Maximum number of squares redrawn per frame over all boards.')
+    parser.add_argument('--verbosity', default='off', choices=list(VERBOSITY_LEVELS),
+                        help='How much every game prints to the console.')
+    parser.add_argument('--history', default='off', choices=list(VERBOSITY_LEVELS),
+                        help='How much every game writes to its RRGameHistory file, off writes no files.')
+    args = parser.parse_args()
+
+    dashboard = GridDashboard(args.games, columns=args.columns, shrink=args.shrink, max_fps=args.max_fps,
+                              square_budget=args.square_budget)
+    verbosity = Verbosity(console=VERBOSITY_LEVELS[args.verbosity], history=VERBOSITY_LEVELS[args.history])
+    workers = [Process(target=_play_games, daemon=True,
+                       args=(args.first_path, args.second_path, range(worker, args.games, args.workers),
+                             dashboard.frames, verbosity))
+               for worker in range(min(args.workers, args.games))]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    print('Games Over! Close the window to exit.')
+    dashboard.wait()
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+
+"""
+File Name:      history_archive.py
+Author:         agent
+Date:           October 19th, 2026
+
+Description:    Python file for compressed game history archives. Many games are written into a few size-bounded
+                segment files instead of two text files per game. Every history file of a game is compressed as its
+                own gzip member or zstd frame, and an index records where it starts, so a reader can seek straight to
+                any game and decompress only that game.
+"""
+
+import os
+import io
+import gzip
+import argparse
+from json_lines import JsonLinesFile
+
+try:
+    import zstandard
+except ImportError:  # only the zstd compression needs zstandard
+    zstandard = None
+
+INDEX_NAME = 'index.jsonl'
+EXTENSIONS = {'gzip': '.gz', 'zstd': '.zst'}
+
+
+def _compress(data, compression):
+    if compression == 'gzip':
+        return gzip.compress(data, compresslevel=6)
+    return zstandard.ZstdCompressor(level=10).compress(data)
+
+
+def _decompress(data, compression):
+    if compression == 'gzip':
+        return gzip.decompress(data)
+    return zstandard.ZstdDecompressor().decompress(data)
+
+
+def _index_file(directory):
+    return JsonLinesFile(os.path.join(directory, INDEX_NAME))
+
+
+class ArchiveWriter(object):
+    """
+    Appends games to the segments of an archive directory. A new segment is started when the current one reaches
+    max_segment_bytes, and every time the archive is opened, so a segment cut short by a crash is never written to
+    again.
+    """
+
+    def __init__(self, directory, compression='gzip', max_segment_bytes=64 << 20):
+        """
+        :param directory: str -- the archive directory, it is created if needed
+        :param compression: str -- 'gzip' or 'zstd' (needs the zstandard package)
+        :param max_segment_bytes: int -- size at which a segment is closed
+        """
+        if compression not in EXTENSIONS:
+            raise ValueError("Unknown compression '{}', use gzip or zstd".format(compression))
+        if compression == 'zstd' and zstandard is None:
+            raise ImportError("zstd compression needs the zstandard package (pip install zstandard)")
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.compression = compression
+        self.max_segment_bytes = max_segment_bytes
+
+        self.index = _index_file(directory)
+        entries = self.index.read()
+        self.num_games = len(entries)
+        self.num_segments = max([entry['segment'] for entry in entries], default=-1) + 1
+        self._segment = None
+        self._segment_name = None
+
+    def _rotate(self):
+        if self._segment is not None:
+            self._segment.close()
+        self._segment_name = 'segment-{:05d}{}'.format(self.num_segments, EXTENSIONS[self.compression])
+        self._segment = open(os.path.join(self.directory, self._segment_name), 'ab')
+        self.num_segments += 1
+
+    def add_game(self, player_names, files):
+        """
+        Compresses the history files of one game into the current segment and indexes them.
+
+        :param player_names: List(str) -- names of the WHITE and BLACK players
+        :param files: dict -- the text of every history file of the game by its kind, e.g. {'true_boards': ...}
+
+        :return: int -- the number of the game in the archive
+        """
+        if self._segment is None or self._segment.tell() >= self.max_segment_bytes:
+            self._rotate()
+
+        offsets = {}
+        for kind, text in files.items():
+            data = _compress(text.encode(), self.compression)
+            offsets[kind] = [self._segment.tell(), len(data)]
+            self._segment.write(data)
+        self._segment.flush()
+
+        entry = {'game': self.num_games, 'segment': self.num_segments - 1, 'path': self._segment_name,
+                 'compression': self.compression, 'white': player_names[0], 'black': player_names[1],
+                 'files': offsets}
+        self.index.append(entry)
+        self.num_games += 1
+        return entry['game']
+
+    def close(self):
+        if self._segment is not None:
+            self._segment.close()
+            self._segment = None
+
+
+class ArchiveReader(object):
+    """
+    Random access to the games of an archive directory.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.entries = _index_file(directory).read()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def read(self, game, kind=None):
+        """
+        :param game: int -- the number of the game in the archive
+        :param kind: str -- the history file to read, None for all files of the game
+
+        :return: str -- the text of the history file
+                 dict -- the text of every history file by its kind, if kind is None
+        """
+        entry = self.entries[game]
+        kinds = [kind] if kind is not None else list(entry['files'])
+        texts = {}
+        with open(os.path.join(self.directory, entry['path']), 'rb') as f:
+            for k in kinds:
+                offset, length = entry['files'][k]
+                f.seek(offset)
+                texts[k] = _decompress(f.read(length), entry['compression']).decode()
+        return texts[kind] if kind is not None else texts
+
+    def lines(self, game, kind):
+        """
+        :return: io.StringIO -- the lines of one history file, for code that reads the text history files
+        """
+        return io.StringIO(self.read(game, kind))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Lists the games of a history archive or prints one of them.')
+    parser.add_argument('directory', help='The archive directory.')
+    parser.add_argument('--game', type=int, default=None, help='Print this game instead of listing the games.')
+    parser.add_argument('--kind', default=None, help='Print only this history file of the game, e.g. true_boards.')
+    args = parser.parse_args()
+
+    reader = ArchiveReader(args.directory)
+    if args.game is None:
+        for entry in reader.entries:
+            print("{:>6} {:<20} {} vs {}".format(entry['game'], entry['path'], entry['white'], entry['black']))
+    elif args.kind is not None:
+        print(reader.read(args.game, args.kind))
+    else:
+        for kind, text in reader.read(args.game).items():
+            print("=== {} ===".format(kind))
+            print(text)
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+
+"""
+File Name:      journal.py
+Author:         agent
+Date:           October 19th, 2026
+Description:    Python file with an append-only journal of a tournament run. The first entry records the tournament
+                settings and every finished game is appended as soon as it is played, so a tournament that died can be
+                restarted from the same file and continues where it stopped.
+"""
+
+import json
+import chess
+from json_lines import JsonLinesFile
+
+
+class JournalMismatch(Exception):
+    pass
+
+
+class TournamentJournal(object):
+    """
+    Journal of one tournament, persisted as a json lines file. The pairing scheduler is not stored itself: replaying
+    the journaled games through a fresh scheduler and fresh ratings brings both back to the exact state they had.
+    """
+
+    COLOR_NAMES = {chess.WHITE: 'WHITE', chess.BLACK: 'BLACK', None: None}
+    NAME_COLORS = {'WHITE': chess.WHITE, 'BLACK': chess.BLACK, None: None}
+
+    def __init__(self, path):
+        self.path = path
+        self.settings = None
+        self.games = []     # (white, black, seed, winner color, winner reason) of every finished game, in order
+        self.file = JsonLinesFile(path, sync=True)
+        for entry in self.file.read():
+            if entry['type'] == 'settings':
+                self.settings = entry['settings']
+            elif entry['type'] == 'game':
+                self.games.append((entry['white'], entry['black'], entry['seed'],
+                                   self.NAME_COLORS[entry['winner']], entry['reason']))
+
+    def start(self, settings):
+        """
+        Records the settings of a new tournament, or checks them against the journaled ones when resuming.
+
+        :param settings: dict -- json serializable settings that decide the pairings, seeds and results
+        :raises JournalMismatch: if the journal belongs to a tournament with different settings
+        """
+        if self.settings is None:
+            self.settings = settings
+            self.file.append({'type': 'settings', 'settings': settings})
+        elif self.settings != json.loads(json.dumps(settings)):
+            raise JournalMismatch("{} was written by a tournament with different settings".format(self.path))
+
+    def get(self, game_number):
+        """
+        :param game_number: int -- the number of the game in the tournament, starting at 1
+        :return: (str, str, int, chess.WHITE/chess.BLACK/None, str) -- the journaled white, black, seed, winner color
+                 and reason of the game
+                 None -- if the game has not been played yet
+        """
+        return self.games[game_number - 1] if game_number <= len(self.games) else None
+
+    def put(self, white, black, seed, winner_color, winner_reason):
+        """
+        Appends the next finished game to the journal and syncs it to disk.
+        """
+        self.games.append((white, black, seed, winner_color, winner_reason))
+        self.file.append({'type': 'game', 'game': len(self.games), 'white': white, 'black': black, 'seed': seed,
+                          'winner': self.COLOR_NAMES[winner_color], 'reason': winner_reason})
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+
+"""
+File Name:      move_encoding.py
+Author:         agent
+Date:           October 19th, 2026
+
+Description:    Python file for the packed move representation. A move is stored in 16 bits: the from square in
+                bits 0-5, the to square in bits 6-11 and the promotion piece type (0 for none) in bits 12-14. Lists
+                of moves become NumPy uint16 arrays that vectorized evaluators can use directly. The moves of a turn can
+                be generated in this form straight from the bitboards of the truth board.
+"""
+
+import chess
+
+try:
+    import numpy as np
+except ImportError:  # only the array helpers need numpy
+    np = None
+
+FROM_MASK = 0x3F
+TO_SHIFT = 6
+PROMOTION_SHIFT = 12
+
+
+def pack_move(move):
+    """
+    :param move: chess.Move -- the move to encode
+    :return: int -- the 16 bit encoding of the move
+    """
+    return move.from_square | (move.to_square << TO_SHIFT) | ((move.promotion or 0) << PROMOTION_SHIFT)
+
+
+def unpack_move(code):
+    """
+    :param code: int -- the 16 bit encoding of a move
+    :return: chess.Move -- the decoded move
+    """
+    code = int(code)
+    promotion = code >> PROMOTION_SHIFT
+    return chess.Move(code & FROM_MASK, (code >> TO_SHIFT) & FROM_MASK, promotion if promotion else None)
+
+
+def is_packed(move):
+    """
+    :return: bool -- True if move is a packed move rather than a chess.Move
+    """
+    return isinstance(move, int) or (np is not None and isinstance(move, np.integer))
+
+
+def pack_moves(moves):
+    """
+    :param moves: List(chess.Move) -- the moves to encode
+    :return: numpy.ndarray -- uint16 array with one encoded move per entry
+    """
+    return np.fromiter((pack_move(move) for move in moves), dtype=np.uint16, count=len(moves))
+
+
+def unpack_moves(codes):
+    """
+    :param codes: numpy.ndarray -- uint16 array of encoded moves
+    :return: List(chess.Move) -- the decoded moves
+    """
+    return [unpack_move(code) for code in codes]
+
+
+def from_squares(codes):
+    """
+    :param codes: numpy.ndarray -- uint16 array of encoded moves
+    :return: numpy.ndarray -- the from square of every move
+    """
+    return codes & FROM_MASK
+
+
+def to_squares(codes):
+    """
+    :param codes: numpy.ndarray -- uint16 array of encoded moves
+    :return: numpy.ndarray -- the to square of every move
+    """
+    return (codes >> TO_SHIFT) & FROM_MASK
+
+
+def promotions(codes):
+    """
+    :param codes: numpy.ndarray -- uint16 array of encoded moves
+    :return: numpy.ndarray -- the promotion piece type of every move, 0 for none
+    """
+    return codes >> PROMOTION_SHIFT
+
+
+###=== Packed move generation ===###
+def _piece_attacks(board, square, occupied):
+    # attacks of the knight, king, bishop, rook or queen on square, with only the given squares occupied
+    bb_square = chess.BB_SQUARES[square]
+    if bb_square & board.knights:
+        return chess.BB_KNIGHT_ATTACKS[square]
+    if bb_square & board.kings:
+        return chess.BB_KING_ATTACKS[square]
+    attacks = 0
+    if bb_square & (board.bishops | board.queens):
+        attacks = chess.BB_DIAG_ATTACKS[square][chess.BB_DIAG_MASKS[square] & occupied]
+    if bb_square & (board.rooks | board.queens):
+        attacks |= (chess.BB_RANK_ATTACKS[square][chess.BB_RANK_MASKS[square] & occupied] |
+                    chess.BB_FILE_ATTACKS[square][chess.BB_FILE_MASKS[square] & occupied])
+    return attacks
+
+
+def _castling_codes(board, turn, own):
+    # the castling moves python-chess generates once the opponent's pieces are removed, which cannot attack anything
+    backrank = chess.BB_RANK_1 if turn == chess.WHITE else chess.BB_RANK_8
+    king = own & board.kings & ~board.promoted & backrank
+    king = king & -king
+    if not king:
+        return []
+    king_square = chess.msb(king)
+
+    codes = []
+    for candidate in chess.scan_reversed(board.clean_castling_rights() & backrank):
+        rook = chess.BB_SQUARES[candidate]
+        rook_to, king_to = (chess.BB_FILE_D, chess.BB_FILE_C) if rook < king else (chess.BB_FILE_F, chess.BB_FILE_G)
+        rook_to, king_to = chess.msb(rook_to & backrank), chess.msb(king_to & backrank)
+        empty_for_rook, empty_for_king = 0, 0
+        if candidate != rook_to:
+            empty_for_rook = chess.BB_BETWEEN[candidate][rook_to] | chess.BB_SQUARES[rook_to]
+        if king_square != king_to:
+            empty_for_king = chess.BB_BETWEEN[king_square][king_to] | chess.BB_SQUARES[king_to]
+        if not (own ^ king ^ rook) & (empty_for_king | empty_for_rook):
+            # standard chess notation moves the king two squares, see chess.Board._from_chess960
+            if king_square in (chess.E1, chess.E8) and rook & chess.BB_CORNERS:
+                codes.append(king_square | king_to << TO_SHIFT)
+            else:
+                codes.append(king_square | candidate << TO_SHIFT)
+    return codes
+
+
+def packed_recon_moves(board, turn):
+    """
+    Generates the moves of Game.get_moves as packed moves, in the same order, straight from the bitboards of the
+    truth board: no board copies and no chess.Move objects.
+
+    :param board: chess.Board -- the truth board
+    :param turn: chess.WHITE/chess.BLACK -- the color to move
+    :return: numpy.ndarray -- uint16 array with one encoded move per entry
+    """
+    own = board.occupied_co[turn]
+    pawns = board.pawns & own
+    codes = []
+
+    # the pseudo legal moves of the board without the opponent's pieces
+    for from_square in chess.scan_reversed(own & ~board.pawns):
+        for to_square in chess.scan_reversed(_piece_attacks(board, from_square, own) & ~own):
+            codes.append(from_square | to_square << TO_SHIFT)
+    codes += _castling_codes(board, turn, own)
+
+    if turn == chess.WHITE:
+        single_moves = pawns << 8 & ~own & chess.BB_ALL
+        double_moves = single_moves << 8 & ~own & (chess.BB_RANK_3 | chess.BB_RANK_4)
+        step = -8
+    else:
+        single_moves = pawns >> 8 & ~own
+        double_moves = single_moves >> 8 & ~own & (chess.BB_RANK_6 | chess.BB_RANK_5)
+        step = 8
+    for to_square in chess.scan_reversed(single_moves):
+        code = (to_square + step) | to_square << TO_SHIFT
+        if chess.BB_SQUARES[to_square] & chess.BB_BACKRANKS:
+            codes += [code | piece_type << PROMOTION_SHIFT
+                      for piece_type in (chess.QUEEN, chess.ROOK, chess.BISHOP, chess.KNIGHT)]
+        else:
+            codes.append(code)
+    for to_square in chess.scan_reversed(double_moves):
+        codes.append((to_square + 2 * step) | to_square << TO_SHIFT)
+    if board.ep_square and not chess.BB_SQUARES[board.ep_square] & own:
+        capturers = pawns & chess.BB_PAWN_ATTACKS[not turn][board.ep_square] & chess.BB_RANKS[4 if turn else 3]
+        for from_square in chess.scan_reversed(capturers):
+            codes.append(from_square | board.ep_square << TO_SHIFT)
+
+    # pawn captures onto every square the own pieces leave free, with and without promotion
+    for from_square in chess.scan_forward(pawns):
+        for to_square in chess.scan_forward(chess.BB_PAWN_ATTACKS[turn][from_square] & ~own):
+            code = from_square | to_square << TO_SHIFT
+            codes.append(code)
+            if chess.BB_SQUARES[to_square] & chess.BB_BACKRANKS:
+                codes += [code | piece_type << PROMOTION_SHIFT for piece_type in chess.PIECE_TYPES[1:-1]]
+    return np.array(codes, dtype=np.uint16)
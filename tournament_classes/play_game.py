@@ -8,73 +8,144 @@ Description:    Python file used to play a game of recon chess with two agents.
 Source:         Adapted from recon-chess (https://pypi.org/project/reconchess/)
 """
 
+import io
+import sys
+import json
 import argparse
 import random
 import chess
+from functools import lru_cache
 from player import load_player
 from game import Game
-from datetime import datetime
-from chessboard_gui import ChessboardGUI
-import time
+from history_archive import ArchiveWriter
+from chessboard_gui import AsyncChessboardGUI
 
 
-def play_local_game(white_player, black_player, player_names, gui=None):
+# verbosity levels of the game output, every level includes the ones before it
+OFF, RESULTS, MOVES, BOARDS = range(4)
+VERBOSITY_LEVELS = {'off': OFF, 'results': RESULTS, 'moves': MOVES, 'boards': BOARDS}
+
+
+class Verbosity(object):
+    """
+    How much play_local_game reports on each of its outputs, one of the levels above per output. Boards are only
+    rendered for outputs at the BOARDS level.
+    """
+
+    def __init__(self, console=BOARDS, history=BOARDS, gui=BOARDS, events=OFF, events_file=None, colorize=False,
+                 compact=False):
+        """
+        :param console: int -- level of the console output
+        :param history: int -- level of the RRGameHistory file, no file is written when it is OFF
+        :param gui: int -- the gui shows every ply from MOVES on and only the final board at RESULTS
+        :param events: int -- level of the json lines events written to events_file
+        :param events_file: file -- where to write the events, e.g. sys.stdout, None to write no events
+        :param colorize: bool -- color the pieces of the console boards
+        :param compact: bool -- print the console boards in the compact layout
+        """
+        self.console = console
+        self.history = history
+        self.gui = gui
+        self.events = events if events_file is not None else OFF
+        self.events_file = events_file
+        self.colorize = colorize
+        self.compact = compact
+
+    def print(self, level, text):
+        if self.console >= level:
+            print(text)
+
+    def print_board(self, board):
+        if self.console >= BOARDS:
+            format_print_board(board, self.colorize, self.compact)
+
+    def event(self, level, event, **fields):
+        if self.events >= level:
+            entry = {'event': event}
+            entry.update(fields)
+            self.events_file.write(json.dumps(entry) + '\n')
+
+
+def _uci(move):
+    return move.uci() if move is not None else None
+
+
+def _square_name(square):
+    # Game.handle_sense accepts any sense, so an agent may return None or a square off the board
+    return chess.SQUARE_NAMES[square] if square in chess.SQUARES else None
+
+
+def play_local_game(white_player, black_player, player_names, gui=None, game=None, verbosity=None, archive=None):
     players = [black_player, white_player]
 
-    game = Game()
+    if game is None:
+        game = Game()
+    if verbosity is None:
+        verbosity = Verbosity()
+    if verbosity.gui == OFF:
+        gui = None
     if gui is not None:
-        gui.win.update()
+        gui.update_board(game.board_is_real.board_fen())
 
     # writing to files
-    time = "{}".format(datetime.today()).replace(" ", "_").replace(":", "-").replace(".", "-")
-    filename_true = "RRGameHistory/" + "{}_vs_{}".format(player_names[0], player_names[1]) + ".txt"
-    output_true = open(filename_true, "w")
-    output_true.write("Starting Game between {}-WHITE and {}-BLACK\n".format(player_names[0], player_names[1]))
+    output_true = None
+    if verbosity.history > OFF and archive is not None:
+        # the archive compresses the whole game once it is over
+        output_true = io.StringIO()
+        output_true.write("Starting Game between {}-WHITE and {}-BLACK\n".format(player_names[0], player_names[1]))
+    elif verbosity.history > OFF:
+        filename_true = "RRGameHistory/" + "{}_vs_{}".format(player_names[0], player_names[1]) + ".txt"
+        output_true = open(filename_true, "w")
+        output_true.write("Starting Game between {}-WHITE and {}-BLACK\n".format(player_names[0], player_names[1]))
+    verbosity.event(RESULTS, 'game_start', white=player_names[0], black=player_names[1])
 
     white_player.handle_game_start(chess.WHITE, chess.Board())
     black_player.handle_game_start(chess.BLACK, chess.Board())
 
     move_number = 1
     while not game.is_over():
-        if game.turn:
-            output_true.write("##################################--WHITE's Turn [{}]\n".format(move_number))
-            # print("WHITE's Turn [{}]".format(move_number))
-            # format_print_board(game.white_board)
+        if verbosity.history >= MOVES:
+            if game.turn:
+                output_true.write("##################################--WHITE's Turn [{}]\n".format(move_number))
+            else:
+                output_true.write("##################################--BLACK's Turn [{}]\n".format(move_number))
 
-        else:
-            output_true.write("##################################--BLACK's Turn [{}]\n".format(move_number))
-            # print("BLACK's Turn [{}]".format(move_number))
-            # format_print_board(game.black_board)
-
-        output_true.write("##################################--Current Board State\n")
-        format_write_board(output_true, game.board_is_real)
+        if verbosity.history >= BOARDS:
+            output_true.write("##################################--Current Board State\n")
+            format_write_board(output_true, game.board_is_real)
 
         # update GUI
-        gui.update_board(game.board_is_real.board_fen())
+        if gui is not None and verbosity.gui >= MOVES:
+            gui.update_board(game.board_is_real.board_fen())
 
-        requested_move, taken_move = play_turn(game, players[game.turn], game.turn, move_number, output_true)
-        print_game(game, move_number, game.turn, requested_move, taken_move)
+        requested_move, taken_move = play_turn(game, players[game.turn], game.turn, move_number, output_true,
+                                               verbosity)
+        print_game(game, move_number, game.turn, requested_move, taken_move, verbosity)
         move_number += 1
 
-        # print("==================================\n")
-
-    gui.update_board(game.board_is_real.board_fen())
+    if gui is not None:
+        gui.update_board(game.board_is_real.board_fen())
     winner_color, winner_reason = game.get_winner()
 
     white_player.handle_game_end(winner_color, winner_reason)
     black_player.handle_game_end(winner_color, winner_reason)
 
-    output_true.write("Game Over!\n")
-    if winner_color is not None:
+    if verbosity.history > OFF:
+        output_true.write("Game Over!\n")
         output_true.write(winner_reason)
-    else:
-        output_true.write('Draw!')
+        if archive is not None:
+            archive.add_game(player_names, {'true_boards': output_true.getvalue()})
+        output_true.close()
+    winner = {chess.WHITE: 'WHITE', chess.BLACK: 'BLACK', None: None}[winner_color]
+    verbosity.event(RESULTS, 'game_end', winner=winner, reason=winner_reason, plies=move_number - 1)
     return winner_color, winner_reason
 
 
-def play_turn(game, player, turn, move_number, output_true):
-    possible_moves = game.get_moves()
+def play_turn(game, player, turn, move_number, output_true, verbosity):
+    possible_moves = game.get_packed_moves() if player.packed_moves else game.get_moves()
     possible_sense = list(chess.SQUARES)
+    color = "WHITE" if turn else "BLACK"
+    external_cpu_seconds = player.external_cpu_seconds()
 
     # notify the player of the previous opponent's move
     captured_square = game.opponent_move_result()
@@ -88,7 +159,8 @@ def play_turn(game, player, turn, move_number, output_true):
     sense = player.choose_sense(possible_sense, possible_moves, game.get_seconds_left())
     sense_result = game.handle_sense(sense)
     player.handle_sense_result(sense_result)
-    # print_sense(game, turn, sense)
+    if verbosity.events >= MOVES:
+        verbosity.event(MOVES, 'sense', color=color, ply=move_number, square=_square_name(sense))
 
     # play move action
     move = player.choose_move(possible_moves, game.get_seconds_left())
@@ -96,82 +168,80 @@ def play_turn(game, player, turn, move_number, output_true):
     player.handle_move_result(requested_move, taken_move, reason, captured_square is not None,
                               captured_square)
 
-    output_true.write("##################################--Move requested: {} -- Move taken: {}\n\n".format(requested_move, taken_move))
+    if verbosity.history >= MOVES:
+        output_true.write("##################################--Move requested: {} -- Move taken: {}\n\n".format(requested_move, taken_move))
+    if verbosity.events >= MOVES:
+        fields = {'color': color, 'ply': move_number, 'requested': _uci(requested_move), 'taken': _uci(taken_move),
+                  'captured_square': captured_square, 'reason': reason}
+        if verbosity.events >= BOARDS:
+            fields['board'] = game.board_is_real.fen()
+        verbosity.event(MOVES, 'move', **fields)
 
+    game.charge(player.external_cpu_seconds() - external_cpu_seconds)
     game.end_turn()
     return requested_move, taken_move
 
 
-def print_game(game, move_number, turn, move_requested, move_taken):
+def print_game(game, move_number, turn, move_requested, move_taken, verbosity):
     if not turn:
-        print("[WHITE]-- Move requested: {} -- Move taken: {}".format(move_requested, move_taken))
-        format_print_board(game.board_is_real)
+        verbosity.print(MOVES, "[WHITE]-- Move requested: {} -- Move taken: {}".format(move_requested, move_taken))
+        verbosity.print_board(game.board_is_real)
     else:
-        print("[BLACK]-- Move requested: {} -- Move taken: {}".format(move_requested, move_taken))
-        format_print_board(game.board_is_real)
+        verbosity.print(MOVES, "[BLACK]-- Move requested: {} -- Move taken: {}".format(move_requested, move_taken))
+        verbosity.print_board(game.board_is_real)
 
 
-def print_sense(game, turn, sense):
+def print_sense(game, turn, sense, verbosity):
     if turn:
-        print("[WHITE]-- Sense Around Square {} --".format(chess.SQUARE_NAMES[sense]))
-        format_print_board(game.white_board)
+        verbosity.print(MOVES, "[WHITE]-- Sense Around Square {} --".format(_square_name(sense)))
+        verbosity.print_board(game.white_board)
     else:
-        print("[BLACK]-- Sense Around Square {} --".format(chess.SQUARE_NAMES[sense]))
-        format_print_board(game.black_board)
-
-
-def format_print_board(board):
-    rows = ['8', '7', '6', '5', '4', '3', '2', '1']
-    fen = board.board_fen()
-
-    fb = "   A   B   C   D   E   F   G   H  "
-    fb += rows[0]
-    ind = 1
-    for f in fen:
-        if f == '/':
-            fb += '|' + rows[ind]
-            ind += 1
-        elif f.isnumeric():
-            for i in range(int(f)):
-                fb += '|   '
+        verbosity.print(MOVES, "[BLACK]-- Sense Around Square {} --".format(_square_name(sense)))
+        verbosity.print_board(game.black_board)
+
+
+# ANSI escape codes of the colorized boards
+WHITE_PIECE_COLOR = '\033[1;97m'
+BLACK_PIECE_COLOR = '\033[1;91m'
+RESET_COLOR = '\033[0m'
+
+
+@lru_cache(maxsize=4096)
+def render_board(board_fen, colorize=False, compact=False):
+    """
+    Renders a board as text. Boards repeat a lot within and between games, so the results are cached.
+
+    :param board_fen: str -- the board_fen() of the board
+    :param colorize: bool -- color the pieces with ANSI escape codes, for the console only
+    :param compact: bool -- one character per square instead of the boxed layout of the history files
+
+    :return: str -- the board, ending with an empty line
+    """
+    lines = ["  abcdefgh" if compact else "   A   B   C   D   E   F   G   H  "]
+    for rank, row in zip('87654321', board_fen.split('/')):
+        cells = []
+        for f in row:
+            if f.isnumeric():
+                cells += ['.' if compact else ' '] * int(f)
+            elif colorize:
+                cells.append((WHITE_PIECE_COLOR if f.isupper() else BLACK_PIECE_COLOR) + f + RESET_COLOR)
+            else:
+                cells.append(f)
+        if compact:
+            lines.append(rank + ' ' + ''.join(cells))
         else:
-            fb += '| ' + f + ' '
-    fb += '|'
+            lines.append(rank + '| ' + ' | '.join(cells) + ' |')
+    if compact:
+        lines.append(lines.pop(0))
+    return '\n'.join(lines) + '\n\n'
 
-    ind = 0
-    for i in range(9):
-        for j in range(34):
-            print(fb[ind], end='')
-            ind += 1
-        print('\n', end='')
-    print("")
 
+def format_print_board(board, colorize=False, compact=False):
+    print(render_board(board.board_fen(), colorize, compact), end='')
 
-def format_write_board(out, board):
-    rows = ['8', '7', '6', '5', '4', '3', '2', '1']
-    fen = board.board_fen()
-
-    fb = "   A   B   C   D   E   F   G   H  "
-    fb += rows[0]
-    ind = 1
-    for f in fen:
-        if f == '/':
-            fb += '|' + rows[ind]
-            ind += 1
-        elif f.isnumeric():
-            for i in range(int(f)):
-                fb += '|   '
-        else:
-            fb += '| ' + f + ' '
-    fb += '|'
 
-    ind = 0
-    for i in range(9):
-        for j in range(34):
-            out.write(fb[ind])
-            ind += 1
-        out.write('\n')
-    out.write('\n')
+def format_write_board(out, board):
+    out.write(render_board(board.board_fen()))
 
 
 if __name__ == '__main__':
@@ -180,6 +250,31 @@ if __name__ == '__main__':
     parser.add_argument('second_path', help='Path to second bot source file.')
     # parser.add_argument('--color', default='random', choices=['white', 'black', 'random'],
     #                    help='The color you want to play as.')
+    parser.add_argument('--max-plies', type=int, default=None,
+                        help='Adjudicate the game after this many plies.')
+    parser.add_argument('--no-progress-plies', type=int, default=None,
+                        help='Adjudicate the game after this many plies without a capture or pawn move.')
+    parser.add_argument('--material-margin', type=int, default=None,
+                        help='Material lead that wins a game adjudicated by one of the limits, otherwise it is a draw.')
+    parser.add_argument('--clock', default='wall', choices=['wall', 'thread', 'process'],
+                        help='Charge players wall time, or the CPU time of the game thread or process.')
+    parser.add_argument('--max-fps', type=int, default=20, help='Maximum number of board redraws per second.')
+    parser.add_argument('--verbosity', default='boards', choices=list(VERBOSITY_LEVELS),
+                        help='How much to print to the console.')
+    parser.add_argument('--history', default='boards', choices=list(VERBOSITY_LEVELS),
+                        help='How much to write to the RRGameHistory file, off writes no file.')
+    parser.add_argument('--gui', default='boards', choices=list(VERBOSITY_LEVELS),
+                        help='How much to show in the window, off opens no window.')
+    parser.add_argument('--events', default=None,
+                        help='Write json lines events to this file, - for the console.')
+    parser.add_argument('--events-verbosity', default='moves', choices=list(VERBOSITY_LEVELS),
+                        help='How much to write to the events file.')
+    parser.add_argument('--archive', default=None,
+                        help='Write the history to compressed segments in this directory instead of RRGameHistory.')
+    parser.add_argument('--compression', default='gzip', choices=['gzip', 'zstd'],
+                        help='Compression of the archive segments.')
+    parser.add_argument('--color-boards', action='store_true', help='Color the pieces of the console boards.')
+    parser.add_argument('--compact-boards', action='store_true', help='Print compact console boards.')
     args = parser.parse_args()
 
     name_one, constructor_one = load_player(args.first_path)
@@ -194,17 +289,30 @@ if __name__ == '__main__':
         players.reverse()
         player_names.reverse()
 
-    gui = ChessboardGUI(names=player_names)
+    events_file = None
+    if args.events is not None:
+        events_file = sys.stdout if args.events == '-' else open(args.events, 'a')
+    verbosity = Verbosity(console=VERBOSITY_LEVELS[args.verbosity], history=VERBOSITY_LEVELS[args.history],
+                          gui=VERBOSITY_LEVELS[args.gui], events=VERBOSITY_LEVELS[args.events_verbosity],
+                          events_file=events_file, colorize=args.color_boards, compact=args.compact_boards)
+
+    gui = AsyncChessboardGUI(names=player_names, max_fps=args.max_fps) if verbosity.gui > OFF else None
 
-    win_color, win_reason = play_local_game(players[0], players[1], player_names, gui=gui)
+    game = Game(max_plies=args.max_plies, no_progress_plies=args.no_progress_plies,
+                material_margin=args.material_margin, clock=args.clock)
+    archive = ArchiveWriter(args.archive, compression=args.compression) if args.archive is not None else None
+    win_color, win_reason = play_local_game(players[0], players[1], player_names, gui=gui, game=game,
+                                            verbosity=verbosity, archive=archive)
+    if archive is not None:
+        archive.close()
 
-    print('Game Over!')
+    verbosity.print(RESULTS, 'Game Over!')
     if win_color is not None:
-        if win_color == chess.WHITE:
-            print(player_names[0] + "-" + win_reason)
-            gui.game_over(player_names[0] + "-" + win_reason)
-        else:
-            print(player_names[1] + "-" + win_reason)
-            gui.game_over(player_names[1] + "-" + win_reason)
+        message = player_names[0 if win_color == chess.WHITE else 1] + "-" + win_reason
+        verbosity.print(RESULTS, message)
+        if gui is not None:
+            gui.game_over(message)
     else:
-        print('Draw!')
+        verbosity.print(RESULTS, win_reason)
+        if gui is not None:
+            gui.close()
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+
+"""
+File Name:      ratings.py
+Author:         agent
+Date:           October 19th, 2026
+Description:    Python file with incremental Elo and Glicko ratings and an adaptive pairing scheduler for tournaments.
+"""
+
+import math
+import random
+
+
+class Elo(object):
+    """
+    Classic Elo ratings, updated after every game.
+    """
+
+    def __init__(self, k=32, initial_rating=1500):
+        self.k = k
+        self.initial_rating = initial_rating
+        self.ratings = {}
+        self.games = {}
+
+    def rating(self, player):
+        return self.ratings.get(player, self.initial_rating)
+
+    def uncertainty(self, player):
+        """
+        Elo has no uncertainty of its own, so it is approximated from the number of games the player has played.
+
+        :param player: str -- the player id
+        :return: float -- the rating uncertainty in Elo points
+        """
+        return 350 / math.sqrt(1 + self.games.get(player, 0))
+
+    def expected_score(self, player, opponent):
+        return 1 / (1 + 10 ** ((self.rating(opponent) - self.rating(player)) / 400))
+
+    def update(self, white, black, white_score):
+        """
+        Updates both ratings with the result of a single game.
+
+        :param white: str -- id of the WHITE player
+        :param black: str -- id of the BLACK player
+        :param white_score: float -- 1 if WHITE won, 0.5 for a draw and 0 if BLACK won
+        """
+        delta = self.k * (white_score - self.expected_score(white, black))
+        self.ratings[white] = self.rating(white) + delta
+        self.ratings[black] = self.rating(black) - delta
+        for player in (white, black):
+            self.games[player] = self.games.get(player, 0) + 1
+
+
+class Glicko(object):
+    """
+    Glicko ratings where every game is its own rating period.
+    """
+
+    Q = math.log(10) / 400
+
+    def __init__(self, initial_rating=1500, initial_deviation=350, min_deviation=30):
+        self.initial_rating = initial_rating
+        self.initial_deviation = initial_deviation
+        self.min_deviation = min_deviation
+        self.ratings = {}
+        self.deviations = {}
+
+    def rating(self, player):
+        return self.ratings.get(player, self.initial_rating)
+
+    def uncertainty(self, player):
+        return self.deviations.get(player, self.initial_deviation)
+
+    def _g(self, deviation):
+        return 1 / math.sqrt(1 + 3 * self.Q ** 2 * deviation ** 2 / math.pi ** 2)
+
+    def expected_score(self, player, opponent):
+        g = self._g(self.uncertainty(opponent))
+        return 1 / (1 + 10 ** (-g * (self.rating(player) - self.rating(opponent)) / 400))
+
+    def _updated(self, player, opponent, score):
+        g = self._g(self.uncertainty(opponent))
+        expected = self.expected_score(player, opponent)
+        d_squared = 1 / (self.Q ** 2 * g ** 2 * expected * (1 - expected))
+        precision = 1 / self.uncertainty(player) ** 2 + 1 / d_squared
+        rating = self.rating(player) + self.Q / precision * g * (score - expected)
+        return rating, max(self.min_deviation, math.sqrt(1 / precision))
+
+    def update(self, white, black, white_score):
+        """
+        Updates both ratings and deviations with the result of a single game.
+
+        :param white: str -- id of the WHITE player
+        :param black: str -- id of the BLACK player
+        :param white_score: float -- 1 if WHITE won, 0.5 for a draw and 0 if BLACK won
+        """
+        white_update = self._updated(white, black, white_score)
+        black_update = self._updated(black, white, 1 - white_score)
+        self.ratings[white], self.deviations[white] = white_update
+        self.ratings[black], self.deviations[black] = black_update
+
+
+class PairingScheduler(object):
+    """
+    Picks the next game of a tournament by its information value instead of enumerating every pairing.
+
+    Strategies:
+        'closest'     -- the pairing whose result is the least predictable, i.e. the closest ratings
+        'information' -- like 'closest', but weighted by how uncertain both ratings still are
+    """
+
+    def __init__(self, ratings, players, strategy='information', rng=None):
+        if strategy not in ('closest', 'information'):
+            raise ValueError('Unknown pairing strategy: {}'.format(strategy))
+        self.ratings = ratings
+        self.players = list(players)
+        self.strategy = strategy
+        self.rng = rng if rng is not None else random.Random()
+        self.pair_games = {}    # games played per unordered pairing
+        self.white_games = {}   # games played per (white, black) pairing
+
+    def _information(self, player, opponent):
+        expected = self.ratings.expected_score(player, opponent)
+        value = expected * (1 - expected)
+        if self.strategy == 'information':
+            value *= self.ratings.uncertainty(player) ** 2 + self.ratings.uncertainty(opponent) ** 2
+
+        # spread games over many opponents rather than replaying the same pairing
+        return value / (1 + self.pair_games.get(frozenset((player, opponent)), 0))
+
+    def next_pairing(self):
+        """
+        :return: str, str -- the ids of the WHITE and the BLACK player of the next game
+        """
+        best_value, best_pairs = None, []
+        for i, player in enumerate(self.players):
+            for opponent in self.players[i + 1:]:
+                value = self._information(player, opponent)
+                if best_value is None or value > best_value:
+                    best_value, best_pairs = value, [(player, opponent)]
+                elif value == best_value:
+                    best_pairs.append((player, opponent))
+
+        player, opponent = self.rng.choice(best_pairs)
+
+        # alternate colors within a pairing
+        if self.white_games.get((player, opponent), 0) > self.white_games.get((opponent, player), 0):
+            player, opponent = opponent, player
+        return player, opponent
+
+    def record(self, white, black):
+        """
+        Marks a pairing as played so later picks move on to other opponents.
+
+        :param white: str -- id of the WHITE player
+        :param black: str -- id of the BLACK player
+        """
+        pair = frozenset((white, black))
+        self.pair_games[pair] = self.pair_games.get(pair, 0) + 1
+        self.white_games[(white, black)] = self.white_games.get((white, black), 0) + 1
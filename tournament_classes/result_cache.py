@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+
+"""
+File Name:      result_cache.py
+Author:         agent
+Date:           October 19th, 2026
+Description:    Python file with a cache of tournament game results keyed by agent fingerprints and game seed, so that
+                re-running a tournament only replays games involving agents that have changed.
+"""
+
+import os
+import json
+import hashlib
+import chess
+from player import resolve_player_source
+from json_lines import JsonLinesFile
+
+
+def agent_fingerprint(source_path, constructor=None, data_files=None):
+    """
+    Hashes the source file of an agent together with the data files it declares.
+
+    :param source_path: the path to the source file or the name of the module, as passed to load_player
+    :param constructor: class -- the loaded Player subclass, its data_files are included in the fingerprint
+    :param data_files: List(str) -- the data files of the agent, used instead of constructor.data_files so the agent
+                       does not have to be imported
+
+    :return: str -- hex digest identifying this exact version of the agent
+    """
+    abs_source_path = resolve_player_source(source_path)
+    source_dir = os.path.dirname(abs_source_path)
+
+    sha = hashlib.sha256()
+    paths = [abs_source_path]
+    if data_files is None and constructor is not None:
+        data_files = constructor.data_files
+    paths += [os.path.join(source_dir, data_file) for data_file in sorted(data_files or ())]
+    for path in paths:
+        sha.update(os.path.relpath(path, source_dir).encode())
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 16), b''):
+                sha.update(chunk)
+    return sha.hexdigest()
+
+
+def game_seed(tournament_seed, white, black, pairing_game):
+    """
+    Derives a stable seed for a game from the tournament seed and the position of the game within its pairing.
+
+    :param tournament_seed: int -- the seed of the whole tournament
+    :param white: str -- id of the WHITE player
+    :param black: str -- id of the BLACK player
+    :param pairing_game: int -- how many games this WHITE/BLACK pairing had already played
+
+    :return: int -- the seed for the game
+    """
+    key = "{}:{}:{}:{}".format(tournament_seed, white, black, pairing_game).encode()
+    return int.from_bytes(hashlib.sha256(key).digest()[:8], 'big')
+
+
+class ResultCache(object):
+    """
+    Game results keyed by (WHITE fingerprint, BLACK fingerprint, seed, game settings), persisted as an append-only
+    json lines file.
+    """
+
+    COLOR_NAMES = {chess.WHITE: 'WHITE', chess.BLACK: 'BLACK', None: None}
+    NAME_COLORS = {'WHITE': chess.WHITE, 'BLACK': chess.BLACK, None: None}
+
+    def __init__(self, path, settings=None):
+        """
+        :param path: str -- the cache file
+        :param settings: dict -- json serializable settings of the games, e.g. the adjudication rules and the clock.
+                         Results are only shared between caches opened with the same settings.
+        """
+        self.path = path
+        self.settings_digest = None
+        if settings:
+            settings_json = json.dumps(settings, sort_keys=True).encode()
+            self.settings_digest = hashlib.sha256(settings_json).hexdigest()[:16]
+        self.results = {}
+        self.file = JsonLinesFile(path)
+        for entry in self.file.read():
+            self.results[entry['key']] = (self.NAME_COLORS[entry['winner']], entry['reason'])
+
+    def _key(self, white_fingerprint, black_fingerprint, seed):
+        key = "{}:{}:{}".format(white_fingerprint, black_fingerprint, seed)
+        return key if self.settings_digest is None else "{}:{}".format(key, self.settings_digest)
+
+    def get(self, white_fingerprint, black_fingerprint, seed):
+        """
+        :return: chess.WHITE/chess.BLACK/None, str -- the cached winner color and reason
+                 None -- if the game is not cached
+        """
+        return self.results.get(self._key(white_fingerprint, black_fingerprint, seed))
+
+    def put(self, white_fingerprint, black_fingerprint, seed, winner_color, winner_reason):
+        """
+        Stores a game result and appends it to the cache file.
+        """
+        key = self._key(white_fingerprint, black_fingerprint, seed)
+        self.results[key] = (winner_color, winner_reason)
+        self.file.append({'key': key, 'winner': self.COLOR_NAMES[winner_color], 'reason': winner_reason})
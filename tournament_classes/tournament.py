@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+
+"""
+File Name:      tournament.py
+Author:         agent
+Date:           October 19th, 2026
+Description:    Python file used to rank many agents. Ratings are updated after every game and the next pairing is
+                picked by its information value instead of playing a full round robin.
+"""
+
+import sys
+import argparse
+import random
+import chess
+from game import Game
+from play_game import play_local_game, Verbosity, VERBOSITY_LEVELS
+from ratings import Elo, Glicko, PairingScheduler
+from result_cache import ResultCache, game_seed
+from journal import TournamentJournal, JournalMismatch
+from history_archive import ArchiveWriter
+from agent_registry import AgentRegistry, AgentLoader
+
+
+def run_tournament(bot_paths, num_games, ratings, strategy='information', game_factory=Game, gui=None, cache=None,
+                   seed=0, journal=None, settings=None, verbosity=None, archive=None, registry=None):
+    """
+    Plays num_games games between the given bots, picking every pairing adaptively.
+
+    :param bot_paths: List(str) -- paths to the bot source files, they also serve as the player ids
+    :param num_games: int -- the number of games to play
+    :param ratings: Elo/Glicko -- the ratings to update after every game
+    :param strategy: str -- the PairingScheduler strategy, 'information' or 'closest'
+    :param game_factory: callable -- returns a new Game for every game of the tournament
+    :param gui: ChessboardGUI/AsyncChessboardGUI -- optional window to show the games in
+    :param cache: ResultCache -- optional cache of results, games between unchanged agents are not replayed
+    :param seed: int -- the tournament seed every game seed is derived from
+    :param journal: TournamentJournal -- optional journal of the run, games it already holds are not replayed
+    :param settings: dict -- optional settings of game_factory to record in the journal, e.g. the adjudication rules
+    :param verbosity: Verbosity -- how much every game reports, see play_game.py
+    :param archive: ArchiveWriter -- optional compressed archive for the history of every game
+    :param registry: AgentRegistry -- optional registry of bot_paths, its agents are imported when they first play
+
+    :return: Elo/Glicko -- the updated ratings
+    """
+    bots = AgentLoader(registry)
+    fingerprints = {path: bots.fingerprint(path) for path in bot_paths}
+
+    if journal is not None:
+        journal.start({'bots': bot_paths, 'fingerprints': [fingerprints[path] for path in bot_paths],
+                       'rating': type(ratings).__name__, 'strategy': strategy, 'seed': seed,
+                       'game': settings or {}})
+
+    # the pairing choices get their own generator so cached games do not change the pairings that follow
+    scheduler = PairingScheduler(ratings, bot_paths, strategy=strategy, rng=random.Random(seed))
+    for game_number in range(1, num_games + 1):
+        white, black = scheduler.next_pairing()
+        seed_for_game = game_seed(seed, white, black, scheduler.white_games.get((white, black), 0))
+
+        result = None
+        journaled = journal.get(game_number) if journal is not None else None
+        if journaled is not None:
+            # replaying the journal drives the scheduler through the same choices it made before the restart
+            if journaled[:3] != (white, black, seed_for_game):
+                raise JournalMismatch("Game {} of {} does not match the resumed tournament".format(
+                    game_number, journal.path))
+            result = journaled[3:]
+            source = " (resumed)"
+        elif cache is not None:
+            result = cache.get(fingerprints[white], fingerprints[black], seed_for_game)
+            source = " (cached)"
+
+        if result is not None:
+            winner_color, winner_reason = result
+        else:
+            (white_name, white_constructor), (black_name, black_constructor) = bots.load(white), bots.load(black)
+            random.seed(seed_for_game)
+            winner_color, winner_reason = play_local_game(white_constructor(), black_constructor(),
+                                                          [white_name, black_name], gui=gui, game=game_factory(),
+                                                          verbosity=verbosity, archive=archive)
+            if cache is not None:
+                cache.put(fingerprints[white], fingerprints[black], seed_for_game, winner_color, winner_reason)
+            source = ""
+        if journaled is None and journal is not None:
+            journal.put(white, black, seed_for_game, winner_color, winner_reason)
+
+        if winner_color is None:
+            white_score = 0.5
+        else:
+            white_score = 1.0 if winner_color == chess.WHITE else 0.0
+
+        ratings.update(white, black, white_score)
+        scheduler.record(white, black)
+        print("Game {}: {} (WHITE) vs {} (BLACK) -- {}{}".format(game_number, white, black, winner_reason, source))
+
+    return ratings
+
+
+def print_standings(ratings, bot_paths):
+    standings = sorted(bot_paths, key=ratings.rating, reverse=True)
+    for rank, path in enumerate(standings, 1):
+        print("{:>3}. {:<40} {:>7.1f} +/- {:.1f}".format(rank, path, ratings.rating(path), ratings.uncertainty(path)))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Ranks many bots with incremental ratings and adaptive pairings.')
+    parser.add_argument('bot_paths', nargs='*', help='Paths to the bot source files.')
+    parser.add_argument('--bots-dir', default=None,
+                        help='Also rank every bot in this directory, scanned through a cached agent manifest.')
+    parser.add_argument('--manifest', default=None,
+                        help='The agent manifest of --bots-dir, .agent_manifest.json in the directory if unset.')
+    parser.add_argument('--games', type=int, default=100, help='Number of games to play.')
+    parser.add_argument('--rating', default='glicko', choices=['elo', 'glicko'], help='Rating system to use.')
+    parser.add_argument('--pairing', default='information', choices=['information', 'closest'],
+                        help='How to pick the next pairing.')
+    parser.add_argument('--max-plies', type=int, default=None,
+                        help='Adjudicate each game after this many plies.')
+    parser.add_argument('--no-progress-plies', type=int, default=None,
+                        help='Adjudicate each game after this many plies without a capture or pawn move.')
+    parser.add_argument('--material-margin', type=int, default=None,
+                        help='Material lead that wins a game adjudicated by one of the limits, otherwise it is a draw.')
+    parser.add_argument('--clock', default='wall', choices=['wall', 'thread', 'process'],
+                        help='Charge players wall time, or the CPU time of the game thread or process.')
+    parser.add_argument('--seed', type=int, default=0, help='Tournament seed every game seed is derived from.')
+    parser.add_argument('--cache', default=None,
+                        help='Result cache file, games between unchanged bots with the same seed are not replayed.')
+    parser.add_argument('--journal', default=None,
+                        help='Journal file of the run, restarting with the same file resumes the tournament.')
+    parser.add_argument('--verbosity', default='boards', choices=list(VERBOSITY_LEVELS),
+                        help='How much every game prints to the console.')
+    parser.add_argument('--history', default='boards', choices=list(VERBOSITY_LEVELS),
+                        help='How much every game writes to its RRGameHistory file, off writes no files.')
+    parser.add_argument('--archive', default=None,
+                        help='Write the history of all games to compressed segments in this directory.')
+    parser.add_argument('--compression', default='gzip', choices=['gzip', 'zstd'],
+                        help='Compression of the archive segments.')
+    parser.add_argument('--events', default=None,
+                        help='Write json lines events of all games to this file, - for the console.')
+    parser.add_argument('--events-verbosity', default='results', choices=list(VERBOSITY_LEVELS),
+                        help='How much to write to the events file.')
+    args = parser.parse_args()
+
+    registry = AgentRegistry(args.bots_dir, args.manifest) if args.bots_dir is not None else None
+    bot_paths = list(dict.fromkeys(args.bot_paths + (list(registry) if registry is not None else [])))
+    if len(bot_paths) < 2:
+        parser.error('A tournament needs at least two different bots.')
+
+    def game_factory():
+        return Game(max_plies=args.max_plies, no_progress_plies=args.no_progress_plies,
+                    material_margin=args.material_margin, clock=args.clock)
+
+    settings = {'max_plies': args.max_plies, 'no_progress_plies': args.no_progress_plies,
+                'material_margin': args.material_margin, 'clock': args.clock}
+    ratings = Elo() if args.rating == 'elo' else Glicko()
+    # cached results are only reused under the same game settings and time control
+    cache_settings = dict(settings, seconds_left=game_factory().time_left_color[chess.WHITE])
+    cache = ResultCache(args.cache, settings=cache_settings) if args.cache is not None else None
+    journal = TournamentJournal(args.journal) if args.journal is not None else None
+    archive = ArchiveWriter(args.archive, compression=args.compression) if args.archive is not None else None
+    events_file = None
+    if args.events is not None:
+        events_file = sys.stdout if args.events == '-' else open(args.events, 'a')
+    verbosity = Verbosity(console=VERBOSITY_LEVELS[args.verbosity], history=VERBOSITY_LEVELS[args.history],
+                          events=VERBOSITY_LEVELS[args.events_verbosity], events_file=events_file)
+    run_tournament(bot_paths, args.games, ratings, strategy=args.pairing, game_factory=game_factory, cache=cache,
+                   seed=args.seed, journal=journal, settings=settings, verbosity=verbosity, archive=archive,
+                   registry=registry)
+    if archive is not None:
+        archive.close()
+
+    print('Tournament Over!')
+    print_standings(ratings, bot_paths)